@@ -13,6 +13,14 @@ DATABASE_USER = 'openatlas'
 DATABASE_HOST = 'localhost'
 DATABASE_PORT = 5432
 DATABASE_PASS = 'CHANGE ME'
+DATABASE_FETCH_SIZE = 2000  # Rows fetched at once from server side cursors
+
+# Connection pool of each process
+DATABASE_POOL_MIN = 1  # Connections opened at start
+DATABASE_POOL_MAX = 20  # Further requests wait for a free connection
+DATABASE_POOL_TIMEOUT = 30  # Seconds to wait for a free connection
+DATABASE_POOL_CHECK = 60  # Seconds idle after which a connection is tested
+DATABASE_POOL_MAX_LIFETIME = 3600  # Seconds until a connection is replaced
 MAIL_PASSWORD = 'CHANGE ME'
 SECRET_KEY = 'CHANGE ME'  # Used for cookies
 
@@ -40,6 +48,16 @@ RESIZED_IMAGES = Path(PROCESSED_IMAGE_PATH) / 'resized'
 IMAGE_SIZE = {
     'thumbnail': '200',
     'table': '100'}
+IIIF_INFO_CACHE_SIZE = 10000  # Sizes of IIIF images kept in memory
+
+# Background jobs of worker.py
+JOB_PROCESSES = 2  # Files processed at once
+JOB_INTERVAL = 5  # Seconds to wait for jobs
+JOB_MAX_ATTEMPTS = 3  # Failed jobs are retried until this number of attempts
+
+# Import
+IMPORT_CHUNK_SIZE = 10000  # CSV rows read and checked at once
+IMPORT_PREVIEW_ROWS = 1000
 
 # Security
 SESSION_COOKIE_SECURE = False  # Should be True in production.py if using HTTPS
@@ -49,6 +67,9 @@ SESSION_COOKIE_SAMESITE = 'Lax'
 # Table options
 TABLE_ROWS = {10: '10', 25: '25', 50: '50', 100: '100'}
 
+# Maximum number of entities shown in ego networks
+EGO_NETWORK_MAX_NODES = 1000
+
 # Minimum required characters for table filters
 MIN_CHARS_JSTREE_SEARCH = 1
 
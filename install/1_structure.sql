@@ -28,9 +28,11 @@ ALTER TABLE IF EXISTS ONLY web.reference_system DROP CONSTRAINT IF EXISTS refere
 ALTER TABLE IF EXISTS ONLY web.map_overlay DROP CONSTRAINT IF EXISTS map_overlay_place_id_fkey;
 ALTER TABLE IF EXISTS ONLY web.map_overlay DROP CONSTRAINT IF EXISTS map_overlay_link_id_fkey;
 ALTER TABLE IF EXISTS ONLY web.map_overlay DROP CONSTRAINT IF EXISTS map_overlay_image_id_fkey;
+ALTER TABLE IF EXISTS ONLY web.job DROP CONSTRAINT IF EXISTS job_entity_id_fkey;
 ALTER TABLE IF EXISTS ONLY web.hierarchy_openatlas_class DROP CONSTRAINT IF EXISTS hierarchy_openatlas_class_openatlas_class_name_fkey;
 ALTER TABLE IF EXISTS ONLY web.hierarchy DROP CONSTRAINT IF EXISTS hierarchy_id_fkey;
 ALTER TABLE IF EXISTS ONLY web.hierarchy_openatlas_class DROP CONSTRAINT IF EXISTS hierarchy_form_hierarchy_id_fkey;
+ALTER TABLE IF EXISTS ONLY web.file_info DROP CONSTRAINT IF EXISTS file_info_entity_id_fkey;
 ALTER TABLE IF EXISTS ONLY web.entity_profile_image DROP CONSTRAINT IF EXISTS entity_profile_image_image_id_fkey;
 ALTER TABLE IF EXISTS ONLY web.entity_profile_image DROP CONSTRAINT IF EXISTS entity_profile_image_entity_id_fkey;
 ALTER TABLE IF EXISTS ONLY web.annotation_image DROP CONSTRAINT IF EXISTS annotation_image_user_id_fkey;
@@ -44,6 +46,7 @@ ALTER TABLE IF EXISTS ONLY model.property DROP CONSTRAINT IF EXISTS property_dom
 ALTER TABLE IF EXISTS ONLY model.openatlas_class DROP CONSTRAINT IF EXISTS openatlas_class_write_access_group_name_fkey;
 ALTER TABLE IF EXISTS ONLY model.openatlas_class DROP CONSTRAINT IF EXISTS openatlas_class_standard_type_id_fkey;
 ALTER TABLE IF EXISTS ONLY model.openatlas_class DROP CONSTRAINT IF EXISTS openatlas_class_cidoc_class_code_fkey;
+ALTER TABLE IF EXISTS ONLY model.type_count DROP CONSTRAINT IF EXISTS type_count_type_id_fkey;
 ALTER TABLE IF EXISTS ONLY model.link DROP CONSTRAINT IF EXISTS link_type_id_fkey;
 ALTER TABLE IF EXISTS ONLY model.link DROP CONSTRAINT IF EXISTS link_range_id_fkey;
 ALTER TABLE IF EXISTS ONLY model.link DROP CONSTRAINT IF EXISTS link_property_code_fkey;
@@ -57,21 +60,49 @@ ALTER TABLE IF EXISTS ONLY model.cidoc_class_i18n DROP CONSTRAINT IF EXISTS clas
 ALTER TABLE IF EXISTS ONLY import.entity DROP CONSTRAINT IF EXISTS entity_user_id_fkey;
 ALTER TABLE IF EXISTS ONLY import.entity DROP CONSTRAINT IF EXISTS entity_project_id_fkey;
 ALTER TABLE IF EXISTS ONLY import.entity DROP CONSTRAINT IF EXISTS entity_entity_id_fkey;
+DROP TRIGGER IF EXISTS update_registry_version ON web.settings;
+DROP TRIGGER IF EXISTS update_registry_version ON web.reference_system_openatlas_class;
+DROP TRIGGER IF EXISTS update_registry_version ON web.reference_system;
+DROP TRIGGER IF EXISTS update_registry_version ON web.hierarchy_openatlas_class;
+DROP TRIGGER IF EXISTS update_registry_version ON web.hierarchy;
+DROP TRIGGER IF EXISTS update_registry_version ON model.openatlas_class;
+DROP TRIGGER IF EXISTS update_type_count ON model.link;
+DROP TRIGGER IF EXISTS update_registry_version ON model.link;
+DROP TRIGGER IF EXISTS update_registry_version_delete ON model.entity;
+DROP TRIGGER IF EXISTS update_registry_version ON model.entity;
 DROP TRIGGER IF EXISTS update_modified ON web.user_settings;
 DROP TRIGGER IF EXISTS update_modified ON web.user_notes;
 DROP TRIGGER IF EXISTS update_modified ON web.user_bookmarks;
 DROP TRIGGER IF EXISTS update_modified ON web."user";
 DROP TRIGGER IF EXISTS update_modified ON web.reference_system;
 DROP TRIGGER IF EXISTS update_modified ON web.map_overlay;
+DROP TRIGGER IF EXISTS update_modified ON web.job;
 DROP TRIGGER IF EXISTS update_modified ON web.i18n;
 DROP TRIGGER IF EXISTS update_modified ON web.hierarchy_openatlas_class;
 DROP TRIGGER IF EXISTS update_modified ON web.hierarchy;
 DROP TRIGGER IF EXISTS update_modified ON web."group";
 DROP TRIGGER IF EXISTS update_modified ON model.link;
+DROP TRIGGER IF EXISTS delete_gis_layer ON model.link;
 DROP TRIGGER IF EXISTS update_modified ON model.gis;
+DROP TRIGGER IF EXISTS delete_gis_layer ON model.gis;
 DROP TRIGGER IF EXISTS update_modified ON model.entity;
 DROP TRIGGER IF EXISTS on_delete_entity ON model.entity;
+DROP TRIGGER IF EXISTS delete_gis_layer ON model.entity;
 DROP TRIGGER IF EXISTS update_modified ON import.project;
+DROP INDEX IF EXISTS web.user_log_entity_id_idx;
+DROP INDEX IF EXISTS web.job_status_idx;
+DROP INDEX IF EXISTS model.link_type_id_idx;
+DROP INDEX IF EXISTS model.link_range_id_property_code_idx;
+DROP INDEX IF EXISTS model.link_property_code_idx;
+DROP INDEX IF EXISTS model.link_domain_id_property_code_idx;
+DROP INDEX IF EXISTS model.gis_geom_polygon_idx;
+DROP INDEX IF EXISTS model.gis_geom_point_idx;
+DROP INDEX IF EXISTS model.gis_geom_linestring_idx;
+DROP INDEX IF EXISTS model.gis_entity_id_idx;
+DROP INDEX IF EXISTS model.entity_openatlas_class_name_idx;
+DROP INDEX IF EXISTS model.entity_name_trgm_idx;
+DROP INDEX IF EXISTS model.entity_cidoc_class_code_idx;
+DROP INDEX IF EXISTS import.entity_entity_id_idx;
 ALTER TABLE IF EXISTS ONLY web."user" DROP CONSTRAINT IF EXISTS user_username_key;
 ALTER TABLE IF EXISTS ONLY web.user_settings DROP CONSTRAINT IF EXISTS user_settings_user_id_name_key;
 ALTER TABLE IF EXISTS ONLY web.user_settings DROP CONSTRAINT IF EXISTS user_settings_pkey;
@@ -84,6 +115,7 @@ ALTER TABLE IF EXISTS ONLY web.user_bookmarks DROP CONSTRAINT IF EXISTS user_boo
 ALTER TABLE IF EXISTS ONLY web."user" DROP CONSTRAINT IF EXISTS unsubscribe_code_key;
 ALTER TABLE IF EXISTS ONLY web.settings DROP CONSTRAINT IF EXISTS settings_pkey;
 ALTER TABLE IF EXISTS ONLY web.settings DROP CONSTRAINT IF EXISTS settings_name_key;
+ALTER TABLE IF EXISTS ONLY web.registry_version DROP CONSTRAINT IF EXISTS registry_version_pkey;
 ALTER TABLE IF EXISTS ONLY web.reference_system DROP CONSTRAINT IF EXISTS reference_system_pkey;
 ALTER TABLE IF EXISTS ONLY web.reference_system_openatlas_class DROP CONSTRAINT IF EXISTS reference_system_openatlas_class_system_id_class_name_key;
 ALTER TABLE IF EXISTS ONLY web.reference_system DROP CONSTRAINT IF EXISTS reference_system_name_key;
@@ -91,6 +123,7 @@ ALTER TABLE IF EXISTS ONLY web.reference_system_openatlas_class DROP CONSTRAINT
 ALTER TABLE IF EXISTS ONLY web.map_overlay DROP CONSTRAINT IF EXISTS map_overlay_pkey;
 ALTER TABLE IF EXISTS ONLY web.map_overlay DROP CONSTRAINT IF EXISTS map_overlay_image_id_place_id_key;
 ALTER TABLE IF EXISTS ONLY web.system_log DROP CONSTRAINT IF EXISTS log_pkey;
+ALTER TABLE IF EXISTS ONLY web.job DROP CONSTRAINT IF EXISTS job_pkey;
 ALTER TABLE IF EXISTS ONLY web.i18n DROP CONSTRAINT IF EXISTS i18n_pkey;
 ALTER TABLE IF EXISTS ONLY web.i18n DROP CONSTRAINT IF EXISTS i18n_name_language_key;
 ALTER TABLE IF EXISTS ONLY web.hierarchy DROP CONSTRAINT IF EXISTS hierarchy_pkey;
@@ -98,10 +131,13 @@ ALTER TABLE IF EXISTS ONLY web.hierarchy_openatlas_class DROP CONSTRAINT IF EXIS
 ALTER TABLE IF EXISTS ONLY web.hierarchy DROP CONSTRAINT IF EXISTS hierarchy_name_key;
 ALTER TABLE IF EXISTS ONLY web.hierarchy_openatlas_class DROP CONSTRAINT IF EXISTS hierarchy_form_pkey;
 ALTER TABLE IF EXISTS ONLY web."group" DROP CONSTRAINT IF EXISTS group_pkey;
+ALTER TABLE IF EXISTS ONLY web.gis_layer DROP CONSTRAINT IF EXISTS gis_layer_pkey;
+ALTER TABLE IF EXISTS ONLY web.file_info DROP CONSTRAINT IF EXISTS file_info_pkey;
 ALTER TABLE IF EXISTS ONLY web."group" DROP CONSTRAINT IF EXISTS group_name_key;
 ALTER TABLE IF EXISTS ONLY web.entity_profile_image DROP CONSTRAINT IF EXISTS entity_profile_image_pkey;
 ALTER TABLE IF EXISTS ONLY web.entity_profile_image DROP CONSTRAINT IF EXISTS entity_profile_image_entity_id_key;
 ALTER TABLE IF EXISTS ONLY web.annotation_image DROP CONSTRAINT IF EXISTS annotation_image_pkey;
+ALTER TABLE IF EXISTS ONLY model.type_count DROP CONSTRAINT IF EXISTS type_count_pkey;
 ALTER TABLE IF EXISTS ONLY model.property DROP CONSTRAINT IF EXISTS property_pkey;
 ALTER TABLE IF EXISTS ONLY model.property_inheritance DROP CONSTRAINT IF EXISTS property_inheritance_pkey;
 ALTER TABLE IF EXISTS ONLY model.property_i18n DROP CONSTRAINT IF EXISTS property_i18n_property_code_language_code_key;
@@ -169,6 +205,7 @@ DROP SEQUENCE IF EXISTS web.map_overlay_id_seq;
 DROP TABLE IF EXISTS web.map_overlay;
 DROP SEQUENCE IF EXISTS web.log_id_seq;
 DROP TABLE IF EXISTS web.system_log;
+DROP TABLE IF EXISTS web.job;
 DROP SEQUENCE IF EXISTS web.i18n_id_seq;
 DROP TABLE IF EXISTS web.i18n;
 DROP SEQUENCE IF EXISTS web.hierarchy_id_seq;
@@ -177,10 +214,14 @@ DROP TABLE IF EXISTS web.hierarchy_openatlas_class;
 DROP TABLE IF EXISTS web.hierarchy;
 DROP SEQUENCE IF EXISTS web.group_id_seq;
 DROP TABLE IF EXISTS web."group";
+DROP TABLE IF EXISTS web.registry_version;
+DROP TABLE IF EXISTS web.gis_layer;
+DROP TABLE IF EXISTS web.file_info;
 DROP SEQUENCE IF EXISTS web.entity_profile_image_id_seq;
 DROP TABLE IF EXISTS web.entity_profile_image;
 DROP SEQUENCE IF EXISTS web.annotation_image_id_seq;
 DROP TABLE IF EXISTS web.annotation_image;
+DROP TABLE IF EXISTS model.type_count;
 DROP SEQUENCE IF EXISTS model.property_inheritance_id_seq;
 DROP TABLE IF EXISTS model.property_inheritance;
 DROP SEQUENCE IF EXISTS model.property_id_seq;
@@ -205,7 +246,13 @@ DROP SEQUENCE IF EXISTS import.project_id_seq;
 DROP TABLE IF EXISTS import.project;
 DROP SEQUENCE IF EXISTS import.entity_id_seq;
 DROP TABLE IF EXISTS import.entity;
+DROP FUNCTION IF EXISTS model.update_type_count();
+DROP FUNCTION IF EXISTS model.update_registry_version_link();
+DROP FUNCTION IF EXISTS model.update_registry_version();
 DROP FUNCTION IF EXISTS model.update_modified();
+DROP FUNCTION IF EXISTS model.unaccent_lower(text);
+DROP FUNCTION IF EXISTS model.delete_gis_layer_link();
+DROP FUNCTION IF EXISTS model.delete_gis_layer();
 DROP FUNCTION IF EXISTS model.delete_entity_related();
 DROP SCHEMA IF EXISTS web;
 DROP SCHEMA IF EXISTS model;
@@ -289,6 +336,68 @@ CREATE FUNCTION model.delete_entity_related() RETURNS trigger
 
 ALTER FUNCTION model.delete_entity_related() OWNER TO openatlas;
 
+--
+-- Name: delete_gis_layer(); Type: FUNCTION; Schema: model; Owner: openatlas
+--
+
+CREATE FUNCTION model.delete_gis_layer() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+        BEGIN
+            -- Shared lock, held until commit, to wait for running rebuilds
+            PERFORM pg_advisory_xact_lock_shared('web.gis_layer'::regclass::bigint);
+            DELETE FROM web.gis_layer;
+            RETURN NULL;
+        END;
+    $$;
+
+
+ALTER FUNCTION model.delete_gis_layer() OWNER TO openatlas;
+
+--
+-- Name: delete_gis_layer_link(); Type: FUNCTION; Schema: model; Owner: openatlas
+--
+
+CREATE FUNCTION model.delete_gis_layer_link() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+        DECLARE
+            link_ RECORD;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                link_ = OLD;
+            ELSE
+                link_ = NEW;
+            END IF;
+
+            -- Locations and types of places
+            IF link_.property_code IN ('P2', 'P53') AND EXISTS (
+                    SELECT 1 FROM model.entity
+                    WHERE id = link_.domain_id
+                        AND openatlas_class_name = 'place') THEN
+                PERFORM pg_advisory_xact_lock_shared('web.gis_layer'::regclass::bigint);
+                DELETE FROM web.gis_layer;
+            END IF;
+            RETURN NULL;
+        END;
+    $$;
+
+
+ALTER FUNCTION model.delete_gis_layer_link() OWNER TO openatlas;
+
+--
+-- Name: unaccent_lower(text); Type: FUNCTION; Schema: model; Owner: openatlas
+--
+
+CREATE FUNCTION model.unaccent_lower(text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    AS $_$
+        SELECT public.unaccent('public.unaccent'::regdictionary, lower($1));
+    $_$;
+
+
+ALTER FUNCTION model.unaccent_lower(text) OWNER TO openatlas;
+
 --
 -- Name: update_modified(); Type: FUNCTION; Schema: model; Owner: openatlas
 --
@@ -309,6 +418,86 @@ $$;
 
 ALTER FUNCTION model.update_modified() OWNER TO openatlas;
 
+--
+-- Name: update_registry_version(); Type: FUNCTION; Schema: model; Owner: openatlas
+--
+
+CREATE FUNCTION model.update_registry_version() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+        BEGIN
+            UPDATE web.registry_version SET version = clock_timestamp();
+            RETURN NULL;
+        END;
+    $$;
+
+
+ALTER FUNCTION model.update_registry_version() OWNER TO openatlas;
+
+--
+-- Name: update_registry_version_link(); Type: FUNCTION; Schema: model; Owner: openatlas
+--
+
+CREATE FUNCTION model.update_registry_version_link() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+        DECLARE
+            link_ RECORD;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                link_ = OLD;
+            ELSE
+                link_ = NEW;
+            END IF;
+
+            -- Type hierarchies and reference system precisions
+            IF link_.property_code IN ('P2', 'P89', 'P127') AND EXISTS (
+                    SELECT 1 FROM model.entity
+                    WHERE id = link_.domain_id
+                        AND openatlas_class_name IN ('administrative_unit', 'reference_system', 'type', 'type_tools')) THEN
+                UPDATE web.registry_version SET version = clock_timestamp();
+            END IF;
+            RETURN NULL;
+        END;
+    $$;
+
+
+ALTER FUNCTION model.update_registry_version_link() OWNER TO openatlas;
+
+--
+-- Name: update_type_count(); Type: FUNCTION; Schema: model; Owner: openatlas
+--
+
+CREATE FUNCTION model.update_type_count() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+        BEGIN
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                IF OLD.property_code IN ('P2', 'P89') THEN
+                    UPDATE model.type_count SET count = count - 1 WHERE type_id = OLD.range_id;
+                END IF;
+                IF OLD.type_id IS NOT NULL THEN
+                    UPDATE model.type_count SET count_property = count_property - 1 WHERE type_id = OLD.type_id;
+                END IF;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                IF NEW.property_code IN ('P2', 'P89') THEN
+                    INSERT INTO model.type_count (type_id, count) VALUES (NEW.range_id, 1)
+                    ON CONFLICT (type_id) DO UPDATE SET count = model.type_count.count + 1;
+                END IF;
+                IF NEW.type_id IS NOT NULL THEN
+                    INSERT INTO model.type_count (type_id, count_property) VALUES (NEW.type_id, 1)
+                    ON CONFLICT (type_id) DO UPDATE SET count_property = model.type_count.count_property + 1;
+                END IF;
+            END IF;
+            RETURN NULL;
+        END;
+    $$;
+
+
+ALTER FUNCTION model.update_type_count() OWNER TO openatlas;
+
 SET default_tablespace = '';
 
 SET default_table_access_method = heap;
@@ -807,6 +996,26 @@ ALTER TABLE model.property_inheritance_id_seq OWNER TO openatlas;
 ALTER SEQUENCE model.property_inheritance_id_seq OWNED BY model.property_inheritance.id;
 
 
+--
+-- Name: type_count; Type: TABLE; Schema: model; Owner: openatlas
+--
+
+CREATE TABLE model.type_count (
+    type_id integer NOT NULL,
+    count integer DEFAULT 0 NOT NULL,
+    count_property integer DEFAULT 0 NOT NULL
+);
+
+
+ALTER TABLE model.type_count OWNER TO openatlas;
+
+--
+-- Name: TABLE type_count; Type: COMMENT; Schema: model; Owner: openatlas
+--
+
+COMMENT ON TABLE model.type_count IS 'Usage counts of types, maintained by a trigger on model.link';
+
+
 --
 -- Name: annotation_image; Type: TABLE; Schema: web; Owner: openatlas
 --
@@ -880,6 +1089,57 @@ ALTER TABLE web.entity_profile_image_id_seq OWNER TO openatlas;
 ALTER SEQUENCE web.entity_profile_image_id_seq OWNED BY web.entity_profile_image.id;
 
 
+--
+-- Name: file_info; Type: TABLE; Schema: web; Owner: openatlas
+--
+
+CREATE TABLE web.file_info (
+    entity_id integer NOT NULL,
+    extension text NOT NULL,
+    size bigint NOT NULL,
+    created timestamp without time zone NOT NULL,
+    modified timestamp without time zone NOT NULL,
+    variants text[] DEFAULT '{}'::text[] NOT NULL
+);
+
+
+ALTER TABLE web.file_info OWNER TO openatlas;
+
+--
+-- Name: TABLE file_info; Type: COMMENT; Schema: web; Owner: openatlas
+--
+
+COMMENT ON TABLE web.file_info IS 'Uploaded files of file entities, maintained at upload and deletion to avoid scanning the upload directory';
+
+
+--
+-- Name: COLUMN file_info.variants; Type: COMMENT; Schema: web; Owner: openatlas
+--
+
+COMMENT ON COLUMN web.file_info.variants IS 'sizes of resized images which were created';
+
+
+--
+-- Name: gis_layer; Type: TABLE; Schema: web; Owner: openatlas
+--
+
+CREATE TABLE web.gis_layer (
+    name text NOT NULL,
+    geojson text NOT NULL,
+    count integer NOT NULL,
+    created timestamp without time zone DEFAULT now() NOT NULL
+);
+
+
+ALTER TABLE web.gis_layer OWNER TO openatlas;
+
+--
+-- Name: TABLE gis_layer; Type: COMMENT; Schema: web; Owner: openatlas
+--
+
+COMMENT ON TABLE web.gis_layer IS 'GeoJSON of all places by shape, deleted by triggers if geometries, places or types change';
+
+
 --
 -- Name: group; Type: TABLE; Schema: web; Owner: openatlas
 --
@@ -1079,6 +1339,30 @@ ALTER TABLE web.log_id_seq OWNER TO openatlas;
 ALTER SEQUENCE web.log_id_seq OWNED BY web.system_log.id;
 
 
+--
+-- Name: job; Type: TABLE; Schema: web; Owner: openatlas
+--
+
+CREATE TABLE web.job (
+    name text NOT NULL,
+    entity_id integer NOT NULL,
+    status text DEFAULT 'pending'::text NOT NULL,
+    attempts integer DEFAULT 0 NOT NULL,
+    error text,
+    created timestamp without time zone DEFAULT now() NOT NULL,
+    modified timestamp without time zone
+);
+
+
+ALTER TABLE web.job OWNER TO openatlas;
+
+--
+-- Name: TABLE job; Type: COMMENT; Schema: web; Owner: openatlas
+--
+
+COMMENT ON TABLE web.job IS 'Background jobs for files like IIIF conversion and image resizing, processed by the worker';
+
+
 --
 -- Name: map_overlay; Type: TABLE; Schema: web; Owner: openatlas
 --
@@ -1183,6 +1467,26 @@ ALTER TABLE web.reference_system_form_id_seq OWNER TO openatlas;
 ALTER SEQUENCE web.reference_system_form_id_seq OWNED BY web.reference_system_openatlas_class.id;
 
 
+--
+-- Name: registry_version; Type: TABLE; Schema: web; Owner: openatlas
+--
+
+CREATE TABLE web.registry_version (
+    id integer DEFAULT 1 NOT NULL,
+    version timestamp without time zone DEFAULT clock_timestamp() NOT NULL,
+    CONSTRAINT registry_version_single_row CHECK ((id = 1))
+);
+
+
+ALTER TABLE web.registry_version OWNER TO openatlas;
+
+--
+-- Name: TABLE registry_version; Type: COMMENT; Schema: web; Owner: openatlas
+--
+
+COMMENT ON TABLE web.registry_version IS 'Raised by triggers if types, hierarchies, settings or reference systems change, used to invalidate application caches';
+
+
 --
 -- Name: settings; Type: TABLE; Schema: web; Owner: openatlas
 --
@@ -1760,6 +2064,14 @@ ALTER TABLE ONLY model.property_inheritance
     ADD CONSTRAINT property_inheritance_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: type_count type_count_pkey; Type: CONSTRAINT; Schema: model; Owner: openatlas
+--
+
+ALTER TABLE ONLY model.type_count
+    ADD CONSTRAINT type_count_pkey PRIMARY KEY (type_id);
+
+
 --
 -- Name: property property_pkey; Type: CONSTRAINT; Schema: model; Owner: openatlas
 --
@@ -1792,6 +2104,22 @@ ALTER TABLE ONLY web.entity_profile_image
     ADD CONSTRAINT entity_profile_image_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: file_info file_info_pkey; Type: CONSTRAINT; Schema: web; Owner: openatlas
+--
+
+ALTER TABLE ONLY web.file_info
+    ADD CONSTRAINT file_info_pkey PRIMARY KEY (entity_id);
+
+
+--
+-- Name: gis_layer gis_layer_pkey; Type: CONSTRAINT; Schema: web; Owner: openatlas
+--
+
+ALTER TABLE ONLY web.gis_layer
+    ADD CONSTRAINT gis_layer_pkey PRIMARY KEY (name);
+
+
 --
 -- Name: group group_name_key; Type: CONSTRAINT; Schema: web; Owner: openatlas
 --
@@ -1864,6 +2192,14 @@ ALTER TABLE ONLY web.system_log
     ADD CONSTRAINT log_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: job job_pkey; Type: CONSTRAINT; Schema: web; Owner: openatlas
+--
+
+ALTER TABLE ONLY web.job
+    ADD CONSTRAINT job_pkey PRIMARY KEY (name, entity_id);
+
+
 --
 -- Name: map_overlay map_overlay_image_id_place_id_key; Type: CONSTRAINT; Schema: web; Owner: openatlas
 --
@@ -1912,6 +2248,14 @@ ALTER TABLE ONLY web.reference_system
     ADD CONSTRAINT reference_system_pkey PRIMARY KEY (entity_id);
 
 
+--
+-- Name: registry_version registry_version_pkey; Type: CONSTRAINT; Schema: web; Owner: openatlas
+--
+
+ALTER TABLE ONLY web.registry_version
+    ADD CONSTRAINT registry_version_pkey PRIMARY KEY (id);
+
+
 --
 -- Name: settings settings_name_key; Type: CONSTRAINT; Schema: web; Owner: openatlas
 --
@@ -2008,6 +2352,104 @@ ALTER TABLE ONLY web."user"
     ADD CONSTRAINT user_username_key UNIQUE (username);
 
 
+--
+-- Name: entity_entity_id_idx; Type: INDEX; Schema: import; Owner: openatlas
+--
+
+CREATE INDEX entity_entity_id_idx ON import.entity USING btree (entity_id);
+
+
+--
+-- Name: entity_cidoc_class_code_idx; Type: INDEX; Schema: model; Owner: openatlas
+--
+
+CREATE INDEX entity_cidoc_class_code_idx ON model.entity USING btree (cidoc_class_code);
+
+
+--
+-- Name: entity_name_trgm_idx; Type: INDEX; Schema: model; Owner: openatlas
+--
+
+CREATE INDEX entity_name_trgm_idx ON model.entity USING gin (model.unaccent_lower(name) public.gin_trgm_ops);
+
+
+--
+-- Name: entity_openatlas_class_name_idx; Type: INDEX; Schema: model; Owner: openatlas
+--
+
+CREATE INDEX entity_openatlas_class_name_idx ON model.entity USING btree (openatlas_class_name, lower(name));
+
+
+--
+-- Name: gis_entity_id_idx; Type: INDEX; Schema: model; Owner: openatlas
+--
+
+CREATE INDEX gis_entity_id_idx ON model.gis USING btree (entity_id);
+
+
+--
+-- Name: gis_geom_linestring_idx; Type: INDEX; Schema: model; Owner: openatlas
+--
+
+CREATE INDEX gis_geom_linestring_idx ON model.gis USING gist (geom_linestring);
+
+
+--
+-- Name: gis_geom_point_idx; Type: INDEX; Schema: model; Owner: openatlas
+--
+
+CREATE INDEX gis_geom_point_idx ON model.gis USING gist (geom_point);
+
+
+--
+-- Name: gis_geom_polygon_idx; Type: INDEX; Schema: model; Owner: openatlas
+--
+
+CREATE INDEX gis_geom_polygon_idx ON model.gis USING gist (geom_polygon);
+
+
+--
+-- Name: link_domain_id_property_code_idx; Type: INDEX; Schema: model; Owner: openatlas
+--
+
+CREATE INDEX link_domain_id_property_code_idx ON model.link USING btree (domain_id, property_code);
+
+
+--
+-- Name: link_property_code_idx; Type: INDEX; Schema: model; Owner: openatlas
+--
+
+CREATE INDEX link_property_code_idx ON model.link USING btree (property_code);
+
+
+--
+-- Name: link_range_id_property_code_idx; Type: INDEX; Schema: model; Owner: openatlas
+--
+
+CREATE INDEX link_range_id_property_code_idx ON model.link USING btree (range_id, property_code);
+
+
+--
+-- Name: link_type_id_idx; Type: INDEX; Schema: model; Owner: openatlas
+--
+
+CREATE INDEX link_type_id_idx ON model.link USING btree (type_id) WHERE (type_id IS NOT NULL);
+
+
+--
+-- Name: job_status_idx; Type: INDEX; Schema: web; Owner: openatlas
+--
+
+CREATE INDEX job_status_idx ON web.job USING btree (status, created);
+
+
+--
+-- Name: user_log_entity_id_idx; Type: INDEX; Schema: web; Owner: openatlas
+--
+
+CREATE INDEX user_log_entity_id_idx ON web.user_log USING btree (entity_id);
+
+
 --
 -- Name: project update_modified; Type: TRIGGER; Schema: import; Owner: openatlas
 --
@@ -2015,6 +2457,13 @@ ALTER TABLE ONLY web."user"
 CREATE TRIGGER update_modified BEFORE UPDATE ON import.project FOR EACH ROW EXECUTE FUNCTION model.update_modified();
 
 
+--
+-- Name: entity delete_gis_layer; Type: TRIGGER; Schema: model; Owner: openatlas
+--
+
+CREATE TRIGGER delete_gis_layer AFTER DELETE OR UPDATE ON model.entity FOR EACH ROW WHEN ((old.openatlas_class_name = ANY (ARRAY['place'::text, 'type'::text]))) EXECUTE FUNCTION model.delete_gis_layer();
+
+
 --
 -- Name: entity on_delete_entity; Type: TRIGGER; Schema: model; Owner: openatlas
 --
@@ -2029,6 +2478,27 @@ CREATE TRIGGER on_delete_entity BEFORE DELETE ON model.entity FOR EACH ROW EXECU
 CREATE TRIGGER update_modified BEFORE UPDATE ON model.entity FOR EACH ROW EXECUTE FUNCTION model.update_modified();
 
 
+--
+-- Name: entity update_registry_version; Type: TRIGGER; Schema: model; Owner: openatlas
+--
+
+CREATE TRIGGER update_registry_version AFTER INSERT OR UPDATE ON model.entity FOR EACH ROW WHEN ((new.openatlas_class_name = ANY (ARRAY['administrative_unit'::text, 'reference_system'::text, 'type'::text, 'type_tools'::text]))) EXECUTE FUNCTION model.update_registry_version();
+
+
+--
+-- Name: entity update_registry_version_delete; Type: TRIGGER; Schema: model; Owner: openatlas
+--
+
+CREATE TRIGGER update_registry_version_delete AFTER DELETE ON model.entity FOR EACH ROW WHEN ((old.openatlas_class_name = ANY (ARRAY['administrative_unit'::text, 'reference_system'::text, 'type'::text, 'type_tools'::text]))) EXECUTE FUNCTION model.update_registry_version();
+
+
+--
+-- Name: gis delete_gis_layer; Type: TRIGGER; Schema: model; Owner: openatlas
+--
+
+CREATE TRIGGER delete_gis_layer AFTER INSERT OR DELETE OR UPDATE ON model.gis FOR EACH STATEMENT EXECUTE FUNCTION model.delete_gis_layer();
+
+
 --
 -- Name: gis update_modified; Type: TRIGGER; Schema: model; Owner: openatlas
 --
@@ -2036,6 +2506,13 @@ CREATE TRIGGER update_modified BEFORE UPDATE ON model.entity FOR EACH ROW EXECUT
 CREATE TRIGGER update_modified BEFORE UPDATE ON model.gis FOR EACH ROW EXECUTE FUNCTION model.update_modified();
 
 
+--
+-- Name: link delete_gis_layer; Type: TRIGGER; Schema: model; Owner: openatlas
+--
+
+CREATE TRIGGER delete_gis_layer AFTER INSERT OR DELETE OR UPDATE ON model.link FOR EACH ROW EXECUTE FUNCTION model.delete_gis_layer_link();
+
+
 --
 -- Name: link update_modified; Type: TRIGGER; Schema: model; Owner: openatlas
 --
@@ -2043,6 +2520,27 @@ CREATE TRIGGER update_modified BEFORE UPDATE ON model.gis FOR EACH ROW EXECUTE F
 CREATE TRIGGER update_modified BEFORE UPDATE ON model.link FOR EACH ROW EXECUTE FUNCTION model.update_modified();
 
 
+--
+-- Name: link update_registry_version; Type: TRIGGER; Schema: model; Owner: openatlas
+--
+
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON model.link FOR EACH ROW EXECUTE FUNCTION model.update_registry_version_link();
+
+
+--
+-- Name: link update_type_count; Type: TRIGGER; Schema: model; Owner: openatlas
+--
+
+CREATE TRIGGER update_type_count AFTER INSERT OR DELETE OR UPDATE OF property_code, range_id, type_id ON model.link FOR EACH ROW EXECUTE FUNCTION model.update_type_count();
+
+
+--
+-- Name: openatlas_class update_registry_version; Type: TRIGGER; Schema: model; Owner: openatlas
+--
+
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON model.openatlas_class FOR EACH STATEMENT EXECUTE FUNCTION model.update_registry_version();
+
+
 --
 -- Name: group update_modified; Type: TRIGGER; Schema: web; Owner: openatlas
 --
@@ -2064,6 +2562,20 @@ CREATE TRIGGER update_modified BEFORE UPDATE ON web.hierarchy FOR EACH ROW EXECU
 CREATE TRIGGER update_modified BEFORE UPDATE ON web.hierarchy_openatlas_class FOR EACH ROW EXECUTE FUNCTION model.update_modified();
 
 
+--
+-- Name: hierarchy update_registry_version; Type: TRIGGER; Schema: web; Owner: openatlas
+--
+
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON web.hierarchy FOR EACH STATEMENT EXECUTE FUNCTION model.update_registry_version();
+
+
+--
+-- Name: hierarchy_openatlas_class update_registry_version; Type: TRIGGER; Schema: web; Owner: openatlas
+--
+
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON web.hierarchy_openatlas_class FOR EACH STATEMENT EXECUTE FUNCTION model.update_registry_version();
+
+
 --
 -- Name: i18n update_modified; Type: TRIGGER; Schema: web; Owner: openatlas
 --
@@ -2071,6 +2583,13 @@ CREATE TRIGGER update_modified BEFORE UPDATE ON web.hierarchy_openatlas_class FO
 CREATE TRIGGER update_modified BEFORE UPDATE ON web.i18n FOR EACH ROW EXECUTE FUNCTION model.update_modified();
 
 
+--
+-- Name: job update_modified; Type: TRIGGER; Schema: web; Owner: openatlas
+--
+
+CREATE TRIGGER update_modified BEFORE UPDATE ON web.job FOR EACH ROW EXECUTE FUNCTION model.update_modified();
+
+
 --
 -- Name: map_overlay update_modified; Type: TRIGGER; Schema: web; Owner: openatlas
 --
@@ -2085,6 +2604,27 @@ CREATE TRIGGER update_modified BEFORE UPDATE ON web.map_overlay FOR EACH ROW EXE
 CREATE TRIGGER update_modified BEFORE UPDATE ON web.reference_system FOR EACH ROW EXECUTE FUNCTION model.update_modified();
 
 
+--
+-- Name: reference_system update_registry_version; Type: TRIGGER; Schema: web; Owner: openatlas
+--
+
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON web.reference_system FOR EACH STATEMENT EXECUTE FUNCTION model.update_registry_version();
+
+
+--
+-- Name: reference_system_openatlas_class update_registry_version; Type: TRIGGER; Schema: web; Owner: openatlas
+--
+
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON web.reference_system_openatlas_class FOR EACH STATEMENT EXECUTE FUNCTION model.update_registry_version();
+
+
+--
+-- Name: settings update_registry_version; Type: TRIGGER; Schema: web; Owner: openatlas
+--
+
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON web.settings FOR EACH STATEMENT EXECUTE FUNCTION model.update_registry_version();
+
+
 --
 -- Name: user update_modified; Type: TRIGGER; Schema: web; Owner: openatlas
 --
@@ -2281,6 +2821,14 @@ ALTER TABLE ONLY model.property
     ADD CONSTRAINT property_range_class_code_fkey FOREIGN KEY (range_class_code) REFERENCES model.cidoc_class(code) ON UPDATE CASCADE ON DELETE CASCADE;
 
 
+--
+-- Name: type_count type_count_type_id_fkey; Type: FK CONSTRAINT; Schema: model; Owner: openatlas
+--
+
+ALTER TABLE ONLY model.type_count
+    ADD CONSTRAINT type_count_type_id_fkey FOREIGN KEY (type_id) REFERENCES model.entity(id) ON UPDATE CASCADE ON DELETE CASCADE;
+
+
 --
 -- Name: annotation_image annotation_image_entity_id_fkey; Type: FK CONSTRAINT; Schema: web; Owner: openatlas
 --
@@ -2321,6 +2869,14 @@ ALTER TABLE ONLY web.entity_profile_image
     ADD CONSTRAINT entity_profile_image_image_id_fkey FOREIGN KEY (image_id) REFERENCES model.entity(id) ON UPDATE CASCADE ON DELETE CASCADE;
 
 
+--
+-- Name: file_info file_info_entity_id_fkey; Type: FK CONSTRAINT; Schema: web; Owner: openatlas
+--
+
+ALTER TABLE ONLY web.file_info
+    ADD CONSTRAINT file_info_entity_id_fkey FOREIGN KEY (entity_id) REFERENCES model.entity(id) ON UPDATE CASCADE ON DELETE CASCADE;
+
+
 --
 -- Name: hierarchy_openatlas_class hierarchy_form_hierarchy_id_fkey; Type: FK CONSTRAINT; Schema: web; Owner: openatlas
 --
@@ -2345,6 +2901,14 @@ ALTER TABLE ONLY web.hierarchy_openatlas_class
     ADD CONSTRAINT hierarchy_openatlas_class_openatlas_class_name_fkey FOREIGN KEY (openatlas_class_name) REFERENCES model.openatlas_class(name) ON UPDATE CASCADE ON DELETE CASCADE;
 
 
+--
+-- Name: job job_entity_id_fkey; Type: FK CONSTRAINT; Schema: web; Owner: openatlas
+--
+
+ALTER TABLE ONLY web.job
+    ADD CONSTRAINT job_entity_id_fkey FOREIGN KEY (entity_id) REFERENCES model.entity(id) ON UPDATE CASCADE ON DELETE CASCADE;
+
+
 --
 -- Name: map_overlay map_overlay_image_id_fkey; Type: FK CONSTRAINT; Schema: web; Owner: openatlas
 --
@@ -14,8 +14,10 @@ INSERT INTO web.user (username, password, active, email, group_id) VALUES (
   'test@example.com',
   (SELECT id FROM web.group WHERE name = 'admin'));
 
+INSERT INTO web.registry_version (id) VALUES (1);
+
 INSERT INTO web.settings (name, value) VALUES
-  ('database_version', '8.1.0'),
+  ('database_version', '8.2.0'),
   ('api_public', ''),
   ('default_language', 'en'),
   ('table_rows', '25'),
@@ -0,0 +1,220 @@
+-- Upgrade 8.1.x to 8.2.0
+-- Be sure to backup the database and read the upgrade notes before executing.
+
+BEGIN;
+
+-- Raise database version
+UPDATE web.settings SET value = '8.2.0' WHERE name = 'database_version';
+
+-- Registry version, raised by triggers to invalidate application caches
+CREATE TABLE IF NOT EXISTS web.registry_version (
+    id integer DEFAULT 1 NOT NULL,
+    version timestamp without time zone DEFAULT clock_timestamp() NOT NULL,
+    CONSTRAINT registry_version_pkey PRIMARY KEY (id),
+    CONSTRAINT registry_version_single_row CHECK ((id = 1))
+);
+ALTER TABLE web.registry_version OWNER TO openatlas;
+COMMENT ON TABLE web.registry_version IS 'Raised by triggers if types, hierarchies, settings or reference systems change, used to invalidate application caches';
+INSERT INTO web.registry_version (id) VALUES (1);
+
+CREATE OR REPLACE FUNCTION model.update_registry_version() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+        BEGIN
+            UPDATE web.registry_version SET version = clock_timestamp();
+            RETURN NULL;
+        END;
+    $$;
+ALTER FUNCTION model.update_registry_version() OWNER TO openatlas;
+
+CREATE OR REPLACE FUNCTION model.update_registry_version_link() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+        DECLARE
+            link_ RECORD;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                link_ = OLD;
+            ELSE
+                link_ = NEW;
+            END IF;
+
+            -- Type hierarchies and reference system precisions
+            IF link_.property_code IN ('P2', 'P89', 'P127') AND EXISTS (
+                    SELECT 1 FROM model.entity
+                    WHERE id = link_.domain_id
+                        AND openatlas_class_name IN ('administrative_unit', 'reference_system', 'type', 'type_tools')) THEN
+                UPDATE web.registry_version SET version = clock_timestamp();
+            END IF;
+            RETURN NULL;
+        END;
+    $$;
+ALTER FUNCTION model.update_registry_version_link() OWNER TO openatlas;
+
+CREATE TRIGGER update_registry_version AFTER INSERT OR UPDATE ON model.entity FOR EACH ROW WHEN ((new.openatlas_class_name = ANY (ARRAY['administrative_unit'::text, 'reference_system'::text, 'type'::text, 'type_tools'::text]))) EXECUTE FUNCTION model.update_registry_version();
+CREATE TRIGGER update_registry_version_delete AFTER DELETE ON model.entity FOR EACH ROW WHEN ((old.openatlas_class_name = ANY (ARRAY['administrative_unit'::text, 'reference_system'::text, 'type'::text, 'type_tools'::text]))) EXECUTE FUNCTION model.update_registry_version();
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON model.link FOR EACH ROW EXECUTE FUNCTION model.update_registry_version_link();
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON model.openatlas_class FOR EACH STATEMENT EXECUTE FUNCTION model.update_registry_version();
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON web.hierarchy FOR EACH STATEMENT EXECUTE FUNCTION model.update_registry_version();
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON web.hierarchy_openatlas_class FOR EACH STATEMENT EXECUTE FUNCTION model.update_registry_version();
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON web.reference_system FOR EACH STATEMENT EXECUTE FUNCTION model.update_registry_version();
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON web.reference_system_openatlas_class FOR EACH STATEMENT EXECUTE FUNCTION model.update_registry_version();
+CREATE TRIGGER update_registry_version AFTER INSERT OR DELETE OR UPDATE ON web.settings FOR EACH STATEMENT EXECUTE FUNCTION model.update_registry_version();
+
+-- Type usage counts, maintained by a trigger instead of counting links
+CREATE TABLE IF NOT EXISTS model.type_count (
+    type_id integer NOT NULL,
+    count integer DEFAULT 0 NOT NULL,
+    count_property integer DEFAULT 0 NOT NULL,
+    CONSTRAINT type_count_pkey PRIMARY KEY (type_id),
+    CONSTRAINT type_count_type_id_fkey FOREIGN KEY (type_id) REFERENCES model.entity(id) ON UPDATE CASCADE ON DELETE CASCADE
+);
+ALTER TABLE model.type_count OWNER TO openatlas;
+COMMENT ON TABLE model.type_count IS 'Usage counts of types, maintained by a trigger on model.link';
+
+INSERT INTO model.type_count (type_id, count, count_property)
+SELECT
+    e.id,
+    (SELECT COUNT(*) FROM model.link l WHERE l.range_id = e.id AND l.property_code IN ('P2', 'P89')),
+    (SELECT COUNT(*) FROM model.link l WHERE l.type_id = e.id)
+FROM model.entity e
+WHERE e.openatlas_class_name IN ('administrative_unit', 'type', 'type_tools');
+
+CREATE OR REPLACE FUNCTION model.update_type_count() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+        BEGIN
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                IF OLD.property_code IN ('P2', 'P89') THEN
+                    UPDATE model.type_count SET count = count - 1 WHERE type_id = OLD.range_id;
+                END IF;
+                IF OLD.type_id IS NOT NULL THEN
+                    UPDATE model.type_count SET count_property = count_property - 1 WHERE type_id = OLD.type_id;
+                END IF;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                IF NEW.property_code IN ('P2', 'P89') THEN
+                    INSERT INTO model.type_count (type_id, count) VALUES (NEW.range_id, 1)
+                    ON CONFLICT (type_id) DO UPDATE SET count = model.type_count.count + 1;
+                END IF;
+                IF NEW.type_id IS NOT NULL THEN
+                    INSERT INTO model.type_count (type_id, count_property) VALUES (NEW.type_id, 1)
+                    ON CONFLICT (type_id) DO UPDATE SET count_property = model.type_count.count_property + 1;
+                END IF;
+            END IF;
+            RETURN NULL;
+        END;
+    $$;
+ALTER FUNCTION model.update_type_count() OWNER TO openatlas;
+CREATE TRIGGER update_type_count AFTER INSERT OR DELETE OR UPDATE OF property_code, range_id, type_id ON model.link FOR EACH ROW EXECUTE FUNCTION model.update_type_count();
+
+-- File registry, replaces scanning the upload directory at every request
+CREATE TABLE IF NOT EXISTS web.file_info (
+    entity_id integer NOT NULL,
+    extension text NOT NULL,
+    size bigint NOT NULL,
+    created timestamp without time zone NOT NULL,
+    modified timestamp without time zone NOT NULL,
+    variants text[] DEFAULT '{}'::text[] NOT NULL,
+    CONSTRAINT file_info_pkey PRIMARY KEY (entity_id),
+    CONSTRAINT file_info_entity_id_fkey FOREIGN KEY (entity_id) REFERENCES model.entity(id) ON UPDATE CASCADE ON DELETE CASCADE
+);
+ALTER TABLE web.file_info OWNER TO openatlas;
+COMMENT ON TABLE web.file_info IS 'Uploaded files of file entities, maintained at upload and deletion to avoid scanning the upload directory';
+COMMENT ON COLUMN web.file_info.variants IS 'sizes of resized images which were created';
+
+-- Indexes for frequent queries, pg_trgm is needed for searching names
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;
+
+CREATE OR REPLACE FUNCTION model.unaccent_lower(text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    AS $_$
+        SELECT public.unaccent('public.unaccent'::regdictionary, lower($1));
+    $_$;
+ALTER FUNCTION model.unaccent_lower(text) OWNER TO openatlas;
+
+CREATE INDEX IF NOT EXISTS entity_entity_id_idx ON import.entity USING btree (entity_id);
+CREATE INDEX IF NOT EXISTS entity_cidoc_class_code_idx ON model.entity USING btree (cidoc_class_code);
+CREATE INDEX IF NOT EXISTS entity_name_trgm_idx ON model.entity USING gin (model.unaccent_lower(name) public.gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS entity_openatlas_class_name_idx ON model.entity USING btree (openatlas_class_name, lower(name));
+CREATE INDEX IF NOT EXISTS gis_entity_id_idx ON model.gis USING btree (entity_id);
+CREATE INDEX IF NOT EXISTS gis_geom_linestring_idx ON model.gis USING gist (geom_linestring);
+CREATE INDEX IF NOT EXISTS gis_geom_point_idx ON model.gis USING gist (geom_point);
+CREATE INDEX IF NOT EXISTS gis_geom_polygon_idx ON model.gis USING gist (geom_polygon);
+CREATE INDEX IF NOT EXISTS link_domain_id_property_code_idx ON model.link USING btree (domain_id, property_code);
+CREATE INDEX IF NOT EXISTS link_property_code_idx ON model.link USING btree (property_code);
+CREATE INDEX IF NOT EXISTS link_range_id_property_code_idx ON model.link USING btree (range_id, property_code);
+CREATE INDEX IF NOT EXISTS link_type_id_idx ON model.link USING btree (type_id) WHERE (type_id IS NOT NULL);
+CREATE INDEX IF NOT EXISTS user_log_entity_id_idx ON web.user_log USING btree (entity_id);
+
+-- GeoJSON layer cache of the map and the geometries API, deleted by triggers
+CREATE TABLE IF NOT EXISTS web.gis_layer (
+    name text NOT NULL,
+    geojson text NOT NULL,
+    count integer NOT NULL,
+    created timestamp without time zone DEFAULT now() NOT NULL,
+    CONSTRAINT gis_layer_pkey PRIMARY KEY (name)
+);
+ALTER TABLE web.gis_layer OWNER TO openatlas;
+COMMENT ON TABLE web.gis_layer IS 'GeoJSON of all places by shape, deleted by triggers if geometries, places or types change';
+
+CREATE OR REPLACE FUNCTION model.delete_gis_layer() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+        BEGIN
+            -- Shared lock, held until commit, to wait for running rebuilds
+            PERFORM pg_advisory_xact_lock_shared('web.gis_layer'::regclass::bigint);
+            DELETE FROM web.gis_layer;
+            RETURN NULL;
+        END;
+    $$;
+ALTER FUNCTION model.delete_gis_layer() OWNER TO openatlas;
+
+CREATE OR REPLACE FUNCTION model.delete_gis_layer_link() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+        DECLARE
+            link_ RECORD;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                link_ = OLD;
+            ELSE
+                link_ = NEW;
+            END IF;
+
+            -- Locations and types of places
+            IF link_.property_code IN ('P2', 'P53') AND EXISTS (
+                    SELECT 1 FROM model.entity
+                    WHERE id = link_.domain_id
+                        AND openatlas_class_name = 'place') THEN
+                PERFORM pg_advisory_xact_lock_shared('web.gis_layer'::regclass::bigint);
+                DELETE FROM web.gis_layer;
+            END IF;
+            RETURN NULL;
+        END;
+    $$;
+ALTER FUNCTION model.delete_gis_layer_link() OWNER TO openatlas;
+
+CREATE TRIGGER delete_gis_layer AFTER DELETE OR UPDATE ON model.entity FOR EACH ROW WHEN ((old.openatlas_class_name = ANY (ARRAY['place'::text, 'type'::text]))) EXECUTE FUNCTION model.delete_gis_layer();
+CREATE TRIGGER delete_gis_layer AFTER INSERT OR DELETE OR UPDATE ON model.gis FOR EACH STATEMENT EXECUTE FUNCTION model.delete_gis_layer();
+CREATE TRIGGER delete_gis_layer AFTER INSERT OR DELETE OR UPDATE ON model.link FOR EACH ROW EXECUTE FUNCTION model.delete_gis_layer_link();
+
+-- Background jobs for files, processed by worker.py
+CREATE TABLE IF NOT EXISTS web.job (
+    name text NOT NULL,
+    entity_id integer NOT NULL,
+    status text DEFAULT 'pending'::text NOT NULL,
+    attempts integer DEFAULT 0 NOT NULL,
+    error text,
+    created timestamp without time zone DEFAULT now() NOT NULL,
+    modified timestamp without time zone,
+    CONSTRAINT job_pkey PRIMARY KEY (name, entity_id),
+    CONSTRAINT job_entity_id_fkey FOREIGN KEY (entity_id) REFERENCES model.entity(id) ON UPDATE CASCADE ON DELETE CASCADE
+);
+ALTER TABLE web.job OWNER TO openatlas;
+COMMENT ON TABLE web.job IS 'Background jobs for files like IIIF conversion and image resizing, processed by the worker';
+CREATE INDEX IF NOT EXISTS job_status_idx ON web.job USING btree (status, created);
+CREATE TRIGGER update_modified BEFORE UPDATE ON web.job FOR EACH ROW EXECUTE FUNCTION model.update_modified();
+
+END;
@@ -0,0 +1,5 @@
+# Settings from config/default.py can be overwritten here
+
+DATABASE_PASS = 'CHANGE ME'
+SECRET_KEY = 'CHANGE ME'  # Used for cookies
+# SESSION_COOKIE_SECURE = True  # Should be True if using HTTPS
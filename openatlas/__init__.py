@@ -8,7 +8,7 @@ from flask_wtf.csrf import CSRFProtect
 from psycopg2 import extras
 
 from openatlas.api.resources.error import AccessDeniedError
-from openatlas.database.connect import close_connection, open_connection
+from openatlas.database.connect import close_connection, get_connection
 
 app: Flask = Flask(__name__, instance_relative_config=True)
 csrf = CSRFProtect(app)  # Make sure all forms are CSRF protected
@@ -42,46 +42,29 @@ def get_locale() -> str:
 
 @app.before_request
 def before_request() -> None:
+    from openatlas.models.file import FileRegistry
     from openatlas.models.openatlas_class import (
         OpenatlasClass, view_class_mapping)
-    from openatlas.models.cidoc_property import CidocProperty
-    from openatlas.models.cidoc_class import CidocClass
-    from openatlas.models.type import Type
-    from openatlas.models.settings import Settings
-    from openatlas.models.reference_system import ReferenceSystem
+    from openatlas.models.registry import Registry
 
     if request.path.startswith('/static'):
         return  # Avoid files overhead if not using Apache with static alias
 
     g.logger = Logger()
-    g.db = open_connection(app.config)
+    g.db = get_connection(app.config)
     g.db.autocommit = True
     g.cursor = g.db.cursor(cursor_factory=extras.DictCursor)
-    g.settings = Settings.get_settings()
+    g.open_cursors = 0  # Of iterate(), closed if left open at teardown
+    g.link_entities = {}  # Request caches, see Link and Entity.prefetch_links
+    g.neighborhoods = {}
+    g.type_counts = {}
+    Registry.load_settings()
     session['language'] = get_locale()
-    g.cidoc_classes = CidocClass.get_all(session['language'])
-    g.properties = CidocProperty.get_all(session['language'])
-    g.classes = OpenatlasClass.get_all()
-    with_count = False
-    if (request.path.startswith('/type')
-            or request.path.startswith('/api/type_tree/')
-            or request.path.startswith('/admin/orphans')
-            or (
-                request.path.startswith('/entity/') and
-                request.path.split('/entity/')[1].isdigit())):
-        with_count = True
-    g.types = Type.get_all(with_count)
-    g.radiocarbon_type = Type.get_hierarchy('Radiocarbon')
-    g.sex_type = Type.get_hierarchy('Features for sexing')
-    g.reference_match_type = Type.get_hierarchy('External reference match')
-    g.reference_systems = ReferenceSystem.get_all()
+    Registry.load(session['language'])
     g.view_class_mapping = view_class_mapping
     g.class_view_mapping = OpenatlasClass.get_class_view_mapping()
     g.table_headers = OpenatlasClass.get_table_headers()
-    g.files = {}
-    for file_ in app.config['UPLOAD_PATH'].iterdir():
-        if file_.stem.isdigit():
-            g.files[int(file_.stem)] = file_
+    g.files = FileRegistry()
     app.config['MAX_CONTENT_LENGTH'] = \
         g.settings['file_upload_max_size'] * 1024 * 1024  # Max upload in MB
     g.display_file_ext = app.config['DISPLAY_FILE_EXT']
@@ -114,4 +97,7 @@ def apply_caching(response: Response) -> Response:
 
 @app.teardown_request
 def teardown_request(_exception: Optional[Any]) -> None:
+    from openatlas.models.registry import Registry
+    if g.get('rollback'):
+        Registry.clear()
     close_connection()
@@ -6,11 +6,11 @@ from flask_restful import Resource
 from openatlas.api.resources.error import (
     InvalidLimitError, NotATypeError, QueryEmptyError)
 from openatlas.api.resources.model_mapper import (
-    get_by_cidoc_classes, get_entities_by_ids, get_entities_by_system_classes,
-    get_entities_by_view_classes, get_entity_by_id, get_latest_entities)
+    get_cidoc_class_codes, get_entities_by_ids, get_entity_by_id,
+    get_latest_entities, get_system_class_names, get_view_class_names)
 from openatlas.api.resources.parser import entity_, query
 from openatlas.api.resources.resolve_endpoints import (
-    resolve_entities, resolve_entity)
+    resolve_entities, resolve_entity, resolve_entity_query)
 from openatlas.api.resources.util import (
     get_entities_from_type_with_subs, get_entities_linked_to_special_type,
     get_entities_linked_to_special_type_recursive, get_linked_entities_api)
@@ -20,8 +20,8 @@ class GetByCidocClass(Resource):
     @staticmethod
     def get(cidoc_class: str) \
             -> tuple[Resource, int] | Response | dict[str, Any]:
-        return resolve_entities(
-            get_by_cidoc_classes([cidoc_class]),
+        return resolve_entity_query(
+            {'cidoc_classes': get_cidoc_class_codes([cidoc_class])},
             entity_.parse_args(),
             cidoc_class)
 
@@ -30,8 +30,8 @@ class GetBySystemClass(Resource):
     @staticmethod
     def get(system_class: str) \
             -> tuple[Resource, int] | Response | dict[str, Any]:
-        return resolve_entities(
-            get_entities_by_system_classes([system_class]),
+        return resolve_entity_query(
+            {'classes': get_system_class_names([system_class])},
             entity_.parse_args(),
             system_class)
 
@@ -40,8 +40,8 @@ class GetByViewClass(Resource):
     @staticmethod
     def get(view_class: str) \
             -> tuple[Resource, int] | Response | dict[str, Any]:
-        return resolve_entities(
-            get_entities_by_view_classes([view_class]),
+        return resolve_entity_query(
+            {'classes': get_view_class_names([view_class])},
             entity_.parse_args(),
             view_class)
 
@@ -106,15 +106,15 @@ class GetQuery(Resource):
                 parser['view_classes'],
                 parser['system_classes']]):
             raise QueryEmptyError
-        entities = []
-        if parser['entities']:
-            entities.extend(get_entities_by_ids(parser['entities']))
+        classes = []
         if parser['view_classes']:
-            entities.extend(
-                get_entities_by_view_classes(parser['view_classes']))
+            classes += get_view_class_names(parser['view_classes'])
         if parser['system_classes']:
-            entities.extend(
-                get_entities_by_system_classes(parser['system_classes']))
-        if parser['cidoc_classes']:
-            entities.extend(get_by_cidoc_classes(parser['cidoc_classes']))
-        return resolve_entities(entities, parser, 'query')
+            classes += get_system_class_names(parser['system_classes'])
+        return resolve_entity_query({
+            'ids': parser['entities'],
+            'classes': classes,
+            'cidoc_classes': get_cidoc_class_codes(parser['cidoc_classes'])
+            if parser['cidoc_classes'] else []},
+            parser,
+            'query')
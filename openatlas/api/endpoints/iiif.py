@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import mimetypes
+from functools import lru_cache
 from typing import Any, Tuple
 
 import requests
 from flask import Response, g, jsonify, url_for
 from flask_restful import Resource
+from wand.image import Image
 
+from openatlas import app
 from openatlas.api.resources.model_mapper import get_entity_by_id
 from openatlas.api.resources.util import get_license_name
+from openatlas.display.util import get_iiif_file_path
 from openatlas.models.annotation import Annotation
 from openatlas.models.entity import Entity
 
@@ -229,12 +233,45 @@ class IIIFManifest(Resource):
             "structures": []}
 
 
+# Image info by file id, with the modification time of the IIIF file
+# Profiles of IIIF image servers by URL, recorded from their info.json
+image_profiles: dict[str, Any] = {}
+
+
 def get_metadata(entity: Entity) -> dict[str, Any]:
     ext = '.tiff' if g.settings['iiif_conversion'] else entity.get_file_ext()
     image_url = f"{g.settings['iiif_url']}{entity.id}{ext}"
-    req = requests.get(f"{image_url}/info.json", timeout=30)
-    image_api = req.json()
-    return {'entity': entity, 'img_url': image_url, 'img_api': image_api}
+    return {
+        'entity': entity,
+        'img_url': image_url,
+        'img_api': get_image_info(entity.id, image_url)}
+
+
+def get_image_info(id_: int, image_url: str) -> dict[str, Any]:
+    # Sizes are read from the header of the local IIIF file instead of
+    # requesting info.json from the image server for every image
+    try:
+        path = get_iiif_file_path(id_)
+        modified = path.stat().st_mtime
+    except (KeyError, OSError):  # pragma: no cover
+        return get_remote_image_info(image_url)
+    if g.settings['iiif_url'] not in image_profiles:
+        get_remote_image_info(image_url)
+    return read_image_info(str(path), modified) \
+        | {'profile': image_profiles[g.settings['iiif_url']]}
+
+
+def get_remote_image_info(image_url: str) -> dict[str, Any]:
+    info = requests.get(f"{image_url}/info.json", timeout=30).json()
+    image_profiles[g.settings['iiif_url']] = info['profile']
+    return info
+
+
+@lru_cache(maxsize=app.config['IIIF_INFO_CACHE_SIZE'])
+def read_image_info(path: str, modified: float) -> dict[str, int]:
+    # Modified time is part of the key, so changed files are read again
+    with Image.ping(filename=f'{path}[0]') as image:
+        return {'width': image.width, 'height': image.height}
 
 
 def get_logo() -> dict[str, Any]:
@@ -1,21 +1,21 @@
 import json
-from typing import Any
+from itertools import islice
+from typing import Any, Iterable, Iterator
 
-from flask import Response, jsonify
-from flask_restful import Resource, marshal
+from flask import Response, jsonify, stream_with_context
+from flask_restful import Resource
 
 from openatlas.api.formats.csv import export_database_csv
 from openatlas.api.formats.subunits import get_subunits_from_id
 from openatlas.api.formats.xml import export_database_xml
 from openatlas.api.resources.database_mapper import (
-    get_all_entities_as_dict, get_all_links_as_dict, get_cidoc_hierarchy,
-    get_classes, get_properties, get_property_hierarchy)
+    get_all_entities_as_dict, get_all_geometries_as_dict,
+    get_all_links_as_dict, get_cidoc_hierarchy, get_classes, get_properties,
+    get_property_hierarchy)
 from openatlas.api.resources.error import NotAPlaceError
 from openatlas.api.resources.model_mapper import get_entity_by_id
 from openatlas.api.resources.parser import entity_, gis
-from openatlas.api.resources.resolve_endpoints import (
-    download, resolve_subunits)
-from openatlas.api.resources.templates import geometries_template
+from openatlas.api.resources.resolve_endpoints import resolve_subunits
 from openatlas.api.resources.util import get_geometries
 from openatlas.models.export import current_date_for_filename
 
@@ -24,22 +24,21 @@ class GetGeometricEntities(Resource):
     @staticmethod
     def get() -> int | Response | tuple[Any, int]:
         parser = gis.parse_args()
-        output: dict[str, Any] = {
-            'type': 'FeatureCollection',
-            'features': get_geometries(parser)}
+        features, count = get_geometries(parser)
         if parser['count'] == 'true':
-            return jsonify(len(output['features']))
-        if parser['download'] == 'true':
-            return download(output, geometries_template(), 'geometries')
-        return marshal(output, geometries_template()), 200
+            return jsonify(count)
+        # Cached GeoJSON is returned as is, without loading and marshalling
+        return Response(
+            f'{{"type": "FeatureCollection", "features": {features}}}',
+            mimetype='application/json',
+            headers={
+                'Content-Disposition': 'attachment;filename=geometries.json'}
+            if parser['download'] == 'true' else None)
 
 
 class ExportDatabase(Resource):
     @staticmethod
     def get(format_: str) -> tuple[Resource, int] | Response:
-        geoms = [
-            ExportDatabase.get_geometries_dict(geom)
-            for geom in get_geometries({'geometry': 'gisAll'})]
         tables = {
             'entities': get_all_entities_as_dict(),
             'links': get_all_links_as_dict(),
@@ -47,29 +46,45 @@ class ExportDatabase(Resource):
             'property_hierarchy': get_property_hierarchy(),
             'classes': get_classes(),
             'class_hierarchy': get_cidoc_hierarchy(),
-            'geometries': geoms}
+            'geometries': (
+                ExportDatabase.get_geometries_dict(row)
+                for row in get_all_geometries_as_dict())}
         filename = f'{current_date_for_filename()}-export'
         if format_ == 'csv':
             return export_database_csv(tables, filename)
         if format_ == 'xml':
             return export_database_xml(tables, filename)
         return Response(
-            json.dumps(tables),
+            stream_with_context(ExportDatabase.get_json(tables)),
             mimetype='application/json',
             headers={
                 'Content-Disposition': f'attachment;filename={filename}.json'})
 
     @staticmethod
-    def get_geometries_dict(geom: dict[str, Any]) -> dict[str, Any]:
+    def get_json(tables: dict[str, Iterable[dict[str, Any]]]) -> Iterator[str]:
+        yield '{'
+        for number, (name, rows) in enumerate(tables.items()):
+            yield f"{', ' if number else ''}{json.dumps(name)}: ["
+            separator = ''
+            rows = iter(rows)
+            while batch := list(islice(rows, 1000)):
+                yield separator + ', '.join(json.dumps(row) for row in batch)
+                separator = ', '
+            yield ']'
+        yield '}'
+
+    @staticmethod
+    def get_geometries_dict(row: dict[str, Any]) -> dict[str, Any]:
+        geometry = json.loads(row['geojson'])
         return {
-            'id': geom['properties']['id'],
-            'locationId': geom['properties']['locationId'],
-            'objectId': geom['properties']['objectId'],
-            'name': geom['properties']['name'],
-            'objectName': geom['properties']['objectName'],
-            'objectDescription': geom['properties']['objectDescription'],
-            'coordinates': geom['geometry']['coordinates'],
-            'type': geom['geometry']['type']}
+            'id': row['id'],
+            'locationId': row['location_id'],
+            'objectId': row['object_id'],
+            'name': row['name'],
+            'objectName': row['object_name'],
+            'objectDescription': row['object_description'],
+            'coordinates': geometry['coordinates'],
+            'type': geometry['type']}
 
 
 class GetSubunits(Resource):
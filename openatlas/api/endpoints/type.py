@@ -1,13 +1,14 @@
 from collections import defaultdict
 from typing import Any
 
-from flask import Response, g, jsonify, url_for
+from flask import Response, g, jsonify
 from flask_restful import Resource, marshal
 
 from openatlas.api.resources.parser import default, entity_
 from openatlas.api.resources.resolve_endpoints import download
 from openatlas.api.resources.templates import (
     type_by_view_class_template, type_overview_template, type_tree_template)
+from openatlas.api.resources.util import get_api_url
 from openatlas.models.entity import Entity
 from openatlas.models.type import Type
 
@@ -18,7 +19,7 @@ def walk_type_tree(types: list[int]) -> list[dict[str, Any]]:
         item = g.types[id_]
         items.append({
             'id': item.id,
-            'url': url_for('api.entity', id_=item.id, _external=True),
+            'url': get_api_url('api.entity', id_=item.id),
             'label': item.name.replace("'", "&apos;"),
             'children': walk_type_tree(item.subs)})
     return items
@@ -88,6 +89,7 @@ class GetTypeTree(Resource):
 
     @staticmethod
     def get_type_tree() -> dict[int, Any]:
+        Type.load_counts(list(g.types))
         return {
             id_: GetTypeTree.serialize_to_json(type_) for id_, type_
             in g.types.items()}
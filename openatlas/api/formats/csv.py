@@ -1,11 +1,13 @@
+import csv
 import zipfile
 from collections import defaultdict
-from io import BytesIO
+from io import BytesIO, TextIOWrapper
 from itertools import groupby
-from typing import Any
+from operator import itemgetter
+from typing import Any, Iterable, Iterator
 
 import pandas as pd
-from flask import Response, g
+from flask import Response, g, stream_with_context
 
 from openatlas.api.resources.util import (
     get_linked_entities_api, link_parser_check, link_parser_check_inverse,
@@ -156,36 +158,56 @@ def get_entities_grouped_by_class(entities: list[Entity]) -> dict[str, Any]:
     return grouped_entities
 
 
-def get_grouped_entities(entities: list[dict[str, Any]]) -> dict[str, Any]:
-    grouped_entities = {}
-    for class_, entities_ in groupby(
-            sorted(
-                entities,
-                key=lambda entity: entity['openatlas_class_name']),
-            key=lambda entity: entity['openatlas_class_name']):
-        grouped_entities[class_] = list(entities_)
-    return grouped_entities
+class StreamBuffer:
+    # Collects data written to a zip file until it is sent to the client
 
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.size = 0
 
-def export_database_csv(tables: dict[str, Any], filename: str) -> Response:
-    archive = BytesIO()
-    with zipfile.ZipFile(archive, 'w') as zipped_file:
-        for name, entries in tables.items():
-            if name == 'entities':
-                for system_class, frame \
-                        in get_grouped_entities(entries).items():
-                    with zipped_file.open(
-                            f'{system_class}.csv', 'w') as file:
-                        file.write(bytes(
-                            pd.DataFrame(data=frame).to_csv(),
-                            encoding='utf8'))
-            else:
-                with zipped_file.open(f'{name}.csv', 'w') as file:
-                    file.write(bytes(
-                        pd.DataFrame(data=entries).to_csv(),
-                        encoding='utf8'))
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def pop(self) -> bytes:
+        data = b''.join(self.chunks)
+        self.chunks = []
+        self.size = 0
+        return data
+
+
+def export_database_csv(
+        tables: dict[str, Iterable[dict[str, Any]]],
+        filename: str) -> Response:
     return Response(
-        archive.getvalue(),
+        stream_with_context(get_database_zip(tables)),
         mimetype='application/zip',
         headers={
             'Content-Disposition': f'attachment;filename={filename}.zip'})
+
+
+def get_database_zip(
+        tables: dict[str, Iterable[dict[str, Any]]]) -> Iterator[bytes]:
+    buffer = StreamBuffer()
+    with zipfile.ZipFile(buffer, 'w') as zipped_file:  # type: ignore
+        for name, rows in tables.items():
+            files = groupby(rows, key=itemgetter('openatlas_class_name')) \
+                if name == 'entities' else [(name, iter(rows))]
+            for file_name, rows_ in files:
+                with zipped_file.open(
+                        f'{file_name}.csv',
+                        'w',
+                        force_zip64=True) as file, \
+                        TextIOWrapper(file, 'utf8', newline='') as text:
+                    writer = csv.writer(text, lineterminator='\n')
+                    for number, row in enumerate(rows_):
+                        if not number:
+                            writer.writerow([''] + list(row))
+                        writer.writerow([number] + list(row.values()))
+                        if buffer.size > 65536:
+                            yield buffer.pop()
+    yield buffer.pop()
@@ -1,10 +1,10 @@
 from typing import Any, Optional
 
-from flask import g, url_for
+from flask import g
 
 from openatlas import app
 from openatlas.api.resources.util import (
-    date_to_str, get_crm_relation, get_crm_relation_label_x,
+    date_to_str, get_api_url, get_crm_relation, get_crm_relation_label_x,
     get_crm_relation_x,
     get_geometric_collection, get_license_name,
     get_location_link, get_reference_systems,
@@ -24,7 +24,7 @@ def get_linked_places_entity(
         'type': 'FeatureCollection',
         '@context': app.config['API_CONTEXT']['LPF'],
         'features': [replace_empty_list_values_in_dict_with_none({
-            '@id': url_for('api.entity', id_=entity.id, _external=True),
+            '@id': get_api_url('api.entity', id_=entity.id),
             'type': 'Feature',
             'crmClass': f'crm:{entity.cidoc_class.code} '
                         f"{entity.cidoc_class.i18n['en']}",
@@ -53,10 +53,9 @@ def link_dict(link_: Link, inverse: bool = False) -> dict[str, Any]:
     return {
         'label': link_.domain.name if inverse else link_.range.name,
         'relationTo':
-            url_for(
+            get_api_url(
                 'api.entity',
-                id_=link_.domain.id if inverse else link_.range.id,
-                _external=True),
+                id_=link_.domain.id if inverse else link_.range.id),
         'relationType': get_crm_relation(link_, inverse),
         'relationSystemClass':
             link_.domain.class_.name if inverse else link_.range.class_.name,
@@ -70,10 +69,9 @@ def link_dict_x(link_: Link, inverse: bool = False) -> dict[str, Any]:
     return {
         'label': link_.domain.name if inverse else link_.range.name,
         'relationTo':
-            url_for(
+            get_api_url(
                 'api.entity',
-                id_=link_.domain.id if inverse else link_.range.id,
-                _external=True),
+                id_=link_.domain.id if inverse else link_.range.id),
         'relationType': get_crm_relation_x(link_),
         'relationTypeLabel': get_crm_relation_label_x(link_, inverse),
         'relationSystemClass':
@@ -110,16 +108,11 @@ def get_lp_file(links_inverse: list[Link]) -> list[dict[str, str]]:
             continue
         path = get_file_path(link.domain.id)
         files.append({
-            '@id': url_for(
-                'api.entity',
-                id_=link.domain.id,
-                _external=True),
+            '@id': get_api_url('api.entity', id_=link.domain.id),
             'title': link.domain.name,
             'license': get_license_name(link.domain),
-            'url': url_for(
-                'api.display',
-                filename=path.stem,
-                _external=True) if path else "N/A"})
+            'url': get_api_url('api.display', filename=path.stem)
+            if path else "N/A"})
     return files
 
 
@@ -129,8 +122,7 @@ def get_lp_types(entity: Entity, links: list[Link]) -> list[dict[str, Any]]:
         entity.types.update(get_location_link(links).range.types)
     for type_ in entity.types:
         type_dict = {
-            'identifier': url_for(
-                'api.entity', id_=type_.id, _external=True),
+            'identifier': get_api_url('api.entity', id_=type_.id),
             'descriptions': type_.description,
             'label': type_.name,
             'hierarchy': ' > '.join(map(
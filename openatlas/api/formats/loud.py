@@ -2,11 +2,12 @@ import mimetypes
 from collections import defaultdict
 from typing import Any, Optional
 
-from flask import url_for, g
+from flask import g
 
 from openatlas import app
 from openatlas.api.resources.util import (
-    remove_spaces_dashes, date_to_str, get_crm_relation, get_crm_code)
+    remove_spaces_dashes, date_to_str, get_api_url, get_crm_relation,
+    get_crm_code)
 from openatlas.display.util import get_file_path
 from openatlas.models.entity import Entity
 from openatlas.models.gis import Gis
@@ -16,7 +17,7 @@ from openatlas.models.type import Type
 def get_loud_entities(data: dict[str, Any], loud: dict[str, str]) -> Any:
     def base_entity_dict() -> dict[str, Any]:
         return {
-            'id': url_for('api.entity', id_=data['entity'].id, _external=True),
+            'id': get_api_url('api.entity', id_=data['entity'].id),
             'type': remove_spaces_dashes(
                 data['entity'].cidoc_class.i18n['en']),
             '_label': data['entity'].name,
@@ -28,13 +29,13 @@ def get_loud_entities(data: dict[str, Any], loud: dict[str, str]) -> Any:
 
     def get_range_links() -> dict[str, Any]:
         return {
-            'id': url_for('api.entity', id_=link_.range.id, _external=True),
+            'id': get_api_url('api.entity', id_=link_.range.id),
             'type': loud[get_crm_code(link_).replace(' ', '_')],
             '_label': link_.range.name}
 
     def get_domain_links() -> dict[str, Any]:
         property_ = {
-            'id': url_for('api.entity', id_=link_.domain.id, _external=True),
+            'id': get_api_url('api.entity', id_=link_.domain.id),
             'type': loud[get_crm_code(link_, True).replace(' ', '_')],
             '_label': link_.domain.name}
         if standard_type := get_standard_type_loud(link_.domain.types):
@@ -90,15 +91,14 @@ def get_loud_entities(data: dict[str, Any], loud: dict[str, str]) -> Any:
                 continue  # pragma: no cover
             file_ = get_file_path(id_)
             image = {
-                'id': url_for('api.entity', id_=id_, _external=True),
+                'id': get_api_url('api.entity', id_=id_),
                 '_label': link_.domain.name,
                 'type': 'DigitalObject',
                 'format': mime_type,
                 'access_point': [{
-                    'id': url_for(
+                    'id': get_api_url(
                         'api.display',
-                        filename=file_.stem if file_ else '',
-                        _external=True),
+                        filename=file_.stem if file_ else ''),
                     'type': 'DigitalObject',
                     '_label': 'ProfileImage' if id_ == profile_image else ''}]}
             if type_ := get_standard_type_loud(link_.domain.types):
@@ -120,7 +120,7 @@ def get_loud_timespan(entity: Entity) -> dict[str, Any]:
 
 def get_type_property(type_: Type) -> dict[str, Any]:
     return {
-        'id': url_for('api.entity', id_=type_.id, _external=True),
+        'id': get_api_url('api.entity', id_=type_.id),
         'type': remove_spaces_dashes(type_.cidoc_class.i18n['en']),
         '_label': type_.name}
 
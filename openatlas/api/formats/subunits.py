@@ -1,14 +1,15 @@
+from collections import defaultdict
 from operator import attrgetter
 from typing import Any, Optional
 
 from flask import g
 
-from openatlas.api.resources.database_mapper import get_all_links_as_dict
+from openatlas.api.resources.database_mapper import (
+    get_links_of_entity_ids_as_dict, get_subunit_ids)
 from openatlas.api.resources.model_mapper import get_entities_by_ids
 from openatlas.api.resources.util import (
-    filter_link_list_by_property_codes, get_geometric_collection,
-    get_license_name, get_reference_systems, remove_duplicate_entities,
-    replace_empty_list_values_in_dict_with_none)
+    get_geometric_collection, get_license_name, get_reference_systems,
+    remove_duplicate_entities, replace_empty_list_values_in_dict_with_none)
 from openatlas.display.util import get_file_path
 from openatlas.models.entity import Entity
 from openatlas.models.link import Link
@@ -202,11 +203,13 @@ def get_types(data: dict[str, Any]) -> Optional[list[dict[str, Any]]]:
 def get_subunits_from_id(
         entity: Entity,
         parser: dict[str, Any]) -> list[dict[str, Any]]:
-    all_links = get_all_links_as_dict()
-    entity_ids = get_all_subs_linked_to_place(entity, all_links)
+    entity_ids = get_subunit_ids(entity.id)
     entities = get_entities_by_ids(entity_ids)
     entities.sort(key=attrgetter('id'))
-    links = get_links_from_list_of_links(entity_ids, all_links)
+    Link.add_entities(entities)
+    links = get_links_from_list_of_links(
+        set(entity_ids),
+        get_links_of_entity_ids_as_dict(entity_ids))
     ext_reference_links = get_type_links_inverse(entities)
     latest_modified = max(
         entity.modified for entity in entities if entity.modified)
@@ -214,12 +217,8 @@ def get_subunits_from_id(
     for entity_ in entities:
         entities_dict[entity_.id] = {
             'entity': entity_,
-            'links':
-                [Link(link_) for link_ in links['links']
-                 if link_['domain_id'] == entity_.id],
-            'links_inverse':
-                [Link(link_) for link_ in links['links_inverse']
-                 if link_['range_id'] == entity_.id],
+            'links': links['links'].get(entity_.id, []),
+            'links_inverse': links['links_inverse'].get(entity_.id, []),
             'ext_reference_links': ext_reference_links,
             'root_id': entity.id,
             'latest_modified': latest_modified,
@@ -228,33 +227,16 @@ def get_subunits_from_id(
 
 
 def get_links_from_list_of_links(
-        entities: list[int],
-        links: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
-    data: dict[str, list[Any]] = {'links': [], 'links_inverse': []}
-    for link_ in links:
-        if link_['domain_id'] in entities:
-            data['links'].append(link_)
-        if link_['range_id'] in entities:
-            data['links_inverse'].append(link_)
-    return data
-
-
-def get_all_subs_linked_to_place(
-        entity: Entity,
-        links: list[dict[str, Any]]) -> list[int]:
-    links_ = filter_link_list_by_property_codes(links, ['P46'])
-    return get_all_subs_linked_to_place_recursive(entity.id, links_, [])
-
-
-def get_all_subs_linked_to_place_recursive(
-        id_: int,
-        links: list[dict[str, Any]],
-        data: list[int]) -> list[int]:
-    data.append(id_)
-    for link_ in links:
-        if link_['domain_id'] == id_:
-            get_all_subs_linked_to_place_recursive(
-                link_['range_id'], links, data)
+        entities: set[int],
+        links: list[dict[str, Any]]) -> dict[str, dict[int, list[Link]]]:
+    data: dict[str, dict[int, list[Link]]] = {
+        'links': defaultdict(list),
+        'links_inverse': defaultdict(list)}
+    for link_ in Link.get_by_rows(links):
+        if link_.domain.id in entities:
+            data['links'][link_.domain.id].append(link_)
+        if link_.range.id in entities:
+            data['links_inverse'][link_.range.id].append(link_)
     return data
 
 
@@ -1,8 +1,9 @@
 import logging
-from typing import Any
+from itertools import islice
+from typing import Any, Iterable, Iterator
 
 import dicttoxml
-from flask import Response
+from flask import Response, stream_with_context
 
 dicttoxml.LOG.setLevel(logging.ERROR)
 
@@ -20,9 +21,21 @@ def subunit_xml(result: dict[str, Any]) -> bytes:
     return xml
 
 
-def export_database_xml(tables: dict[str, Any], filename: str) -> Response:
+def export_database_xml(
+        tables: dict[str, Iterable[dict[str, Any]]],
+        filename: str) -> Response:
     return Response(
-        dicttoxml.dicttoxml(tables, root=False, attr_type=False),
+        stream_with_context(get_database_xml(tables)),
         mimetype='application/xml',
         headers={
             'Content-Disposition': f'attachment;filename={filename}.xml'})
+
+
+def get_database_xml(
+        tables: dict[str, Iterable[dict[str, Any]]]) -> Iterator[bytes]:
+    for name, rows in tables.items():
+        yield f'<{name}>'.encode()
+        rows = iter(rows)
+        while batch := list(islice(rows, 1000)):
+            yield dicttoxml.dicttoxml(batch, root=False, attr_type=False)
+        yield f'</{name}>'.encode()
@@ -114,6 +114,7 @@ def import_arche_data() -> int:
             timeout=60).content
         with open(str(app.config['UPLOAD_PATH'] / filename), "wb") as file_:
             file_.write(thumb_req)
+        g.files.add(file.id, app.config['UPLOAD_PATH'] / filename)
         file.link('P67', artifact)
         creator = get_or_create_person(
             exif['Creator'],
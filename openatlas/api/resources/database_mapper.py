@@ -1,20 +1,61 @@
-from typing import Any
+from typing import Any, Iterator, Optional
 
 from openatlas.database import (
+    api as db_api,
     cidoc_class as db_class,
     cidoc_property as db_property,
     entity as db_entity,
+    gis as db_gis,
     link as db_link)
 
 
-def get_all_entities_as_dict() -> list[dict[str, Any]]:
+def get_all_entities_as_dict() -> Iterator[dict[str, Any]]:
     return db_entity.get_all_entities()
 
 
-def get_all_links_as_dict() -> list[dict[str, Any]]:
+def get_entities_by_query(query: dict[str, Any]) -> list[dict[str, Any]]:
+    return db_api.get_entities(query)
+
+
+def get_entities_by_ids_as_dict(ids: list[int]) -> list[dict[str, Any]]:
+    return db_entity.get_by_ids(ids, types=True, aliases=True)
+
+
+def get_query_count(query: dict[str, Any]) -> int:
+    return db_api.get_count(query)
+
+
+def get_query_page_start_ids(query: dict[str, Any]) -> list[int]:
+    return db_api.get_page_start_ids(query)
+
+
+def get_query_page_ids(
+        query: dict[str, Any],
+        start_id: Optional[int] = None,
+        inclusive: bool = True) -> list[int]:
+    return db_api.get_page_ids(query, start_id, inclusive)
+
+
+def is_in_query_result(query: dict[str, Any], id_: int) -> bool:
+    return db_api.is_in_result(query, id_)
+
+
+def get_all_links_as_dict() -> Iterator[dict[str, Any]]:
     return db_link.get_all_links()
 
 
+def get_all_geometries_as_dict() -> Iterator[dict[str, Any]]:
+    return db_gis.get_all_geometries()
+
+
+def get_subunit_ids(id_: int) -> list[int]:
+    return db_link.get_subunit_ids(id_)
+
+
+def get_links_of_entity_ids_as_dict(ids: list[int]) -> list[dict[str, Any]]:
+    return db_link.get_links_of_entity_ids(ids)
+
+
 def get_properties() -> list[dict[str, Any]]:
     return db_property.get_properties()
 
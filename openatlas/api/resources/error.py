@@ -10,6 +10,10 @@ class EntityDoesNotExistError(Exception):
     pass
 
 
+class InvalidBoundingBoxError(Exception):
+    pass
+
+
 class InvalidCidocClassCodeError(Exception):
     pass
 
@@ -29,28 +29,48 @@ def get_overview_counts() -> dict[str, int]:
 
 
 def get_by_cidoc_classes(codes: list[str]) -> list[Entity]:
+    return Entity.get_by_cidoc_class(
+        get_cidoc_class_codes(codes),
+        types=True,
+        aliases=True)
+
+
+def get_cidoc_class_codes(codes: list[str]) -> list[str]:
     if 'all' in codes:
-        codes = list(g.cidoc_classes)
-    elif not set(codes).issubset(g.cidoc_classes):
+        return list(g.cidoc_classes)
+    if not set(codes).issubset(g.cidoc_classes):
         raise InvalidCidocClassCodeError
-    return Entity.get_by_cidoc_class(codes, types=True, aliases=True)
+    return codes
 
 
 def get_entities_by_view_classes(codes: list[str]) -> list[Entity]:
+    return Entity.get_by_class(
+        get_view_class_names(codes),
+        types=True,
+        aliases=True)
+
+
+def get_view_class_names(codes: list[str]) -> list[str]:
     codes = list(g.view_class_mapping) if 'all' in codes else codes
     if not all(c in g.view_class_mapping for c in codes):
         raise InvalidViewClassError
-    view_classes = flatten_list_and_remove_duplicates(
+    return flatten_list_and_remove_duplicates(
         [g.view_class_mapping[view] for view in codes])
-    return Entity.get_by_class(view_classes, types=True, aliases=True)
 
 
 def get_entities_by_system_classes(system_classes: list[str]) -> list[Entity]:
+    return Entity.get_by_class(
+        get_system_class_names(system_classes),
+        types=True,
+        aliases=True)
+
+
+def get_system_class_names(system_classes: list[str]) -> list[str]:
     system_classes = list(g.classes) \
         if 'all' in system_classes else system_classes
     if not all(sc in g.classes for sc in system_classes):
         raise InvalidSystemClassError
-    return Entity.get_by_class(system_classes, types=True, aliases=True)
+    return system_classes
 
 
 def flatten_list_and_remove_duplicates(list_: list[Any]) -> list[Any]:
@@ -144,6 +144,16 @@ gis.add_argument(
         'gisLineAll',
         'gisPolygonAll'),
     location='args')
+gis.add_argument(
+    'bbox',
+    type=str,
+    help='{error_msg}',
+    location='args')
+gis.add_argument(
+    'zoom',
+    type=int,
+    help='{error_msg}',
+    location='args')
 query = entity_.copy()
 query.add_argument(
     'entities',
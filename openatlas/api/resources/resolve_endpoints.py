@@ -1,9 +1,9 @@
 import itertools
 import json
 import pathlib
-from typing import Any
+from typing import Any, Callable
 
-from flask import Response, jsonify, request
+from flask import Response, g, jsonify, request
 from flask_restful import marshal
 
 from openatlas import app
@@ -14,10 +14,15 @@ from openatlas.api.formats.linked_places import get_linked_places_entity
 from openatlas.api.formats.loud import get_loud_entities
 from openatlas.api.formats.rdf import rdf_output
 from openatlas.api.formats.xml import subunit_xml
+from openatlas.api.resources.database_mapper import (
+    get_entities_by_ids_as_dict, get_entities_by_query, get_query_count,
+    get_query_page_ids, get_query_page_start_ids, is_in_query_result)
 from openatlas.api.resources.error import (
     EntityDoesNotExistError, LastEntityError, TypeIDError)
-from openatlas.api.resources.search import search
+from openatlas.api.resources.search import get_search_query, search
 from openatlas.api.resources.search_validation import iterate_validation
+from openatlas.api.resources.serializer import (
+    get_serializer, json_download, json_response, pass_through)
 from openatlas.api.resources.templates import (
     geojson_collection_template, geojson_pagination, linked_place_pagination,
     linked_places_template, loud_pagination, loud_template, subunit_template)
@@ -45,15 +50,66 @@ def resolve_entities(
     result = get_json_output(
         sorting(remove_duplicate_entities(entities), parser),
         parser)
+    if parser['count'] == 'true':
+        return jsonify(result['pagination']['entities'])
+    return get_entities_response(result, parser, file_name)
+
+
+def resolve_entity_query(
+        query: dict[str, Any],
+        parser: dict[str, Any],
+        file_name: int | str) -> Response | dict[str, Any] | tuple[Any, int]:
+    # Sorting, filtering and pagination is done in the database so only
+    # entities of the requested page have to be loaded.
+    query.update({
+        'type_ids': parser['type_id'],
+        'column': parser['column'],
+        'desc': parser['sort'] == 'desc',
+        'cidoc_order': sorted(
+            g.cidoc_classes,
+            key=lambda code: g.cidoc_classes[code].name)})
+    if parser['search']:
+        search_parser = parser_str_to_dict(parser['search'])
+        if iterate_validation(search_parser):
+            query['search'] = get_search_query(search_parser)
+    count = get_query_count(query)
+    if parser['type_id'] \
+            and not count \
+            and not get_query_count(query | {'search': None}):
+        raise TypeIDError  # Not if only the search has no results
+    if parser['export']:
+        entities = [Entity(row) for row in get_entities_by_query(query)]
+        if parser['export'] == 'csv':
+            return export_entities_csv(entities, file_name)
+        return export_csv_for_network_analysis(entities, parser)
+    if parser['count'] == 'true':
+        return jsonify(count)
+    return get_entities_response(
+        get_json_output_by_query(query, count, parser),
+        parser,
+        file_name)
+
+
+def get_entities_response(
+        result: dict[str, Any],
+        parser: dict[str, Any],
+        file_name: int | str) -> Response | dict[str, Any] | tuple[Any, int]:
     if parser['format'] in app.config['RDF_FORMATS']:  # pragma: nocover
         return Response(
             rdf_output(result['results'], parser),
             mimetype=app.config['RDF_FORMATS'][parser['format']])
-    if parser['count'] == 'true':
-        return jsonify(result['pagination']['entities'])
     if parser['download'] == 'true':
-        return download(result, get_entities_template(parser), file_name)
-    return marshal(result, get_entities_template(parser)), 200
+        return json_download(
+            result,
+            get_entities_serializer(parser),
+            file_name)
+    return json_response(result, get_entities_serializer(parser))
+
+
+def get_entities_serializer(parser: dict[str, Any]) -> Callable[[Any], Any]:
+    return get_serializer(
+        ('entities', parser['format'], frozenset(parser['show'])),
+        lambda: get_entities_template(parser))
 
 
 def get_entities_template(parser: dict[str, str]) -> dict[str, Any]:
@@ -102,14 +158,29 @@ def resolve_entity(
         return Response(
             rdf_output(result, parser),
             mimetype=app.config['RDF_FORMATS'][parser['format']])
-    template = linked_places_template(parser)
+    if parser['download']:
+        download(result, get_entity_template(parser, result), entity.id)
+    return json_response(result, get_entity_serializer(parser, result))
+
+
+def get_entity_template(
+        parser: dict[str, Any],
+        result: dict[str, Any]) -> dict[str, Any]:
     if parser['format'] in ['geojson', 'geojson-v2']:
-        template = geojson_collection_template()
+        return geojson_collection_template()
     if parser['format'] == 'loud':
-        template = loud_template(result)
-    if parser['download']:
-        download(result, template, entity.id)
-    return marshal(result, template), 200
+        return loud_template(result)
+    return linked_places_template(parser)
+
+
+def get_entity_serializer(
+        parser: dict[str, Any],
+        result: dict[str, Any]) -> Callable[[Any], Any]:
+    if parser['format'] == 'loud':
+        return pass_through  # Template has a Raw field for every key
+    return get_serializer(
+        ('entity', parser['format'], frozenset(parser['show'])),
+        lambda: get_entity_template(parser, result))
 
 
 def resolve_subunits(
@@ -131,7 +202,9 @@ def resolve_subunits(
             mimetype=app.config['RDF_FORMATS'][parser['format']])
     if parser['download']:
         download(out, subunit_template(name), name)
-    return marshal(out, subunit_template(name)), 200
+    return json_response(
+        out,
+        get_serializer(('subunit', name), lambda: subunit_template(name)))
 
 
 def get_json_output(
@@ -161,6 +234,45 @@ def get_json_output(
             'totalPages': len(index)}}
 
 
+def get_json_output_by_query(
+        query: dict[str, Any],
+        count: int,
+        parser: dict[str, Any]) -> dict[str, Any]:
+    parser['limit'] = count if parser['limit'] == 0 else parser['limit']
+    query['limit'] = int(parser['limit'])
+    index = []
+    if count and query['limit']:
+        index = [
+            {'page': num + 1, 'startId': id_}
+            for num, id_ in enumerate(get_query_page_start_ids(query))]
+    if index and parser['page']:
+        parser['first'] = get_by_page(index, parser)
+    ids = []
+    if parser['first'] and is_in_query_result(query, int(parser['first'])):
+        ids = get_query_page_ids(query, int(parser['first']))
+    elif parser['last'] and is_in_query_result(query, int(parser['last'])):
+        if not (ids := get_query_page_ids(
+                query,
+                int(parser['last']),
+                inclusive=False)):
+            raise LastEntityError
+    elif parser['first'] or parser['last']:
+        raise EntityDoesNotExistError
+    elif count:
+        ids = get_query_page_ids(query)
+    entities = {
+        row['id']: Entity(row) for row in get_entities_by_ids_as_dict(ids)}
+    return {
+        "results": get_entities_formatted(
+            [entities[id_] for id_ in ids],
+            parser) if ids else [],
+        "pagination": {
+            'entitiesPerPage': int(parser['limit']),
+            'entities': count,
+            'index': index,
+            'totalPages': len(index)}}
+
+
 def get_entities_formatted(
         entities_all: list[Entity],
         parser: dict[str, Any]) -> list[dict[str, Any]]:
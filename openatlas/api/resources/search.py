@@ -55,6 +55,27 @@ def get_search_parameter(parser: dict[str, Any]) -> dict[str, Any]:
     return parameter
 
 
+def get_search_query(parser: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # Structured search parameters for filtering in the database, see
+    # search_sql() in database/api.py
+    query = []
+    for parameter in parser:
+        item = {}
+        for category, values in parameter.items():
+            for value in values:
+                item = {
+                    'category': category,
+                    'operator': value['operator'],
+                    'logical_operator': value['logicalOperator']
+                    if 'logicalOperator' in value else 'or',
+                    'values': value['values']
+                    if category in ['relationToID', 'valueTypeID']
+                    else get_search_values(category, value)}
+        if item:
+            query.append(item)
+    return query
+
+
 def get_search_values(
         category: str,
         parameter: dict[str, Any]) -> list[str | int | list[Any]]:
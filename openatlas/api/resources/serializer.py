@@ -0,0 +1,129 @@
+import json
+from typing import Any, Callable, Optional
+
+from flask import Response
+from flask_restful import fields, marshal
+from flask_restful.fields import get_value, is_indexable_but_not_string
+
+from openatlas import app
+
+# Compiled templates by a key of the parameters they were built with
+serializers: dict[tuple[Any, ...], Callable[[Any], Any]] = {}
+
+FORMATS: dict[type, Optional[Callable[[Any], Any]]] = {
+    fields.Raw: None,
+    fields.String: str,
+    fields.Boolean: bool}
+
+
+def get_serializer(
+        key: tuple[Any, ...],
+        template: Callable[[], dict[str, Any]]) -> Callable[[Any], Any]:
+    if key not in serializers:
+        serializers[key] = compile_template(template())
+    return serializers[key]
+
+
+def pass_through(data: Any) -> Any:
+    # Result of templates with a Raw field for every key, e.g. LOUD
+    return data
+
+
+def json_response(data: Any, serializer: Callable[[Any], Any]) -> Response:
+    # Same output as flask_restful's JSON representation of marshal results
+    return Response(
+        json.dumps(serializer(data), indent=4 if app.debug else None) + '\n',
+        mimetype='application/json')
+
+
+def json_download(
+        data: Any,
+        serializer: Callable[[Any], Any],
+        name: str | int) -> Response:
+    return Response(
+        json.dumps(serializer(data)),
+        mimetype='application/json',
+        headers={'Content-Disposition': f'attachment;filename={name}.json'})
+
+
+def compile_template(template: dict[str, Any]) -> Callable[[Any], Any]:
+    # Returns a function with the result of flask_restful's marshal, with
+    # field lookups resolved once instead of for every value. Like marshal,
+    # nested dicts without a field are given the data of their parent.
+    items = [
+        (key, compile_field(field), isinstance(field, dict))
+        for key, field in template.items()]
+
+    def serialize(data: Any) -> Any:
+        if isinstance(data, (list, tuple)):
+            return [serialize(item) for item in data]
+        if type(data) is dict:
+            return {
+                key: convert(
+                    data if parent
+                    else data[key] if key in data
+                    else getattr(data, key, None))
+                for key, convert, parent in items}
+        return {
+            key: convert(data if parent else get_value(key, data))
+            for key, convert, parent in items}
+    return serialize
+
+
+def compile_field(field: Any) -> Callable[[Any], Any]:
+    if isinstance(field, dict):
+        return compile_template(field)
+    field = field() if isinstance(field, type) else field
+    if field.attribute is None:
+        if type(field) in FORMATS:
+            return compile_value(field)
+        if type(field) in (fields.Integer, fields.Float):
+            return compile_value(field, field.format)
+        if type(field) is fields.Nested:
+            return compile_nested(field)
+        if type(field) is fields.List:
+            return compile_list(field)
+    raise TypeError(f'{type(field).__name__} field is not supported')
+
+
+def compile_value(
+        field: fields.Raw,
+        format_: Optional[Callable[[Any], Any]] = None) \
+        -> Callable[[Any], Any]:
+    format_ = format_ or FORMATS[type(field)]
+    default = field.default
+    if format_ is None:
+        return lambda value: default if value is None else value
+    return lambda value: default if value is None else format_(value)
+
+
+def compile_nested(field: fields.Nested) -> Callable[[Any], Any]:
+    serialize = compile_template(field.nested)
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            if field.allow_null:
+                return None
+            if field.default is not None:
+                return field.default
+        return serialize(value)
+    return convert
+
+
+def compile_list(field: fields.List) -> Callable[[Any], Any]:
+    container = field.container
+    scalar = type(container) is not fields.Nested \
+        and type(container) is not fields.Raw
+    item = compile_field(container)
+
+    def convert(value: Any) -> Any:
+        if type(value) in (list, tuple):
+            if scalar and any(isinstance(val, dict) for val in value):
+                return field.format(value)
+            return [item(val) for val in value]
+        if value is None:
+            return field.default
+        if is_indexable_but_not_string(value) and not isinstance(value, dict):
+            return field.format(value)
+        return [marshal(value, container.nested)]
+    return convert
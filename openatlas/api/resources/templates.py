@@ -40,26 +40,6 @@ def geojson_collection_template() -> dict[str, Any]:
             fields.Nested(geojson_template()))}
 
 
-def geometries_template() -> dict[str, Any]:
-    properties = {
-        'id': fields.Integer,
-        'name': fields.String,
-        'description': fields.String,
-        'locationId': fields.Integer,
-        'objectId': fields.Integer,
-        'objectDescription': fields.String,
-        'objectName': fields.String,
-        'objectType': fields.String,
-        'shapeType': fields.String}
-
-    feature = {
-        'type': fields.String,
-        'geometry': fields.Raw,
-        'properties': fields.Nested(properties)}
-
-    return {'type': fields.String, 'features': fields.Nested(feature)}
-
-
 def linked_places_template(parser: dict[str, Any]) -> dict[str, Type[String]]:
     title = {'title': fields.String}
     depictions = {
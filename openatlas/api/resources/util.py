@@ -1,11 +1,13 @@
 import ast
+import re
 from typing import Any, Optional
 
 import numpy
-from flask import g, json
+from flask import g, url_for
 from numpy import datetime64
 
-from openatlas.api.resources.error import InvalidSearchSyntax
+from openatlas.api.resources.error import (
+    InvalidBoundingBoxError, InvalidSearchSyntax)
 from openatlas.api.resources.model_mapper import get_entities_by_ids
 from openatlas.models.entity import Entity
 from openatlas.models.gis import Gis
@@ -13,6 +15,27 @@ from openatlas.models.link import Link
 from openatlas.models.reference_system import ReferenceSystem
 
 
+URL_MARKER = 918273645546372819
+
+
+def get_api_url(endpoint: str, **values: Any) -> str:
+    # URL building is slow for thousands of links, so the external URL of an
+    # endpoint is built once per request with a marker for the id
+    ((key, value),) = values.items()
+    if not (type(value) is int and value > 0) and not (
+            type(value) is str and re.fullmatch('[1-9][0-9]*', value)):
+        return url_for(endpoint, _external=True, **values)
+    urls = g.setdefault('api_urls', {})
+    if (endpoint, key) not in urls:
+        marker: dict[str, Any] = {key: URL_MARKER}
+        urls[(endpoint, key)] = url_for(
+            endpoint,
+            _external=True,
+            **marker).partition(str(URL_MARKER))
+    prefix, _, suffix = urls[(endpoint, key)]
+    return f'{prefix}{value}{suffix}'
+
+
 def get_license_name(entity: Entity) -> Optional[str]:
     license_ = ''
     for type_ in entity.types:
@@ -229,29 +252,38 @@ def get_geoms_by_entity(
     return {'type': 'GeometryCollection', 'geometries': geoms}
 
 
-def get_geometries(parser: dict[str, Any]) -> list[dict[str, Any]]:
-    choices = [
-        'gisPointAll', 'gisPointSupers', 'gisPointSubs',
-        'gisPointSibling', 'gisLineAll', 'gisPolygonAll']
-    all_geoms = Gis.get_all()
-    out = []
-    for item in choices \
-            if 'gisAll' in parser['geometry'] else parser['geometry']:
-        for geom in json.loads(all_geoms[item]):
-            out.append(geom)
-    return out
-
-
-def filter_link_list_by_property_codes(
-        links: list[dict[str, Any]],
-        codes: list[str]) -> list[dict[str, str]]:
-    data = []
-    for link_ in links:
-        if link_['property_code'] in codes:
-            data.append({
-                'domain_id': link_['domain_id'],
-                'range_id': link_['range_id']})
-    return data
+def get_geometries(parser: dict[str, Any]) -> tuple[str, int]:
+    # Features of the cached layers as JSON array and their count
+    layers = {
+        'gisPointAll': 'point',
+        'gisLineAll': 'linestring',
+        'gisPolygonAll': 'polygon'}
+    items = [
+        item for item in (
+            layers if 'gisAll' in parser['geometry'] else parser['geometry'])
+        if item in layers]  # Supers, subs and siblings are always empty
+    if parser['bbox']:
+        if not items:
+            return '[]', 0
+        return Gis.get_by_bbox(
+            get_bounding_box(parser['bbox']),
+            parser['zoom'],
+            [layers[item] for item in items])
+    cache = Gis.get_layers()
+    selected = [cache[layers[item]] for item in items]
+    features = ','.join(
+        layer['geojson'][1:-1] for layer in selected if layer['count'])
+    return f'[{features}]', sum(layer['count'] for layer in selected)
+
+
+def get_bounding_box(bbox: str) -> tuple[float, float, float, float]:
+    try:
+        west, south, east, north = (float(value) for value in bbox.split(','))
+    except ValueError as e:
+        raise InvalidBoundingBoxError from e
+    if not -180 <= west <= east <= 180 or not -90 <= south <= north <= 90:
+        raise InvalidBoundingBoxError
+    return west, south, east, north
 
 
 def date_to_str(date: Any) -> Optional[str]:
@@ -0,0 +1,303 @@
+from typing import Any, Optional
+
+from flask import g
+
+from openatlas.database.entity import select_sql
+
+
+def get_count(query: dict[str, Any]) -> int:
+    g.cursor.execute(
+        f"SELECT COUNT(*) FROM model.entity e WHERE {where_sql(query)};",
+        get_parameters(query))
+    return g.cursor.fetchone()['count']
+
+
+def get_entities(query: dict[str, Any]) -> list[dict[str, Any]]:
+    g.cursor.execute(
+        select_sql(types=True, aliases=True) +
+        f" WHERE {where_sql(query)} GROUP BY e.id;",
+        get_parameters(query))
+    return [dict(row) for row in g.cursor.fetchall()]
+
+
+def get_page_start_ids(query: dict[str, Any]) -> list[int]:
+    g.cursor.execute(
+        f"""
+        SELECT id FROM (
+            SELECT
+                e.id,
+                row_number() OVER (ORDER BY {order_sql(query)}) AS number
+            FROM model.entity e
+            WHERE {where_sql(query)}) r
+        WHERE (number - 1) %% %(limit)s = 0
+        ORDER BY number;
+        """,
+        get_parameters(query))
+    return [row['id'] for row in g.cursor.fetchall()]
+
+
+def is_in_result(query: dict[str, Any], id_: int) -> bool:
+    g.cursor.execute(
+        f"""
+        SELECT EXISTS (
+            SELECT 1 FROM model.entity e
+            WHERE e.id = %(start_id)s AND {where_sql(query)});
+        """,
+        get_parameters(query) | {'start_id': id_})
+    return g.cursor.fetchone()['exists']
+
+
+def get_page_ids(
+        query: dict[str, Any],
+        start_id: Optional[int] = None,
+        inclusive: bool = True) -> list[int]:
+    start_clause = ''
+    if start_id:
+        key = sort_key_sql(query)
+        operator = '<' if query['desc'] else '>'
+        start_clause = f"""
+            AND ({key}, e.id) {operator}{'=' if inclusive else ''} (
+                SELECT {key}, e.id
+                FROM model.entity e
+                WHERE e.id = %(start_id)s)"""
+    g.cursor.execute(
+        f"""
+        SELECT e.id
+        FROM model.entity e
+        WHERE {where_sql(query)} {start_clause}
+        ORDER BY {order_sql(query)}
+        LIMIT %(limit)s;
+        """,
+        get_parameters(query) | {'start_id': start_id})
+    return [row['id'] for row in g.cursor.fetchall()]
+
+
+def where_sql(query: dict[str, Any]) -> str:
+    clauses = []
+    if query.get('ids'):
+        clauses.append('e.id IN %(ids)s')
+    if query.get('classes'):
+        clauses.append('e.openatlas_class_name IN %(classes)s')
+    if query.get('cidoc_classes'):
+        clauses.append('e.cidoc_class_code IN %(cidoc_classes)s')
+    sql = f"({' OR '.join(clauses)})" if clauses else 'FALSE'
+    if query.get('type_ids'):
+        sql += """
+            AND EXISTS (
+                SELECT 1 FROM model.link t
+                WHERE t.domain_id = e.id
+                    AND t.property_code IN ('P2', 'P89')
+                    AND t.range_id IN %(type_ids)s)"""
+    if query.get('search'):
+        sql += f" AND ({search_sql(query['search'])[0]})"
+    return sql
+
+
+SEARCH_ARRAYS = {
+    'entityID': 'ARRAY[e.id]',
+    'entityName': 'ARRAY[lower(e.name)]',
+    'entityDescription': """
+        CASE WHEN COALESCE(e.description, '') = '' THEN ARRAY[]::text[]
+        ELSE ARRAY[lower(e.description)] END""",
+    'entityAliases': """
+        ARRAY(
+            SELECT lower(a.name)
+            FROM model.link la
+            JOIN model.entity a ON la.range_id = a.id
+            WHERE la.domain_id = e.id AND la.property_code = 'P1')""",
+    'entityCidocClass': 'ARRAY[lower(e.cidoc_class_code)]',
+    'entitySystemClass': 'ARRAY[lower(e.openatlas_class_name)]',
+    'typeName': """
+        ARRAY(
+            SELECT lower(t.name)
+            FROM model.link lt
+            JOIN model.entity t ON lt.range_id = t.id
+            WHERE lt.domain_id = e.id
+                AND lt.property_code IN ('P2', 'P89'))""",
+    'typeID': """
+        ARRAY(
+            SELECT lt.range_id
+            FROM model.link lt
+            WHERE lt.domain_id = e.id
+                AND lt.property_code IN ('P2', 'P89'))"""}
+SEARCH_ARRAYS['typeIDWithSubs'] = SEARCH_ARRAYS['typeID']
+SEARCH_DATES = {
+    'beginFrom': 'begin_from',
+    'beginTo': 'begin_to',
+    'endFrom': 'end_from',
+    'endTo': 'end_to'}
+SEARCH_OPERATORS = {
+    'equal': '=',
+    'notEqual': '!=',
+    'greaterThan': '>',
+    'greaterThanEqual': '>=',
+    'lesserThan': '<',
+    'lesserThanEqual': '<='}
+
+
+def search_sql(search: list[dict[str, Any]]) -> tuple[str, dict[str, Any]]:
+    # Search parameters are combined with OR, parameters are named by
+    # position so the same SQL and values are built for every call.
+    params: dict[str, Any] = {}
+    clauses = [
+        search_clause(item, f'search_{i}', params)
+        for i, item in enumerate(search)]
+    return ' OR '.join(clauses), params
+
+
+def search_clause(
+        item: dict[str, Any],
+        name: str,
+        params: dict[str, Any]) -> str:
+    if item['category'] in SEARCH_DATES:
+        return search_date_clause(item, name, params)
+    if item['category'] == 'relationToID':
+        return search_relation_clause(item, name, params)
+    if item['category'] == 'valueTypeID':
+        return search_value_type_clause(item, name, params)
+    array = SEARCH_ARRAYS.get(item['category'], 'ARRAY[]::text[]')
+    values = item['values']
+    any_ = item['logical_operator'] == 'or'
+    if item['category'] == 'typeIDWithSubs':
+        if any_:
+            values = [id_ for ids in values for id_ in ids]
+        elif item['operator'] not in ['equal', 'notEqual']:
+            return 'TRUE'
+        else:
+            clauses = []
+            for i, ids in enumerate(values):
+                params[f'{name}_{i}'] = ids
+                clauses.append(f"(({array}) && %({name}_{i})s)")
+            sql = ' AND '.join(
+                f"NOT {clause}" if item['operator'] == 'notEqual'
+                else clause for clause in clauses)
+            return f'({sql})'
+    if item['category'] in ['entityID', 'typeID', 'typeIDWithSubs']:
+        params[name] = [value for value in values if isinstance(value, int)]
+    else:
+        params[name] = [str(value) for value in values]
+    match item['operator']:
+        case 'equal':
+            return f"({array}) {'&&' if any_ else '@>'} %({name})s"
+        case 'notEqual':
+            return f"NOT (({array}) {'&&' if any_ else '@>'} %({name})s)"
+        case 'like' if any_:
+            return f"""EXISTS (
+                SELECT 1 FROM unnest({array}) v, unnest(%({name})s::text[]) s
+                WHERE strpos(v, s) > 0)"""
+        case 'like':
+            return f"""(
+                cardinality({array}) > 0
+                AND NOT EXISTS (
+                    SELECT 1 FROM unnest(%({name})s::text[]) s
+                    WHERE strpos(array_to_string({array}, ' '), s) = 0))"""
+    return 'FALSE'  # Comparison operators are only valid for dates and values
+
+
+def search_date_clause(
+        item: dict[str, Any],
+        name: str,
+        params: dict[str, Any]) -> str:
+    # Dates are compared as text in the format of numpy.datetime64
+    column = f"e.{SEARCH_DATES[item['category']]}"
+    year = f"extract(year FROM {column})"
+    date = f"""(
+        CASE
+            WHEN {year} = -1 THEN '0000'
+            WHEN {year} < 0 THEN '-' || to_char(-1 - {year}, 'FM999000')
+            ELSE to_char({column}, 'YYYY')
+        END || to_char({column}, '-MM-DD"T"HH24:MI:SS'))"""
+    params[name] = [str(value) for value in item['values']]
+    any_ = item['logical_operator'] == 'or'
+    match item['operator']:
+        case 'equal' | 'like' | 'notEqual':
+            sql = f"""{'' if any_ else 'NOT '}EXISTS (
+                SELECT 1 FROM unnest(%({name})s::text[]) s
+                WHERE strpos({date}, s) {'>' if any_ else '='} 0)"""
+            if item['operator'] == 'notEqual':
+                sql = f'NOT {sql}'
+        case _:
+            sql = \
+                f"{date} COLLATE \"C\" {SEARCH_OPERATORS[item['operator']]} " \
+                f"{'ANY' if any_ else 'ALL'}(%({name})s::text[])"
+    return f'({column} IS NOT NULL AND {sql})'
+
+
+def search_relation_clause(
+        item: dict[str, Any],
+        name: str,
+        params: dict[str, Any]) -> str:
+    if item['operator'] not in ['equal', 'notEqual']:
+        return 'FALSE'
+    clauses = []
+    for i, id_ in enumerate(
+            [value for value in item['values'] if isinstance(value, int)]):
+        params[f'{name}_{i}'] = id_
+        clauses.append(f"""
+            EXISTS (
+                SELECT 1 FROM model.link lr
+                WHERE (lr.domain_id = e.id AND lr.range_id = %({name}_{i})s)
+                    OR (lr.range_id = e.id AND lr.domain_id = %({name}_{i})s))
+            """)
+    sql = (' OR ' if item['logical_operator'] == 'or' else ' AND ').join(
+        clauses) or 'FALSE'
+    return f"{'NOT ' if item['operator'] == 'notEqual' else ''}({sql})"
+
+
+def search_value_type_clause(
+        item: dict[str, Any],
+        name: str,
+        params: dict[str, Any]) -> str:
+    if item['operator'] not in SEARCH_OPERATORS:
+        return 'FALSE'
+    clauses = []
+    for i, (type_id, value) in enumerate(item['values']):
+        params[f'{name}_{i}_type'] = type_id
+        params[f'{name}_{i}_value'] = value
+        clauses.append(f"""
+            EXISTS (
+                SELECT 1 FROM model.link lv
+                WHERE lv.domain_id = e.id
+                    AND lv.range_id = %({name}_{i}_type)s
+                    AND CASE
+                        WHEN lv.description ~ %(number_pattern)s
+                        THEN lv.description::double precision END
+                    {SEARCH_OPERATORS[item['operator']]}
+                    %({name}_{i}_value)s)
+            """)
+    params['number_pattern'] = \
+        r'^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$'
+    sql = (' OR ' if item['logical_operator'] == 'or' else ' AND ').join(
+        clauses)
+    return f'({sql})'
+
+
+def sort_key_sql(query: dict[str, Any]) -> str:
+    match query['column']:
+        case 'id':
+            return 'e.id'
+        case 'cidoc_class':  # Ordered by translated names, see cidoc_order
+            return 'array_position(%(cidoc_order)s, e.cidoc_class_code)'
+        case 'system_class':
+            return 'e.openatlas_class_name COLLATE "C"'
+        case 'begin_from' | 'begin_to' | 'end_from' | 'end_to':
+            # Entities without dates are listed last in both directions
+            infinity = '-infinity' if query['desc'] else 'infinity'
+            return f"COALESCE(e.{query['column']}, '{infinity}'::timestamp)"
+    return 'e.name COLLATE "C"'
+
+
+def order_sql(query: dict[str, Any]) -> str:
+    direction = 'DESC' if query['desc'] else 'ASC'
+    return f'{sort_key_sql(query)} {direction}, e.id {direction}'
+
+
+def get_parameters(query: dict[str, Any]) -> dict[str, Any]:
+    return {
+        'ids': tuple(query.get('ids') or []) or None,
+        'classes': tuple(query.get('classes') or []) or None,
+        'cidoc_classes': tuple(query.get('cidoc_classes') or []) or None,
+        'type_ids': tuple(query.get('type_ids') or []) or None,
+        'cidoc_order': query.get('cidoc_order'),
+        'limit': query.get('limit')} | (
+            search_sql(query['search'])[1] if query.get('search') else {})
@@ -4,14 +4,18 @@ from flask import g
 
 
 def get_classes() -> list[dict[str, Any]]:
+    g.cursor.execute('SELECT id, code, name, comment FROM model.cidoc_class;')
+    return [dict(row) for row in g.cursor.fetchall()]
+
+
+def get_class_count() -> dict[str, int]:
     g.cursor.execute(
         """
-        SELECT c.id, c.code, c.name, comment, COUNT(e.id) AS count
-        FROM model.cidoc_class c
-        LEFT JOIN model.entity e ON c.code = e.cidoc_class_code
-        GROUP BY (c.id, c.name, c.comment);
+        SELECT cidoc_class_code AS code, COUNT(*) AS count
+        FROM model.entity
+        GROUP BY cidoc_class_code;
         """)
-    return [dict(row) for row in g.cursor.fetchall()]
+    return {row['code']: row['count'] for row in g.cursor.fetchall()}
 
 
 def get_hierarchy() -> list[dict[str, Any]]:
@@ -7,28 +7,28 @@ def get_properties() -> list[dict[str, Any]]:
     g.cursor.execute(
         """
         SELECT
-            p.id,
-            p.code,
-            p.comment,
-            p.domain_class_code,
-            p.range_class_code,
-            p.name,
-            p.name_inverse,
-            COUNT(l.id) AS count
-        FROM model.property p
-        LEFT JOIN model.link l ON p.code = l.property_code
-        GROUP BY (
-            p.id,
-            p.code,
-            p.comment,
-            p.domain_class_code,
-            p.range_class_code,
-            p.name,
-            p.name_inverse);
+            id,
+            code,
+            comment,
+            domain_class_code,
+            range_class_code,
+            name,
+            name_inverse
+        FROM model.property;
         """)
     return [dict(row) for row in g.cursor.fetchall()]
 
 
+def get_property_count() -> dict[str, int]:
+    g.cursor.execute(
+        """
+        SELECT property_code AS code, COUNT(*) AS count
+        FROM model.link
+        GROUP BY property_code;
+        """)
+    return {row['code']: row['count'] for row in g.cursor.fetchall()}
+
+
 def get_hierarchy() -> list[dict[str, Any]]:
     g.cursor.execute(
         'SELECT super_code, sub_code FROM model.property_inheritance;')
@@ -1,8 +1,16 @@
-from typing import Any
+import os
+import time
+from collections import Counter
+from itertools import count
+from threading import Condition, Lock
+from typing import Any, Iterator, Optional
 
-from flask import g
-from psycopg2 import connect
-from psycopg2.extensions import connection
+from flask import current_app, g
+from psycopg2 import Error, connect, extras
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, connection
+from psycopg2.pool import PoolError
+
+cursor_names = count()
 
 
 def open_connection(config: dict[str, Any]) -> connection:
@@ -14,9 +22,153 @@ def open_connection(config: dict[str, Any]) -> connection:
         host=config['DATABASE_HOST'])
 
 
+class ConnectionPool:
+    # Connections of a process are kept open and reused for requests.
+    # Connections idle for DATABASE_POOL_CHECK seconds are tested before
+    # reuse and replaced if broken or older than DATABASE_POOL_MAX_LIFETIME.
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        self.config = config
+        self.pid = os.getpid()
+        self.condition = Condition()
+        self.idle: list[tuple[connection, float, float]] = []
+        self.used: dict[int, float] = {}
+        self.active = 0  # Connections handed out or about to be
+        self.statistics: Counter[str] = Counter()
+        for _ in range(config['DATABASE_POOL_MIN']):
+            self.idle.append((self.create(), time.time(), time.time()))
+
+    def create(self) -> connection:
+        self.statistics['created'] += 1
+        return open_connection(self.config)
+
+    def get(self) -> connection:
+        deadline = time.time() + self.config['DATABASE_POOL_TIMEOUT']
+        with self.condition:
+            while not self.idle \
+                    and self.active >= self.config['DATABASE_POOL_MAX']:
+                self.statistics['waits'] += 1
+                if not self.condition.wait(deadline - time.time()):
+                    raise PoolError('connection pool exhausted')
+            self.active += 1
+            self.statistics['requests'] += 1
+            item = self.idle.pop() if self.idle else None
+        try:
+            while item and not self.check(*item):
+                with self.condition:
+                    item = self.idle.pop() if self.idle else None
+            connection_, created = \
+                (item[0], item[1]) if item else (self.create(), time.time())
+        except Exception:
+            with self.condition:
+                self.active -= 1
+                self.condition.notify()
+            raise
+        with self.condition:
+            self.used[id(connection_)] = created
+        return connection_
+
+    def check(
+            self,
+            connection_: connection,
+            created: float,
+            returned: float) -> bool:
+        now = time.time()
+        if now - created > self.config['DATABASE_POOL_MAX_LIFETIME']:
+            self.statistics['expired'] += 1
+            connection_.close()
+            return False
+        if now - returned > self.config['DATABASE_POOL_CHECK']:
+            try:
+                with connection_.cursor() as cursor:
+                    cursor.execute('SELECT 1;')
+            except Error:
+                self.statistics['failed checks'] += 1
+                connection_.close()
+                return False
+        return True
+
+    def put(self, connection_: connection, open_cursors: int = 0) -> None:
+        # A transaction left open, e.g. by a failed request, is rolled back
+        # and WITH HOLD cursors of unfinished iterate() calls are closed
+        if not connection_.closed and (
+                open_cursors or connection_.info.transaction_status
+                != TRANSACTION_STATUS_IDLE):
+            try:
+                with connection_.cursor() as cursor:
+                    if connection_.info.transaction_status \
+                            != TRANSACTION_STATUS_IDLE:
+                        cursor.execute('ROLLBACK;')
+                    if open_cursors:
+                        cursor.execute('CLOSE ALL;')
+            except Error:
+                connection_.close()
+        with self.condition:
+            if (created := self.used.pop(id(connection_), None)) is None:
+                connection_.close()
+                return
+            self.active -= 1
+            if connection_.closed:
+                self.statistics['discarded'] += 1
+            else:
+                self.idle.append((connection_, created, time.time()))
+            self.condition.notify()
+
+    def get_statistics(self) -> dict[str, int]:
+        with self.condition:
+            return {
+                'in use': self.active,
+                'idle': len(self.idle),
+                'maximum': self.config['DATABASE_POOL_MAX'],
+                **self.statistics}
+
+
+pool: Optional[ConnectionPool] = None
+pool_lock = Lock()
+
+
+def get_connection(config: dict[str, Any]) -> connection:
+    global pool
+    with pool_lock:
+        if not pool or pool.pid != os.getpid():  # New process, e.g. fork
+            pool = ConnectionPool(config)
+    return pool.get()
+
+
 def close_connection() -> None:
     if hasattr(g, 'db'):
-        g.db.close()
+        if pool:
+            pool.put(g.db, g.get('open_cursors', 0))
+        else:
+            g.db.close()
+
+
+def get_pool_statistics() -> dict[str, int]:
+    return pool.get_statistics() if pool else {}
+
+
+def iterate(
+        sql: str,
+        params: Optional[dict[str, Any]] = None,
+        size: Optional[int] = None) -> Iterator[dict[str, Any]]:
+    # Server side cursor to fetch rows in batches, it is declared WITH HOLD
+    # because named cursors can't be used in autocommit mode otherwise.
+    # Rows are yielded lazily so the generator has to be consumed while the
+    # connection is open, e.g. with stream_with_context for responses.
+    state = g._get_current_object()  # Generator may close after request
+    state.open_cursors += 1
+    try:
+        with g.db.cursor(
+                name=f'iterate_{next(cursor_names)}',
+                cursor_factory=extras.DictCursor,
+                withhold=True) as cursor:
+            cursor.itersize = \
+                size or current_app.config['DATABASE_FETCH_SIZE']
+            cursor.execute(sql, params)
+            for row in cursor:
+                yield dict(row)
+    finally:
+        state.open_cursors -= 1
 
 
 class Transaction:
@@ -32,3 +184,4 @@ class Transaction:
     @staticmethod
     def rollback() -> None:
         g.cursor.execute('ROLLBACK')
+        g.rollback = True  # Cached model data may have been changed
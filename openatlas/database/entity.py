@@ -1,7 +1,9 @@
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from flask import g
 
+from openatlas.database.connect import iterate
+
 
 def get_by_id(
         id_: int,
@@ -81,6 +83,113 @@ def get_by_class(
     return [dict(row) for row in g.cursor.fetchall()]
 
 
+def iterate_by_class(
+        classes: str | list[str],
+        types: bool = False,
+        aliases: bool = False) -> Iterator[dict[str, Any]]:
+    return iterate(
+        select_sql(types, aliases) +
+        ' WHERE e.openatlas_class_name IN %(class)s GROUP BY e.id;',
+        {'class': tuple(classes if isinstance(classes, list) else [classes])})
+
+
+def get_ids_by_class(classes: str | list[str]) -> Iterator[int]:
+    for row in iterate(
+            """
+            SELECT id
+            FROM model.entity
+            WHERE openatlas_class_name IN %(class)s;
+            """,
+            {'class': tuple(
+                classes if isinstance(classes, list) else [classes])}):
+        yield row['id']
+
+
+def get_table_count(query: dict[str, Any], search: bool = False) -> int:
+    g.cursor.execute(
+        f"""
+        SELECT COUNT(*)
+        FROM model.entity e
+        WHERE {table_where_sql(query, search)};
+        """,
+        table_parameters(query))
+    return g.cursor.fetchone()['count']
+
+
+def get_table_page_ids(query: dict[str, Any]) -> list[int]:
+    direction = 'DESC' if query['desc'] else 'ASC'
+    g.cursor.execute(
+        f"""
+        SELECT e.id
+        FROM model.entity e
+        WHERE {table_where_sql(query)}
+        ORDER BY {table_sort_key_sql(query)} {direction}, e.id {direction}
+        LIMIT %(limit)s OFFSET %(offset)s;
+        """,
+        table_parameters(query))
+    return [row['id'] for row in g.cursor.fetchall()]
+
+
+def table_where_sql(query: dict[str, Any], search: bool = True) -> str:
+    sql = 'e.openatlas_class_name IN %(classes)s'
+    if query.get('exclude_ids'):
+        sql += ' AND e.id NOT IN %(exclude_ids)s'
+    if search and query.get('search'):
+        sql += """
+            AND (
+                model.unaccent_lower(e.name)
+                    LIKE model.unaccent_lower(%(search)s)
+                OR EXISTS (
+                    SELECT 1
+                    FROM model.link la
+                    JOIN model.entity a ON la.range_id = a.id
+                    WHERE la.domain_id = e.id
+                        AND la.property_code = 'P1'
+                        AND model.unaccent_lower(a.name)
+                            LIKE model.unaccent_lower(%(search)s)))"""
+    return sql
+
+
+def table_sort_key_sql(query: dict[str, Any]) -> str:
+    match query['column']:
+        case 'class':  # Ordered by translated labels, see class_order
+            return """
+                array_position(
+                    %(class_order)s::text[],
+                    e.openatlas_class_name)"""
+        case 'type' | 'license':  # Ordered by type names, see type_order
+            return """(
+                SELECT min(
+                    array_position(%(type_order)s::integer[], t.range_id))
+                FROM model.link t
+                WHERE t.domain_id = e.id AND t.property_code = 'P2')"""
+        case 'begin':
+            return 'e.begin_from'
+        case 'end':
+            return 'COALESCE(e.end_to, e.end_from)'
+        case 'date':
+            return 'e.created'
+        case 'description':
+            return 'e.description'
+        case 'size' | 'extension':
+            return f"""(
+                SELECT f.{query['column']}
+                FROM web.file_info f
+                WHERE f.entity_id = e.id)"""
+    return 'e.name'
+
+
+def table_parameters(query: dict[str, Any]) -> dict[str, Any]:
+    return {
+        'classes': tuple(query['classes']),
+        'search': f"%{query['search']}%" if query.get('search') else None,
+        'exclude_ids': tuple(query.get('exclude_ids') or []) or None,
+        'class_order': query.get('class_order'),
+        'type_order': query.get('type_order'),
+        'limit': query.get('limit'),
+        'offset': query.get('offset')}
+
+
 def get_by_cidoc_class(
         code: str | list[str],
         types: bool = False,
@@ -146,8 +255,8 @@ def get_latest(classes: list[str], limit: int) -> list[dict[str, Any]]:
     return [dict(row) for row in g.cursor.fetchall()]
 
 
-def get_all_entities() -> list[dict[str, Any]]:
-    g.cursor.execute(
+def get_all_entities() -> Iterator[dict[str, Any]]:
+    return iterate(
         """
         SELECT
             e.id,
@@ -169,9 +278,9 @@ def get_all_entities() -> list[dict[str, Any]]:
             e.end_comment,
             COALESCE(to_char(e.end_to, 'yyyy-mm-dd hh24:mi:ss BC'), '')
                 AS end_to
-        FROM model.entity e;
+        FROM model.entity e
+        ORDER BY e.openatlas_class_name, e.id;
         """)
-    return [dict(row) for row in g.cursor.fetchall()]
 
 
 def get_circular() -> list[dict[str, Any]]:
@@ -291,9 +400,12 @@ def search(
         own: bool = False,
         user_id: Optional[int] = None) -> list[dict[str, Any]]:
     description_clause = """
-        OR UNACCENT(lower(e.description)) LIKE UNACCENT(lower(%(term)s))
-        OR UNACCENT(lower(e.begin_comment)) LIKE UNACCENT(lower(%(term)s))
-        OR UNACCENT(lower(e.end_comment)) LIKE UNACCENT(lower(%(term)s))"""
+        OR model.unaccent_lower(e.description)
+            LIKE model.unaccent_lower(%(term)s)
+        OR model.unaccent_lower(e.begin_comment)
+            LIKE model.unaccent_lower(%(term)s)
+        OR model.unaccent_lower(e.end_comment)
+            LIKE model.unaccent_lower(%(term)s)"""
     g.cursor.execute(
         select_sql() +
         f"""
@@ -301,7 +413,8 @@ def search(
         WHERE e.openatlas_class_name IN %(classes)s
             {'AND ul.user_id = %(user_id)s' if own else ''}
             AND (
-                UNACCENT(LOWER(e.name)) LIKE UNACCENT(LOWER(%(term)s))
+                model.unaccent_lower(e.name)
+                    LIKE model.unaccent_lower(%(term)s)
                 {description_clause if desc else ''})
         GROUP BY e.id
         ORDER BY e.name;
@@ -0,0 +1,52 @@
+from typing import Any, Optional
+
+from flask import g
+
+
+def get_files(ids: Optional[list[int]] = None) -> list[dict[str, Any]]:
+    g.cursor.execute(
+        f"""
+        SELECT entity_id, extension, size, created, modified, variants
+        FROM web.file_info
+        {'WHERE entity_id IN %(ids)s' if ids else ''};
+        """,
+        {'ids': tuple(ids) if ids else None})
+    return [dict(row) for row in g.cursor.fetchall()]
+
+
+def insert(data: dict[str, Any]) -> None:
+    g.cursor.execute(
+        """
+        INSERT INTO web.file_info
+            (entity_id, extension, size, created, modified)
+        VALUES (
+            %(entity_id)s,
+            %(extension)s,
+            %(size)s,
+            %(created)s,
+            %(modified)s)
+        ON CONFLICT (entity_id) DO UPDATE SET
+            extension = EXCLUDED.extension,
+            size = EXCLUDED.size,
+            created = EXCLUDED.created,
+            modified = EXCLUDED.modified,
+            variants = '{}';
+        """,
+        data)
+
+
+def add_variants(id_: int, variants: list[str]) -> None:
+    g.cursor.execute(
+        """
+        UPDATE web.file_info
+        SET variants = ARRAY(
+            SELECT DISTINCT unnest(variants || %(variants)s::text[]))
+        WHERE entity_id = %(id_)s;
+        """,
+        {'id_': id_, 'variants': variants})
+
+
+def delete(ids: list[int]) -> None:
+    g.cursor.execute(
+        "DELETE FROM web.file_info WHERE entity_id IN %(ids)s;",
+        {'ids': tuple(ids)})
@@ -1,8 +1,10 @@
 import ast
-from typing import Any
+from typing import Any, Iterator, Optional
 
 from flask import g
 
+from openatlas.database.connect import iterate
+
 
 def get_by_id(id_: int) -> list[dict[str, Any]]:
     geometries = []
@@ -108,7 +110,9 @@ def get_wkt_by_id(id_: int) -> list[dict[str, Any]]:
     return geometries
 
 
-def get_all(extra_ids: list[int]) -> list[dict[str, Any]]:
+def get_by_object_ids(ids: list[int]) -> list[dict[str, Any]]:
+    if not ids:
+        return []
     g.cursor.execute(
         """
         SELECT
@@ -135,14 +139,221 @@ def get_all(extra_ids: list[int]) -> list[dict[str, Any]]:
             AND t.property_code = 'P2'
         WHERE place.cidoc_class_code = 'E53'
             AND l.property_code = 'P53'
-            AND (object.openatlas_class_name = 'place'
-                OR object.id IN %(extra_ids)s)
+            AND object.id IN %(ids)s
         GROUP BY object.id, g.id;
         """,
-        {'extra_ids': tuple(extra_ids)})
+        {'ids': tuple(ids)})
     return [dict(row) for row in g.cursor.fetchall()]
 
 
+def get_layers() -> dict[str, dict[str, Any]]:
+    g.cursor.execute("SELECT name, geojson, count FROM web.gis_layer;")
+    return {row['name']: dict(row) for row in g.cursor.fetchall()}
+
+
+def insert_layers(type_ids: list[int]) -> dict[str, dict[str, Any]]:
+    # GeoJSON features of all places by shape, polygons are also added as
+    # points on their surface to the point layer. Has to run in a transaction
+    # to keep the lock, which waits for uncommitted changes that delete the
+    # layers with triggers, so no outdated data is inserted after them.
+    g.cursor.execute(
+        "SELECT pg_advisory_xact_lock('web.gis_layer'::regclass::bigint);")
+    g.cursor.execute(
+        f"""
+        INSERT INTO web.gis_layer (name, geojson, count)
+        SELECT
+            n.name,
+            COALESCE(layer.geojson, '[]'),
+            COALESCE(layer.count, 0)
+        FROM (VALUES ('point'), ('linestring'), ('polygon')) n(name)
+        LEFT JOIN (
+            SELECT
+                s.shape,
+                json_agg(
+                    {feature_sql('s.geom')}
+                    ORDER BY g.id, s.number)::text AS geojson,
+                COUNT(*) AS count
+            FROM model.entity place
+            JOIN model.link l ON place.id = l.range_id
+                AND l.property_code = 'P53'
+            JOIN model.entity object ON l.domain_id = object.id
+                AND object.openatlas_class_name = 'place'
+            JOIN model.gis g ON place.id = g.entity_id
+            CROSS JOIN LATERAL (VALUES
+                (1, 'point', g.geom_point),
+                (2, 'point', public.ST_PointOnSurface(g.geom_polygon)),
+                (3, 'linestring', g.geom_linestring),
+                (4, 'polygon', g.geom_polygon)) s(number, shape, geom)
+            WHERE place.cidoc_class_code = 'E53' AND s.geom IS NOT NULL
+            GROUP BY s.shape) layer ON layer.shape = n.name
+        ON CONFLICT (name) DO UPDATE SET
+            geojson = EXCLUDED.geojson,
+            count = EXCLUDED.count
+        RETURNING name, geojson, count;
+        """,
+        {'type_ids': type_ids})
+    return {row['name']: dict(row) for row in g.cursor.fetchall()}
+
+
+def get_by_bbox(
+        bbox: tuple[float, float, float, float],
+        shapes: list[str],
+        type_ids: list[int],
+        tolerance: float,
+        cell: float) -> dict[str, Any]:
+    # Features within the bounding box, lines and polygons are simplified
+    # with the given tolerance. If a cell size is given, points are clustered
+    # on a grid and cells with more than one point are returned as a single
+    # feature with their count.
+    unclustered = 'TRUE'
+    clustered = ''
+    if cell:
+        unclustered = "f.shape != 'point'"
+        clustered = """
+            UNION ALL
+            SELECT
+                min(f.number),
+                CASE WHEN COUNT(*) = 1 THEN (array_agg(f.feature))[1]
+                ELSE json_build_object(
+                    'type', 'Feature',
+                    'geometry', public.ST_AsGeoJSON(
+                        public.ST_Centroid(public.ST_Collect(f.geom)))::json,
+                    'properties', json_build_object(
+                        'cluster', true,
+                        'count', COUNT(*))) END
+            FROM features f
+            WHERE f.shape = 'point'
+            GROUP BY
+                floor(public.ST_X(f.geom) / %(cell)s),
+                floor(public.ST_Y(f.geom) / %(cell)s)"""
+    g.cursor.execute(
+        f"""
+        WITH features AS (
+            SELECT
+                s.shape,
+                s.geom,
+                row_number() OVER (ORDER BY s.number, g.id) AS number,
+                {feature_sql('s.geom')} AS feature
+            FROM model.gis g
+            JOIN model.entity place ON g.entity_id = place.id
+                AND place.cidoc_class_code = 'E53'
+            JOIN model.link l ON place.id = l.range_id
+                AND l.property_code = 'P53'
+            JOIN model.entity object ON l.domain_id = object.id
+                AND object.openatlas_class_name = 'place'
+            CROSS JOIN LATERAL (VALUES
+                (1, 'point', g.geom_point),
+                (2, 'point', public.ST_PointOnSurface(g.geom_polygon)),
+                (3, 'linestring', public.ST_SimplifyPreserveTopology(
+                    g.geom_linestring, %(tolerance)s)),
+                (4, 'polygon', public.ST_SimplifyPreserveTopology(
+                    g.geom_polygon, %(tolerance)s))) s(number, shape, geom)
+            CROSS JOIN (
+                SELECT public.ST_MakeEnvelope(
+                    %(west)s, %(south)s, %(east)s, %(north)s, 4326) AS geom
+                ) envelope
+            WHERE (
+                    g.geom_point && envelope.geom
+                    OR g.geom_linestring && envelope.geom
+                    OR g.geom_polygon && envelope.geom)
+                AND s.geom && envelope.geom
+                AND s.shape = ANY(%(shapes)s::text[]))
+        SELECT
+            COALESCE(json_agg(r.feature ORDER BY r.number)::text, '[]')
+                AS geojson,
+            COUNT(*) AS count
+        FROM (
+            SELECT f.number, f.feature
+            FROM features f
+            WHERE {unclustered}
+            {clustered}) r;
+        """,
+        {
+            'west': bbox[0],
+            'south': bbox[1],
+            'east': bbox[2],
+            'north': bbox[3],
+            'shapes': shapes,
+            'type_ids': type_ids,
+            'tolerance': tolerance,
+            'cell': cell})
+    return dict(g.cursor.fetchone())
+
+
+def get_extent() -> Optional[list[list[float]]]:
+    g.cursor.execute(
+        """
+        SELECT
+            public.ST_YMin(extent) AS south,
+            public.ST_XMin(extent) AS west,
+            public.ST_YMax(extent) AS north,
+            public.ST_XMax(extent) AS east
+        FROM (
+            SELECT public.ST_Extent(
+                COALESCE(geom_point, geom_linestring, geom_polygon)) AS extent
+            FROM model.gis) e;
+        """)
+    row = g.cursor.fetchone()
+    if row['south'] is None:
+        return None
+    return [[row['south'], row['west']], [row['north'], row['east']]]
+
+
+def feature_sql(geometry: str) -> str:
+    # GeoJSON feature of a place geometry, like the ones built in Gis.get_all
+    return f"""
+        json_build_object(
+            'type', 'Feature',
+            'geometry', public.ST_AsGeoJSON({geometry})::json,
+            'properties', json_build_object(
+                'id', g.id,
+                'name', COALESCE(g.name, ''),
+                'description', COALESCE(g.description, ''),
+                'locationId', g.entity_id,
+                'objectId', object.id,
+                'objectDescription', COALESCE(object.description, ''),
+                'objectName', object.name,
+                'objectType', (
+                    SELECT t.name
+                    FROM model.link lt
+                    JOIN model.entity t ON lt.range_id = t.id
+                    WHERE lt.domain_id = object.id
+                        AND lt.property_code = 'P2'
+                        AND t.id = ANY(%(type_ids)s::integer[])
+                    ORDER BY t.id
+                    LIMIT 1),
+                'shapeType', g.type))"""
+
+
+def get_all_geometries() -> Iterator[dict[str, Any]]:
+    # Polygons are also exported as points on their surface, like the
+    # point layer of the map
+    return iterate(
+        """
+        SELECT
+            g.id,
+            g.entity_id AS location_id,
+            object.id AS object_id,
+            COALESCE(g.name, '') AS name,
+            object.name AS object_name,
+            COALESCE(object.description, '') AS object_description,
+            public.ST_AsGeoJSON(s.geom) AS geojson
+        FROM model.entity place
+        JOIN model.link l ON place.id = l.range_id
+            AND l.property_code = 'P53'
+        JOIN model.entity object ON l.domain_id = object.id
+            AND object.openatlas_class_name = 'place'
+        JOIN model.gis g ON place.id = g.entity_id
+        CROSS JOIN LATERAL (VALUES
+            (1, g.geom_point),
+            (1, public.ST_PointOnSurface(g.geom_polygon)),
+            (2, g.geom_linestring),
+            (3, g.geom_polygon)) s(shape, geom)
+        WHERE place.cidoc_class_code = 'E53' AND s.geom IS NOT NULL
+        ORDER BY s.shape, g.id;
+        """)
+
+
 def test_geom(geometry: str) -> bool:
     g.cursor.execute(
         """
@@ -166,19 +377,6 @@ def insert(data: dict[str, Any], shape: str) -> None:
         data)
 
 
-def insert_import(data: dict[str, Any]) -> None:
-    g.cursor.execute(
-        """
-        INSERT INTO model.gis (
-            entity_id, name, description, type, geom_point
-        ) VALUES (
-            %(entity_id)s, '', %(description)s, 'centerpoint',
-            public.ST_SetSRID(public.ST_GeomFromGeoJSON(%(geojson)s),4326)
-        );
-        """,
-        data)
-
-
 def delete_by_entity_id(id_: int) -> None:
     g.cursor.execute(
         'DELETE FROM model.gis WHERE entity_id = %(id)s;',
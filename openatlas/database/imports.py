@@ -1,3 +1,5 @@
+import csv
+import io
 from typing import Any, Optional
 
 from flask import g
@@ -78,19 +80,114 @@ def update_project(id_: int, name: str, description: str) -> None:
         {'id': id_, 'name': name, 'description': description})
 
 
-def import_data(
+STAGING_COLUMNS = [
+    'number', 'name', 'description', 'origin_id', 'begin_from', 'begin_to',
+    'begin_comment', 'end_from', 'end_to', 'end_comment', 'type_ids',
+    'easting', 'northing', 'gis_description']
+
+
+def create_import_staging() -> None:
+    # Rows are copied into a temporary table which is dropped at the end of
+    # the transaction, entity ids are taken from the sequence while copying
+    g.cursor.execute(
+        """
+        CREATE TEMPORARY TABLE import_staging (
+            entity_id integer DEFAULT nextval('model.entity_id_seq') NOT NULL,
+            location_id integer,
+            number integer NOT NULL,
+            name text NOT NULL,
+            description text,
+            origin_id text,
+            begin_from timestamp without time zone,
+            begin_to timestamp without time zone,
+            begin_comment text,
+            end_from timestamp without time zone,
+            end_to timestamp without time zone,
+            end_comment text,
+            type_ids integer[],
+            easting double precision,
+            northing double precision,
+            gis_description text
+        ) ON COMMIT DROP;
+        """)
+
+
+def stage_import(rows: list[dict[str, Any]]) -> None:
+    file_ = io.StringIO()
+    writer = csv.writer(file_)
+    for row in rows:
+        writer.writerow([row[column] for column in STAGING_COLUMNS])
+    file_.seek(0)
+    g.cursor.copy_expert(
+        f"COPY import_staging ({', '.join(STAGING_COLUMNS)}) "
+        "FROM STDIN WITH (FORMAT csv);",
+        file_)
+
+
+def import_entities(
         project_id: int,
-        entity_id: int,
         user_id: int,
-        origin_id: Optional[int]) -> None:
+        class_: str,
+        code: str) -> None:
     g.cursor.execute(
         """
-        INSERT INTO import.entity (
-            project_id, origin_id, entity_id, user_id
-        ) VALUES (
-            %(project_id)s, %(origin_id)s, %(entity_id)s, %(user_id)s);
-        """, {
+        INSERT INTO model.entity (
+            id, name, openatlas_class_name, cidoc_class_code, description,
+            begin_from, begin_to, begin_comment, end_from, end_to, end_comment)
+        SELECT
+            entity_id, name, %(class_)s, %(code)s, description,
+            begin_from, begin_to, begin_comment, end_from, end_to, end_comment
+        FROM import_staging
+        ORDER BY number;
+
+        INSERT INTO import.entity (project_id, origin_id, entity_id, user_id)
+        SELECT %(project_id)s, origin_id, entity_id, %(user_id)s
+        FROM import_staging
+        ORDER BY number;
+        """,
+        {
             'project_id': project_id,
-            'origin_id': origin_id,
-            'entity_id': entity_id,
-            'user_id': user_id})
+            'user_id': user_id,
+            'class_': class_,
+            'code': code})
+
+
+def import_types() -> None:
+    g.cursor.execute(
+        """
+        INSERT INTO model.link (property_code, domain_id, range_id)
+        SELECT 'P2', s.entity_id, t.type_id
+        FROM import_staging s, unnest(s.type_ids) WITH ORDINALITY t(type_id, i)
+        ORDER BY s.number, t.i;
+        """)
+
+
+def import_locations(code: str) -> None:
+    g.cursor.execute(
+        """
+        UPDATE import_staging SET location_id = nextval('model.entity_id_seq');
+
+        INSERT INTO model.entity (
+            id, name, openatlas_class_name, cidoc_class_code)
+        SELECT location_id, 'Location of ' || name, 'object_location', %(code)s
+        FROM import_staging
+        ORDER BY number;
+
+        INSERT INTO model.link (property_code, domain_id, range_id)
+        SELECT 'P53', entity_id, location_id
+        FROM import_staging
+        ORDER BY number;
+
+        INSERT INTO model.gis (
+            entity_id, name, description, type, geom_point)
+        SELECT
+            location_id,
+            '',
+            gis_description,
+            'centerpoint',
+            public.ST_SetSRID(public.ST_MakePoint(easting, northing), 4326)
+        FROM import_staging
+        WHERE easting IS NOT NULL AND northing IS NOT NULL
+        ORDER BY number;
+        """,
+        {'code': code})
@@ -0,0 +1,108 @@
+from typing import Any, Optional
+
+from flask import g
+
+
+def insert(name: str, ids: list[int], retry: bool) -> None:
+    # Existing jobs are queued again if done, and if failed with retry
+    g.cursor.execute(
+        """
+        INSERT INTO web.job (name, entity_id)
+        SELECT %(name)s, unnest(%(ids)s::integer[])
+        ON CONFLICT (name, entity_id) DO UPDATE SET
+            status = 'pending',
+            attempts = 0,
+            error = NULL,
+            created = now()
+        WHERE web.job.status != 'running'
+            AND (%(retry)s OR web.job.status = 'done');
+        """,
+        {'name': name, 'ids': ids, 'retry': retry})
+
+
+def claim(limit: int) -> list[dict[str, Any]]:
+    # Locked rows are skipped, so jobs are claimed only once
+    g.cursor.execute(
+        """
+        UPDATE web.job SET status = 'running', attempts = attempts + 1
+        WHERE (name, entity_id) IN (
+            SELECT name, entity_id
+            FROM web.job
+            WHERE status = 'pending'
+            ORDER BY created, entity_id
+            LIMIT %(limit)s
+            FOR UPDATE SKIP LOCKED)
+        RETURNING name, entity_id, attempts;
+        """,
+        {'limit': limit})
+    return [dict(row) for row in g.cursor.fetchall()]
+
+
+def finish(
+        name: str,
+        entity_id: int,
+        error: Optional[str],
+        max_attempts: int) -> str:
+    g.cursor.execute(
+        """
+        UPDATE web.job SET
+            status = CASE
+                WHEN %(error)s::text IS NULL THEN 'done'
+                WHEN attempts < %(max_attempts)s THEN 'pending'
+                ELSE 'failed' END,
+            error = %(error)s
+        WHERE name = %(name)s AND entity_id = %(entity_id)s
+        RETURNING status;
+        """,
+        {
+            'name': name,
+            'entity_id': entity_id,
+            'error': error,
+            'max_attempts': max_attempts})
+    return row['status'] if (row := g.cursor.fetchone()) else 'deleted'
+
+
+def reset_running(max_attempts: int) -> None:
+    # Jobs of a stopped worker are resumed or failed
+    g.cursor.execute(
+        """
+        UPDATE web.job SET
+            status = CASE
+                WHEN attempts < %(max_attempts)s THEN 'pending'
+                ELSE 'failed' END,
+            error = 'interrupted'
+        WHERE status = 'running';
+        """,
+        {'max_attempts': max_attempts})
+
+
+def retry_failed() -> None:
+    g.cursor.execute(
+        """
+        UPDATE web.job SET status = 'pending', attempts = 0, error = NULL
+        WHERE status = 'failed';
+        """)
+
+
+def delete_done() -> None:
+    g.cursor.execute("DELETE FROM web.job WHERE status = 'done';")
+
+
+def get_counts() -> dict[str, dict[str, int]]:
+    g.cursor.execute(
+        "SELECT name, status, COUNT(*) FROM web.job GROUP BY name, status;")
+    counts: dict[str, dict[str, int]] = {}
+    for row in g.cursor.fetchall():
+        counts.setdefault(row['name'], {})[row['status']] = row['count']
+    return counts
+
+
+def get_failed() -> list[dict[str, Any]]:
+    g.cursor.execute(
+        """
+        SELECT name, entity_id, attempts, error, modified
+        FROM web.job
+        WHERE status = 'failed'
+        ORDER BY modified DESC;
+        """)
+    return [dict(row) for row in g.cursor.fetchall()]
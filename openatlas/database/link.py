@@ -1,7 +1,9 @@
-from typing import Any
+from typing import Any, Iterator
 
 from flask import g
 
+from openatlas.database.connect import iterate
+
 
 def update(data: dict[str, Any]) -> None:
     g.cursor.execute(
@@ -28,6 +30,10 @@ def update(data: dict[str, Any]) -> None:
 
 
 def get_by_id(id_: int) -> dict[str, Any]:
+    return get_by_ids([id_])[0]
+
+
+def get_by_ids(ids: list[int]) -> list[dict[str, Any]]:
     g.cursor.execute(
         """
         SELECT
@@ -48,10 +54,10 @@ def get_by_id(id_: int) -> dict[str, Any]:
             COALESCE(to_char(l.end_to, 'yyyy-mm-dd hh24:mi:ss BC'), '')
                 AS end_to
         FROM model.link l
-        WHERE l.id = %(id)s;
+        WHERE l.id IN %(ids)s;
         """,
-        {'id': id_})
-    return dict(g.cursor.fetchone())
+        {'ids': tuple(ids)})
+    return [dict(row) for row in g.cursor.fetchall()]
 
 
 def get_links_by_type(type_id: int) -> list[dict[str, Any]]:
@@ -82,8 +88,8 @@ def delete_(id_: int) -> None:
     g.cursor.execute('DELETE FROM model.link WHERE id = %(id)s;', {'id': id_})
 
 
-def get_all_links() -> list[dict[str, Any]]:
-    g.cursor.execute(
+def get_all_links() -> Iterator[dict[str, Any]]:
+    return iterate(
         """
         SELECT
             l.id,
@@ -106,13 +112,60 @@ def get_all_links() -> list[dict[str, Any]]:
             l.end_comment,
             COALESCE(to_char(l.end_to, 'yyyy-mm-dd hh24:mi:ss BC'), '')
                 AS end_to
-        FROM model.link l;
+        FROM model.link l
+        ORDER BY l.id;
         """)
-    return [dict(row) for row in g.cursor.fetchall()]
 
 
-def check_link_duplicates() -> list[dict[str, int]]:
+def get_subunit_ids(id_: int) -> list[int]:
     g.cursor.execute(
+        """
+        WITH RECURSIVE subunits(id) AS (
+            SELECT %(id)s::integer
+            UNION
+            SELECT l.range_id
+            FROM model.link l
+            JOIN subunits s ON l.domain_id = s.id AND l.property_code = 'P46')
+        SELECT id FROM subunits ORDER BY id;
+        """,
+        {'id': id_})
+    return [row['id'] for row in g.cursor.fetchall()]
+
+
+def get_links_of_entity_ids(ids: list[int]) -> list[dict[str, Any]]:
+    g.cursor.execute(
+        """
+        SELECT
+            l.id,
+            l.property_code,
+            l.domain_id,
+            l.range_id,
+            l.description,
+            COALESCE(to_char(l.created, 'yyyy-mm-dd hh24:mi:ss BC'), '')
+                AS created,
+            COALESCE(to_char(l.modified, 'yyyy-mm-dd hh24:mi:ss BC'), '')
+                AS modified,
+            l.type_id,
+            COALESCE(to_char(l.begin_from, 'yyyy-mm-dd hh24:mi:ss BC'), '')
+                AS begin_from,
+            l.begin_comment,
+            COALESCE(to_char(l.begin_to, 'yyyy-mm-dd hh24:mi:ss BC'), '')
+                AS begin_to,
+            COALESCE(to_char(l.end_from, 'yyyy-mm-dd hh24:mi:ss BC'), '')
+                AS end_from,
+            l.end_comment,
+            COALESCE(to_char(l.end_to, 'yyyy-mm-dd hh24:mi:ss BC'), '')
+                AS end_to
+        FROM model.link l
+        WHERE l.domain_id IN %(ids)s OR l.range_id IN %(ids)s
+        ORDER BY l.id;
+        """,
+        {'ids': tuple(ids)})
+    return [dict(row) for row in g.cursor.fetchall()]
+
+
+def check_link_duplicates() -> Iterator[dict[str, Any]]:
+    return iterate(
         """
         SELECT
             COUNT(*) AS count,
@@ -134,7 +187,6 @@ def check_link_duplicates() -> list[dict[str, int]]:
             end_from, end_to, end_comment
         HAVING COUNT(*) > 1;
         """)
-    return [dict(row) for row in g.cursor.fetchall()]
 
 
 def delete_link_duplicates() -> int:
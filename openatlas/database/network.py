@@ -1,23 +1,29 @@
-from typing import Any
+from typing import Any, Iterator
 
 from flask import g
 
+from openatlas.database.connect import iterate
 
-def get_ego_network(ids: set[int]) -> list[dict[str, Any]]:
+
+def get_ego_network(
+        ids: set[int],
+        properties: list[str]) -> list[dict[str, Any]]:
     g.cursor.execute(
         """
         SELECT id, domain_id, property_code, range_id
         FROM model.link
-        WHERE domain_id IN %(ids)s or range_id IN %(ids)s;
+        WHERE property_code IN %(properties)s
+            AND (domain_id IN %(ids)s OR range_id IN %(ids)s)
+        ORDER BY id;
         """,
-        {'ids': tuple(ids)})
+        {'ids': tuple(ids), 'properties': tuple(properties)})
     return [dict(row) for row in g.cursor.fetchall()]
 
 
 def get_edges(
         classes: list[str],
-        properties: list[str]) -> list[dict[str, int]]:
-    g.cursor.execute(
+        properties: list[str]) -> Iterator[dict[str, Any]]:
+    return iterate(
         """
         SELECT l.id, l.domain_id, l.range_id
         FROM model.link l
@@ -28,22 +34,20 @@ def get_edges(
         WHERE property_code IN %(properties)s;
         """,
         {'classes': tuple(classes), 'properties': tuple(properties)})
-    return [dict(row) for row in g.cursor.fetchall()]
 
 
-def get_entities(classes: list[str]) -> list[dict[str, Any]]:
-    g.cursor.execute(
+def get_entities(classes: list[str]) -> Iterator[dict[str, Any]]:
+    return iterate(
         """
         SELECT e.id, e.name, e.openatlas_class_name
         FROM model.entity e
         WHERE openatlas_class_name IN %(classes)s;
         """,
         {'classes': tuple(classes)})
-    return [dict(row) for row in g.cursor.fetchall()]
 
 
 def get_object_mapping() -> dict[int, int]:
-    g.cursor.execute(
+    rows = iterate(
         """
         SELECT e.id, l.range_id
         FROM model.entity e
@@ -51,4 +55,4 @@ def get_object_mapping() -> dict[int, int]:
         JOIN model.entity e2 ON l.range_id = e2.id
             AND e.openatlas_class_name = 'place';
         """)
-    return {row['range_id']: row['id'] for row in g.cursor.fetchall()}
+    return {row['range_id']: row['id'] for row in rows}
@@ -0,0 +1,8 @@
+from datetime import datetime
+
+from flask import g
+
+
+def get_version() -> datetime:
+    g.cursor.execute('SELECT version FROM web.registry_version;')
+    return g.cursor.fetchone()['version']
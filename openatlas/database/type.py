@@ -3,8 +3,9 @@ from typing import Any
 from flask import g
 
 
-def get_types(with_count: bool) -> list[dict[str, Any]]:
-    sql = f"""
+def get_types() -> list[dict[str, Any]]:
+    g.cursor.execute(
+        """
         SELECT
             e.id,
             e.name,
@@ -14,8 +15,6 @@ def get_types(with_count: bool) -> list[dict[str, Any]]:
             e.created,
             e.modified,
             es.id AS super_id,
-            {'COUNT(l2.id)' if with_count else '0'} AS count,
-            {'COUNT(l3.id)' if with_count else '0'} AS count_property,
             COALESCE(to_char(e.begin_from, 'yyyy-mm-dd hh24:mi:ss BC'), '')
                 AS begin_from,
             COALESCE(to_char(e.begin_to, 'yyyy-mm-dd hh24:mi:ss BC'), '')
@@ -32,24 +31,26 @@ def get_types(with_count: bool) -> list[dict[str, Any]]:
         LEFT JOIN model.link l ON e.id = l.domain_id
             AND l.property_code IN ('P127', 'P89')
         LEFT JOIN model.entity es ON l.range_id = es.id
-        """
-    if with_count:
-        sql += """
-            -- Get count
-            LEFT JOIN model.link l2 ON e.id = l2.range_id
-                AND l2.property_code IN ('P2', 'P89')
-            LEFT JOIN model.link l3 ON e.id = l3.type_id
-            """
-    sql += """
         WHERE e.openatlas_class_name
             IN ('administrative_unit', 'type', 'type_tools')
-        GROUP BY e.id, es.id
         ORDER BY e.name;
-        """
-    g.cursor.execute(sql)
+        """)
     return [dict(row) for row in g.cursor.fetchall()]
 
 
+def get_counts(ids: list[int]) -> dict[int, int]:
+    g.cursor.execute(
+        """
+        SELECT type_id, count, count_property
+        FROM model.type_count
+        WHERE type_id IN %(ids)s;
+        """,
+        {'ids': tuple(ids)})
+    return {
+        row['type_id']: row['count'] or row['count_property']
+        for row in g.cursor.fetchall()}
+
+
 def get_hierarchies() -> list[dict[str, Any]]:
     g.cursor.execute(
         """
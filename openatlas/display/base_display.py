@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from copy import copy
 from typing import Any, Optional
 
 from flask import g, render_template, url_for
@@ -32,12 +33,16 @@ class BaseDisplay:
     tabs: dict[str, Tab]
 
     def __init__(self, entity: Entity) -> None:
-        self.entity = entity
+        # Types and reference systems are shared between requests, so the
+        # profile image is set on a copy
+        self.entity = copy(entity)
+        self.entity.prefetch_neighborhood()
         self.events: list[Entity] = []
         self.event_links: Optional[list[Link]] = []
         self.linked_places: list[Entity] = []
         self.structure: dict[str, list[Entity]] = {}
         self.gis_data: dict[str, Any] = {}
+        self.reference_systems: list[Link] = []
         self.problematic_type = self.entity.check_too_many_single_type_links()
         self.entity.image_id = entity.get_profile_image_id()
         self.add_tabs()
@@ -98,6 +103,7 @@ class BaseDisplay:
             info_data=self.data,
             gis_data=self.gis_data,
             overlays=self.overlays,
+            reference_systems=self.reference_systems,
             chart_data=self.get_chart_data(),
             description_html=self.description_html(),
             problematic_type_id=self.problematic_type)
@@ -209,7 +215,9 @@ class BaseDisplay:
 
     def add_reference_tables_data(self) -> None:
         entity = self.entity
-        for link_ in entity.get_links('P67', inverse=True):
+        links = entity.get_links('P67', inverse=True)
+        g.files.load([link_.domain.id for link_ in links])
+        for link_ in links:
             domain = link_.domain
             data = get_base_table_data(domain)
             if domain.class_.view == 'file':
@@ -222,7 +230,7 @@ class BaseDisplay:
                 data.append(edit_link(
                     url_for('link_update', id_=link_.id, origin_id=entity.id)))
                 if domain.class_.view == 'reference_system':
-                    entity.reference_systems.append(link_)
+                    self.reference_systems.append(link_)
                     continue
             data.append(
                 remove_link(domain.name, link_, entity, domain.class_.view))
@@ -387,10 +395,12 @@ class PlaceBaseDisplay(BaseDisplay):
                 and current_user.settings['module_map_overlay']:
             self.tabs['file'].table.header.append(_('overlay'))
 
-        for link_ in entity.get_links(['P31', 'P67'], inverse=True):
+        links = entity.get_links(['P31', 'P67'], inverse=True)
+        g.files.load([link_.domain.id for link_ in links])
+        for link_ in links:
             domain = link_.domain
             if domain.class_.view == 'reference_system':
-                entity.reference_systems.append(link_)
+                self.reference_systems.append(link_)
                 continue
             data = get_base_table_data(domain)
             if domain.class_.view in ['event']:
@@ -522,6 +532,7 @@ class TypeBaseDisplay(BaseDisplay):
         self.tabs['entities'] = Tab('entities', entity=entity)
         self.tabs['file'] = Tab('file', entity=entity)
         self.add_reference_tables_data()
+        Type.load_counts(entity.subs)
         for sub_id in entity.subs:
             self.tabs['subs'].table.rows.append([
                 link(g.types[sub_id]),
@@ -542,10 +553,13 @@ class TypeBaseDisplay(BaseDisplay):
         root = g.types[entity.root[0]] if entity.root else entity
         if root.name in app.config['PROPERTY_TYPES']:
             self.tabs['entities'].table.header = [_('domain'), _('range')]
-            for row in Link.get_links_by_type(entity):
+            rows = Link.get_links_by_type(entity)
+            linked = Link.get_entities([
+                row[key] for row in rows for key in ['domain_id', 'range_id']])
+            for row in rows:
                 self.tabs['entities'].table.rows.append([
-                    link(Entity.get_by_id(row['domain_id'])),
-                    link(Entity.get_by_id(row['range_id']))])
+                    link(linked[row['domain_id']]),
+                    link(linked[row['range_id']])])
         else:
             entities = entity.get_linked_entities(['P2', 'P89'], True, True)
             root_places = {}
@@ -554,6 +568,9 @@ class TypeBaseDisplay(BaseDisplay):
                     'P46',
                     [e.id for e in entities],
                     inverse=True)
+            Entity.prefetch_links(
+                [e for e in entities if e.class_.name == 'object_location'],
+                ['P53'])
             for item in entities:
                 if item.class_.name == 'object_location':
                     item = item.get_linked_entity_safe('P53', inverse=True)
@@ -185,7 +185,7 @@ class PlaceDisplay(PlaceBaseDisplay):
             for link_ in self.entity.location.get_links(
                     ['P74', 'OA8', 'OA9'],
                     True):
-                actor = Entity.get_by_id(link_.domain.id)
+                actor = link_.domain
                 self.tabs['actor'].table.rows.append([
                     link(actor),
                     g.properties[link_.property.code].name,
@@ -194,6 +194,7 @@ class PlaceDisplay(PlaceBaseDisplay):
                     actor.last,
                     actor.description])
         actor_ids = []
+        Entity.prefetch_links(self.events, ['P11', 'P14', 'P22', 'P23'])
         for event in self.events:
             for actor in \
                     event.get_linked_entities(['P11', 'P14', 'P22', 'P23']):
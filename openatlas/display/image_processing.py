@@ -4,86 +4,53 @@ from flask import g
 from wand.image import Image
 
 from openatlas import app
-from openatlas.models.entity import Entity
 
 
-def resize_image(filename: str) -> None:
-    file_format = '.' + filename.split('.', 1)[1].lower()
-    if file_format in g.display_file_ext:
-        for size in app.config['IMAGE_SIZE'].values():
-            safe_resize_image(
-                filename.rsplit('.', 1)[0].lower(),
-                file_format, size)
-
-
-def safe_resize_image(name: str, file_format: str, size: str) -> bool:
-    try:
-        if check_if_folder_exist(size, app.config['RESIZED_IMAGES']):
-            return image_resizing(name, file_format, size)
-        return False  # pragma: no cover
-    except OSError as e:  # pragma: no cover
-        g.logger.log(
-            'info',
-            'image processing',
-            'failed to save resized image',
-            e)
-        return False
-
-
-def image_resizing(name: str, format_: str, size: str) -> bool:
-    filename = Path(app.config['UPLOAD_PATH']) / f"{name}{format_}[0]"
-    with Image(filename=filename) as src:
-        if format_ in app.config['PROCESSABLE_EXT']:
-            format_ = app.config['PROCESSED_EXT']  # pragma: no cover
-        with src.convert(format_.replace('.', '')) as img:
-            img.transform(resize=f"{size}x{size}>")
+def resize_image(name: str, file_format: str) -> list[str]:
+    # The image is decoded once and resized from the largest to the smallest
+    # size, each from the image of the size before. Doesn't use g so it can
+    # run in worker processes, returns the created sizes.
+    ext = app.config['PROCESSED_EXT'] \
+        if file_format in app.config['PROCESSABLE_EXT'] else file_format
+    sizes = sorted(
+        [size for size in app.config['IMAGE_SIZE'].values() if size.isdigit()],
+        key=int,
+        reverse=True)
+    with Image(
+            filename=Path(app.config['UPLOAD_PATH'])
+            / f"{name}{file_format}[0]") as src:
+        with src.convert(ext.replace('.', '')) as img:
             img.compression_quality = 75
-            img.save(
-                filename=Path(
-                    app.config['RESIZED_IMAGES']) / size / f"{name}{format_}")
-            return True
+            for size in sizes:
+                folder = Path(app.config['RESIZED_IMAGES']) / size
+                folder.mkdir(parents=True, exist_ok=True)
+                img.transform(resize=f"{size}x{size}>")
+                img.save(filename=folder / f"{name}{ext}")
+    return sizes
 
 
 def check_processed_image(filename: str) -> bool:
+    # Created sizes are recorded at the file registry. Images resized before
+    # they were recorded are checked in the file system, missing sizes are
+    # added to the jobs.
+    from openatlas.models.job import Job
+    name = filename.rsplit('.', 1)[0].lower()
     file_format = '.' + filename.split('.', 1)[1].lower()
-    try:
-        if file_format in g.display_file_ext:
-            return loop_through_processed_folders(
-                filename.rsplit('.', 1)[0].lower(),
-                file_format)
-    except OSError as e:  # pragma: no cover
-        g.logger.log(
-            'info',
-            'image processing',
-            'failed to validate file as image',
-            e)
-    return False
-
-
-def loop_through_processed_folders(name: str, file_format: str) -> bool:
-    ext = file_format
-    if file_format in app.config['PROCESSABLE_EXT']:
-        ext = app.config['PROCESSED_EXT']  # pragma: no cover
-    for size in app.config['IMAGE_SIZE'].values():
-        path = Path(app.config['RESIZED_IMAGES']) / size / f"{name}{ext}"
-        if not path.is_file() \
-                and not safe_resize_image(name, file_format, size):
-            return False  # pragma: no cover
-    return True
-
-
-def check_if_folder_exist(folder: str, path: str) -> bool:
-    folder_to_check = Path(path) / folder
-    return True if folder_to_check.is_dir() else create_folder(folder_to_check)
-
-
-def create_folder(folder: Path) -> bool:  # pragma: no cover
-    try:
-        folder.mkdir()
+    if file_format not in g.display_file_ext or not name.isdigit():
+        return False
+    sizes = {
+        size for size in app.config['IMAGE_SIZE'].values() if size.isdigit()}
+    if sizes <= g.files.get_variants(int(name)):
         return True
-    except OSError as e:
-        g.logger.log('info', 'image processing', 'failed to create folder', e)
+    ext = app.config['PROCESSED_EXT'] \
+        if file_format in app.config['PROCESSABLE_EXT'] else file_format
+    if not all(
+            (Path(app.config['RESIZED_IMAGES']) / size / f"{name}{ext}")
+            .is_file() for size in sizes):
+        Job.add('resize', [int(name)], retry=False)
         return False
+    g.files.add_variants(int(name), list(sizes))
+    return True
 
 
 def delete_orphaned_resized_images() -> None:
@@ -93,9 +60,3 @@ def delete_orphaned_resized_images() -> None:
             file_name = file.name.rsplit('.', 1)[0].lower()
             if not file_name.isdigit() or int(file_name) not in g.files:
                 file.unlink()  # pragma: no cover
-
-
-def create_resized_images() -> None:
-    for e in Entity.get_by_class('file'):
-        if e.id in g.files and e.get_file_ext() in g.display_file_ext:
-            resize_image(f"{e.id}{e.get_file_ext()}")
@@ -1,6 +1,6 @@
 from typing import Any, Optional
 
-from flask import json, render_template
+from flask import json, render_template, request
 from flask_babel import lazy_gettext as _
 from flask_login import current_user
 
@@ -22,17 +22,21 @@ class Table:
             rows: Optional[list[Any]] = None,
             order: Optional[list[list[int | str]]] = None,
             defs: Optional[list[dict[str, Any]]] = None,
-            paging: bool = True) -> None:
+            paging: bool = True,
+            ajax: Optional[str] = None,
+            ajax_data: Optional[dict[str, Any]] = None) -> None:
         self.header = header or []
         self.rows = rows or []
         self.paging = paging
         self.order = order or ''
         self.defs = defs or []
+        self.ajax = ajax  # URL for server-side processing of rows
+        self.ajax_data = ajax_data  # Sent as POST, e.g. too long for URLs
 
     def display(self, name: str = 'default') -> str:
-        if not self.rows:
+        if not self.rows and not self.ajax:
             return '<p class="uc-first">' + _('no entries') + '</p>'
-        data = {
+        data: dict[str, Any] = {
             'data': self.rows,
             'stateSave': 'true',
             'columns': [{
@@ -41,10 +45,20 @@ class Table:
                     if name in ['count', 'size'] else ''}
                 for name in self.header] + [
                 {'title': '', 'className': ''}
-                for _item in range(len(self.rows[0]) - len(self.header))],
+                for _item in range(
+                    len(self.rows[0]) - len(self.header) if self.rows else 0)],
             'paging': self.paging,
             'pageLength': current_user.settings['table_rows'],
             'autoWidth': 'false'}
+        if self.ajax:
+            del data['data']
+            data.update({
+                'serverSide': True,
+                'ajax': {
+                    'url': self.ajax,
+                    'type': 'POST',
+                    'data': self.ajax_data} if self.ajax_data else self.ajax,
+                'searchDelay': 400})
         if self.order:
             data['order'] = self.order
         if self.defs:
@@ -54,3 +68,16 @@ class Table:
             table=self,
             name=name,
             data=json.dumps(data))
+
+
+def get_table_query(header: list[str]) -> dict[str, Any]:
+    # Paging, ordering and search of a DataTables server-side request
+    values = request.form if request.method == 'POST' else request.args
+    column = values.get('order[0][column]', 0, type=int)
+    return {
+        'search': values.get('search[value]', '').strip(),
+        'column': header[column] if 0 <= column < len(header) else 'name',
+        'desc': values.get('order[0][dir]') == 'desc',
+        'limit': max(values.get('length', 0, type=int), 0)
+        or current_user.settings['table_rows'],
+        'offset': max(values.get('start', 0, type=int), 0)}
@@ -142,6 +142,7 @@ def get_chart_data(entity: Type) -> Optional[dict[str, Any]]:
     if not entity.subs:
         return None
     data = {}
+    entity.load_counts(entity.get_sub_ids_recursive())
     for id_ in entity.subs:
         if count := g.types[id_].count + g.types[id_].count_subs:
             data[g.types[id_].name] = count
@@ -438,8 +439,8 @@ def get_file_path(
     if size:
         if ext in app.config['PROCESSABLE_EXT']:
             ext = app.config['PROCESSED_EXT']  # pragma: no cover
-        path = app.config['RESIZED_IMAGES'] / size / f"{id_}{ext}"
-        return path if os.path.exists(path) else None
+        return app.config['RESIZED_IMAGES'] / size / f"{id_}{ext}" \
+            if size in g.files.get_variants(id_) else None
     return app.config['UPLOAD_PATH'] / f"{id_}{ext}"
 
 
@@ -600,8 +601,17 @@ def get_iiif_file_path(id_: int) -> Path:
 
 
 def convert_image_to_iiif(id_: int, path: Optional[Path] = None) -> bool:
-    command: list[Any] = ["vips" if os.name == 'posix' else "vips.exe"]
-    command.extend([
+    try:
+        with subprocess.Popen(get_iiif_command(id_, path)) as sub_process:
+            sub_process.wait()
+        return True
+    except Exception:  # pragma: no cover
+        return False
+
+
+def get_iiif_command(id_: int, path: Optional[Path] = None) -> list[Any]:
+    return [
+        "vips" if os.name == 'posix' else "vips.exe",
         'tiffsave',
         path or get_file_path(id_),
         get_iiif_file_path(id_),
@@ -612,10 +622,4 @@ def convert_image_to_iiif(id_: int, path: Optional[Path] = None) -> bool:
         '--tile-width',
         '128',
         '--tile-height',
-        '128'])
-    try:
-        with subprocess.Popen(command) as sub_process:
-            sub_process.wait()
-        return True
-    except Exception:  # pragma: no cover
-        return False
+        '128']
@@ -3,9 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any, Optional
 
-from flask import g, render_template
+from flask import g, render_template, url_for
 from flask_babel import lazy_gettext as _
-from flask_login import current_user
 from flask_wtf import FlaskForm
 from markupsafe import Markup
 from wtforms import (
@@ -156,29 +155,19 @@ class TableMultiSelect(HiddenInput):
             **kwargs: Any) -> str:
         data = field.data or []
         data = ast.literal_eval(data) if isinstance(data, str) else data
-        class_ = field.id \
-            if field.id not in ['given_place', 'modified_place'] else 'place'
-        aliases = current_user.settings['table_show_aliases']
-        if class_ in ['group', 'person']:
-            entities = Entity.get_by_class(class_, types=True, aliases=aliases)
-        else:
-            entities = Entity.get_by_view(class_, types=True, aliases=aliases)
+        classes = get_table_classes(field.id) or (field.id, [])
         table = Table(
-            [''] + g.table_headers[class_],
-            order=[[0, 'desc'], [1, 'asc']],
-            defs=[{'orderDataType': 'dom-checkbox', 'targets': 0}])
-        for entity in [e for e in entities if e.id not in field.filter_ids]:
-            row = get_base_table_data(entity, show_links=False)
-            row.insert(
-                0,
-                f'<input type="checkbox" value="{entity.name}"'
-                f' id="{entity.id}" '
-                f'{" checked" if entity.id in data else ""}>')
-            table.rows.append(row)
+            [''] + g.table_headers[classes[0]],
+            order=[[1, 'asc']],
+            defs=[{'orderable': False, 'targets': 0}],
+            ajax=url_for('ajax_table', field_id=field.id, multiple=1),
+            ajax_data=get_ajax_data(field.filter_ids))
         return Markup(render_template(
             'forms/table_multi_select.html',
             field=field,
-            selection=[e for e in entities if e.id in data],
+            selection=[
+                [entity.id, entity.name]
+                for entity in Entity.get_by_ids(data)],
             table=table)) + super().__call__(field, **kwargs)
 
 
@@ -227,10 +216,18 @@ class TableSelect(HiddenInput):
         for class_name in field.add_dynamical:
             field.forms[class_name] = get_form(class_name)
 
-        table, selection = get_table_content(
-            field.id,
-            field.data,
-            field.filter_ids)
+        if classes := get_table_classes(field.id):
+            table = Table(
+                g.table_headers[classes[0]],
+                ajax=url_for('ajax_table', field_id=field.id),
+                ajax_data=get_ajax_data(field.filter_ids))
+            selection = Entity.get_by_id(int(field.data)).name \
+                if field.data else ''
+        else:
+            table, selection = get_table_content(
+                field.id,
+                field.data,
+                field.filter_ids)
         return Markup(render_template(
             'forms/table_select.html',
             field=field,
@@ -403,6 +400,12 @@ def value_type_expand_icon(type_: Type) -> str:
         </span>'''
 
 
+def get_ajax_data(filter_ids: list[int]) -> Optional[dict[str, str]]:
+    # Ids are posted because there can be too many for a URL
+    return {'filter_ids': ','.join(map(str, filter_ids))} \
+        if filter_ids else None
+
+
 def get_table_content(
         class_name: str,
         selected_data: Any,
@@ -429,7 +432,7 @@ def get_table_content(
                 entity.name])
             if entity.code == selected_data:
                 selection = f'{entity.code} {entity.name}'
-    elif class_name == 'annotated_entity':
+    else:  # annotated_entity
         # Hackish (mis)use of filter_ids to get table field for annotations
         table = Table(['name', 'class', 'description'])
         for item in Entity.get_by_id(filter_ids[0]).get_linked_entities('P67'):
@@ -439,55 +442,54 @@ def get_table_content(
                 format_name_and_aliases(item, 'annotated_entity'),
                 uc_first(item.class_.name),
                 item.description])
-    else:
-        aliases = current_user.settings['table_show_aliases']
-        if 'place' in class_name or class_name in \
-                ['begins_in', 'ends_in', 'residence']:
-            class_ = 'place'
-            entities = Entity.get_by_view('place', types=True, aliases=aliases)
-        elif class_name == 'event_preceding':
-            class_ = 'event'
-            entities = Entity.get_by_class([
-                    'activity',
-                    'acquisition',
-                    'modification',
-                    'move',
-                    'production'],
-                types=True,
-                aliases=aliases)
-        elif class_name == 'feature_super':
-            class_ = 'place'
-            entities = \
-                Entity.get_by_class('place', types=True, aliases=aliases)
-        elif class_name == 'stratigraphic_super':
-            class_ = 'place'
-            entities = \
-                Entity.get_by_class('feature', types=True, aliases=aliases)
-        elif class_name == 'artifact_super':
-            class_ = 'place'
-            entities = Entity.get_by_class(
-                g.view_class_mapping['place'] + ['artifact'],
-                types=True,
-                aliases=aliases)
-        elif class_name == 'human_remains_super':
-            class_ = 'place'
-            entities = Entity.get_by_class(
-                g.view_class_mapping['place'] + ['human_remains'],
-                types=True,
-                aliases=aliases)
-        else:
-            class_ = class_name
-            entities = Entity.get_by_view(class_, types=True, aliases=aliases)
-        table = Table(g.table_headers[class_])
-        for entity in [e for e in entities if e.id not in filter_ids]:
-            if selected_data and entity.id == int(selected_data):
-                selection = entity.name
-            data = get_base_table_data(entity, show_links=False)
-            data[0] = format_name_and_aliases(entity, class_name)
-            table.rows.append(data)
     return table, selection
 
 
+def get_table_classes(field_id: str) -> Optional[tuple[str, list[str]]]:
+    # Header class and classes of entities selectable in a table field, rows
+    # are loaded page by page with ajax_table()
+    if 'place' in field_id \
+            or field_id in ['begins_in', 'ends_in', 'residence']:
+        return 'place', g.view_class_mapping['place']
+    match field_id:
+        case 'event_preceding':
+            return 'event', [
+                'activity', 'acquisition', 'modification', 'move',
+                'production']
+        case 'feature_super':
+            return 'place', ['place']
+        case 'stratigraphic_super':
+            return 'place', ['feature']
+        case 'artifact_super':
+            return 'place', g.view_class_mapping['place'] + ['artifact']
+        case 'human_remains_super':
+            return 'place', g.view_class_mapping['place'] + ['human_remains']
+        case 'group' | 'person':
+            return field_id, [field_id]
+    if field_id in g.view_class_mapping and field_id in g.table_headers:
+        return field_id, g.view_class_mapping[field_id]
+    return None
+
+
+def get_table_rows(
+        field_id: str,
+        entities: list[Entity],
+        multiple: bool = False) -> list[list[Any]]:
+    rows = []
+    for entity in entities:
+        data = get_base_table_data(entity, show_links=False)
+        if multiple:
+            data.insert(
+                0,
+                f'<input type="checkbox" value="{entity.name}"'
+                f' id="{entity.id}"'
+                f' onchange="toggleFromTableMulti(\'{field_id}\', this)">')
+        else:
+            data[0] = format_name_and_aliases(entity, field_id)
+        rows.append(data)
+    return rows
+
+
 def format_name_and_aliases(entity: Entity, field_id: str) -> str:
     link = \
         f"""<a value="{entity.name}"  href='#' onclick="selectFromTable(this,
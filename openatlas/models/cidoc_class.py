@@ -14,11 +14,14 @@ class CidocClass:
         self.code = data['code']
         self.id = data['id']
         self.comment = data['comment']
-        self.count = data['count']
         self.i18n: dict[str, str] = {}
         self.sub: list[CidocClass] = []
         self.super: list[CidocClass] = []
 
+    @staticmethod
+    def get_class_count() -> dict[str, int]:
+        return db.get_class_count()
+
     @staticmethod
     def get_all(language: str) -> dict[str, CidocClass]:
         classes = {row['code']: CidocClass(row) for row in db.get_classes()}
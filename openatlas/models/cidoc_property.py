@@ -17,7 +17,6 @@ class CidocProperty:
         self.comment = data['comment']
         self.domain_class_code = data['domain_class_code']
         self.range_class_code = data['range_class_code']
-        self.count = data['count']
         self.sub: list[int] = []
         self.super: list[int] = []
         self.i18n: dict[str, str] = {}
@@ -46,6 +45,10 @@ class CidocProperty:
                 return True
         return False
 
+    @staticmethod
+    def get_property_count() -> dict[str, int]:
+        return db.get_property_count()
+
     @staticmethod
     def get_all(language: str) -> dict[str, CidocProperty]:
         properties = {
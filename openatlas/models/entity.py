@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import ast
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from flask import g, request
-from fuzzywuzzy import fuzz
 from werkzeug.exceptions import abort
 
 from openatlas import app
@@ -14,6 +13,7 @@ from openatlas.display.util2 import (
     timestamp_to_datetime64)
 from openatlas.models.gis import Gis
 from openatlas.models.link import Link
+from openatlas.models.similar import get_similar_pairs
 from openatlas.models.tools import get_carbon_link
 
 
@@ -26,7 +26,6 @@ class Entity:
         self.modified = data['modified']
         self.cidoc_class = g.cidoc_classes[data['cidoc_class_code']]
         self.class_ = g.classes[data['openatlas_class_name']]
-        self.reference_systems: list[Link] = []
         self.origin_id: Optional[int] = None  # When coming from another entity
         self.image_id: Optional[int] = None  # Profile image
         self.location: Optional[Entity] = None  # Respective location if place
@@ -105,6 +104,15 @@ class Entity:
             inverse=inverse,
             types=types)
 
+    def prefetch_neighborhood(self) -> None:
+        # All links of the entity are loaded at once. For linked entities
+        # only links to places, events and actors and their locations.
+        neighbors = Entity.prefetch_links([self])
+        linked = Entity.prefetch_links(
+            neighbors,
+            ['OA8', 'OA9', 'P7', 'P26', 'P27', 'P53', 'P74'])
+        Entity.prefetch_links(linked, ['P53'])
+
     def get_linked_entities_recursive(
             self,
             code: str,
@@ -149,6 +157,7 @@ class Entity:
                 'description': description,
                 'type_id': type_id})
             new_link_ids.append(id_)
+        g.neighborhoods.clear()
         return new_link_ids
 
     def link_string(
@@ -182,6 +191,7 @@ class Entity:
                 if not codes:
                     return
         db.delete_links_by_codes(self.id, codes, inverse)
+        g.neighborhoods.clear()
 
     def update(
             self,
@@ -199,6 +209,9 @@ class Entity:
             continue_link_id = self.update_links(data, new)
         if 'gis' in data:
             self.update_gis(data['gis'], new)
+        g.link_entities.clear()  # Cached entities and links may be outdated
+        g.neighborhoods.clear()
+        g.type_counts.clear()
         return continue_link_id
 
     def update_administrative_units(
@@ -340,8 +353,8 @@ class Entity:
                 [self]}
 
     def get_file_size(self) -> str:
-        return convert_size(g.files[self.id].stat().st_size) \
-            if self.id in g.files else 'N/A'
+        size = g.files.get_size(self.id)
+        return 'N/A' if size is None else convert_size(size)
 
     def get_file_ext(self) -> str:
         return g.files[self.id].suffix if self.id in g.files else 'N/A'
@@ -360,6 +373,7 @@ class Entity:
     def delete_(id_: int | list[int]) -> None:
         if id_:
             db.delete(id_ if isinstance(id_, list) else [id_])
+            g.neighborhoods.clear()
 
     @staticmethod
     def get_by_class(
@@ -375,6 +389,42 @@ class Entity:
         return [
             Entity(row) for row in db.get_by_class(classes, types, aliases)]
 
+    @staticmethod
+    def iterate_by_class(
+            classes: str | list[str],
+            types: bool = False) -> Iterator[Entity]:
+        for row in db.iterate_by_class(classes, types):
+            yield Entity(row)
+
+    @staticmethod
+    def get_ids_by_class(classes: str | list[str]) -> set[int]:
+        return set(db.get_ids_by_class(classes))
+
+    @staticmethod
+    def get_table_page(
+            query: dict[str, Any]) -> tuple[int, int, list[Entity]]:
+        # Returns total count, filtered count and entities of one page
+        query['class_order'] = sorted(
+            query['classes'],
+            key=lambda name: str(g.classes[name].label))
+        query['type_order'] = [
+            type_.id for type_ in sorted(
+                g.types.values(),
+                key=lambda type_: type_.name)
+            if type_.category == 'standard']
+        total = db.get_table_count(query)
+        count = db.get_table_count(query, True) \
+            if query.get('search') else total
+        ids = db.get_table_page_ids(query)
+        entities = {
+            row['id']: Entity(row) for row in db.get_by_ids(
+                ids,
+                types=True,
+                aliases=query.get('aliases', True) and any(
+                    g.classes[name].alias_allowed
+                    for name in query['classes']))}
+        return total, count, [entities[id_] for id_ in ids]
+
     @staticmethod
     def get_by_view(
             view: str,
@@ -385,6 +435,7 @@ class Entity:
     @staticmethod
     def get_display_files() -> list[Entity]:
         entities = []
+        g.files.load()
         for row in db.get_by_class('file', types=True):
             ext = g.files[row['id']].suffix if row['id'] in g.files else 'N/A'
             if ext in app.config['DISPLAY_FILE_EXT']:
@@ -454,19 +505,18 @@ class Entity:
 
     @staticmethod
     def get_similar_named(class_: str, ratio: int) -> dict[int, Any]:
+        entities = sorted(Entity.get_by_class(class_), key=lambda e: e.id)
         similar: dict[int, Any] = {}
         already_added: set[int] = set()
-        entities = Entity.get_by_class(class_)
-        for sample in [e for e in entities if e.id not in already_added]:
-            similar[sample.id] = {'entity': sample, 'entities': []}
-            for entity in entities:
-                if entity.id != sample.id \
-                        and fuzz.ratio(sample.name, entity.name) >= ratio:
-                    already_added.add(sample.id)
-                    already_added.add(entity.id)
-                    similar[sample.id]['entities'].append(entity)
-        return {
-            item: data for item, data in similar.items() if data['entities']}
+        for i, ids in sorted(get_similar_pairs(
+                [entity.name for entity in entities],
+                ratio).items()):
+            if i not in already_added:  # Only the first of a group is shown
+                already_added.update(ids)
+                similar[entities[i].id] = {
+                    'entity': entities[i],
+                    'entities': [entities[j] for j in ids]}
+        return similar
 
     @staticmethod
     def get_overview_counts() -> dict[str, int]:
@@ -505,6 +555,9 @@ class Entity:
         result = set()
         if codes:
             codes = codes if isinstance(codes, list) else [str(codes)]
+        if isinstance(entity_ids, int) and (links := Entity.get_prefetched(
+                entity_ids, codes or None, inverse)) is not None:
+            return links
         rows = db.get_links_of_entities(entity_ids, codes, inverse)
         for row in rows:
             result.add(row['domain_id'])
@@ -546,11 +599,68 @@ class Entity:
             inverse: bool = False,
             types: bool = False) -> list[Entity]:
         codes = codes if isinstance(codes, list) else [codes]
+        if (links := Entity.get_prefetched(id_, codes, inverse)) is not None:
+            entities = [link_.domain if inverse else link_.range
+                        for link_ in links]
+            return list({entity.id: entity for entity in entities}.values())
         return Entity.get_by_ids(
             db.get_linked_entities_inverse(id_, codes) if inverse
             else db.get_linked_entities(id_, codes),
             types=types)
 
+    @staticmethod
+    def prefetch_links(
+            entities: Iterable[Entity],
+            codes: Optional[list[str]] = None) -> list[Entity]:
+        # Links of entities are loaded at once to be used by get_links() and
+        # get_linked_entities() during the request, linked entities are
+        # returned. Types and reference systems are left out because they
+        # are cached per process and linked to many entities.
+        neighborhoods = g.neighborhoods
+        items = {
+            e.id: e for e in entities
+            if e.id not in neighborhoods
+            and e.id not in g.types
+            and e.id not in g.reference_systems}
+        if not items:
+            return []
+        rows = {
+            inverse: db.get_links_of_entities(list(items), codes, inverse)
+            for inverse in [False, True]}
+        linked_ids = {
+            row['domain_id' if inverse else 'range_id']
+            for inverse, rows_ in rows.items() for row in rows_}
+        Link.add_entities(items.values())
+        Link.add_entities(
+            Entity.get_by_ids(linked_ids - set(items), types=True))
+        linked = Link.get_entities([])
+        for id_ in items:
+            neighborhoods[id_] = {
+                'codes': set(codes) if codes else None,
+                False: [],
+                True: []}
+        for inverse, rows_ in rows.items():
+            for row in rows_:
+                neighborhoods[row['range_id' if inverse else 'domain_id']][
+                    inverse].append(Link(
+                        row,
+                        domain=linked[row['domain_id']],
+                        range_=linked[row['range_id']]))
+        return [linked[id_] for id_ in linked_ids]
+
+    @staticmethod
+    def get_prefetched(
+            id_: int,
+            codes: Optional[list[str]],
+            inverse: bool) -> Optional[list[Link]]:
+        item = g.neighborhoods.get(id_)
+        if not item or (item['codes'] is not None
+                        and (not codes or not set(codes) <= item['codes'])):
+            return None
+        return [
+            link_ for link_ in item[inverse]
+            if not codes or link_.property.code in codes]
+
     @staticmethod
     def get_linked_entity_safe_static(
             id_: int,
@@ -579,14 +689,15 @@ class Entity:
                 row['range_code'])
             if not valid_domain or not valid_range:
                 invalid_linking.append(row)
-        invalid_links = []
+        rows = []
         for item in invalid_linking:
-            for row in db.get_invalid_links(item):
-                invalid_links.append({
-                    'domain': Entity.get_by_id(row['domain_id']),
-                    'property': g.properties[row['property_code']],
-                    'range': Entity.get_by_id(row['range_id'])})
-        return invalid_links
+            rows += db.get_invalid_links(item)
+        entities = Link.get_entities(
+            [row[key] for row in rows for key in ['domain_id', 'range_id']])
+        return [{
+            'domain': entities[row['domain_id']],
+            'property': g.properties[row['property_code']],
+            'range': entities[row['range_id']]} for row in rows]
 
     @staticmethod
     def check_single_type_duplicates() -> list[dict[str, Any]]:
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from openatlas import app
+from openatlas.database import file as db
+
+
+class FileRegistry:
+    # Uploaded files by entity id, available as g.files. Rows are loaded on
+    # demand so requests which don't need files won't touch the database.
+
+    def __init__(self) -> None:
+        self.files: dict[int, dict[str, Any]] = {}
+        self.checked: set[int] = set()
+        self.complete = False
+
+    def load(self, ids: Optional[list[int]] = None) -> None:
+        if self.complete:
+            return
+        if ids is None:
+            rows = db.get_files()
+            self.complete = True
+        else:
+            if not (ids := [id_ for id_ in ids if id_ not in self.checked]):
+                return
+            rows = db.get_files(ids)
+            self.checked.update(ids)
+        for row in rows:
+            self.files[row['entity_id']] = row
+
+    def get_info(self, id_: int) -> Optional[dict[str, Any]]:
+        self.load([id_])
+        return self.files.get(id_)
+
+    def __contains__(self, id_: object) -> bool:
+        return isinstance(id_, int) and bool(self.get_info(id_))
+
+    def __getitem__(self, id_: int) -> Path:
+        if not (info := self.get_info(id_)):
+            raise KeyError(id_)
+        return app.config['UPLOAD_PATH'] / f"{id_}{info['extension']}"
+
+    def get(self, id_: int) -> Optional[Path]:
+        return self[id_] if id_ in self else None
+
+    def items(self) -> list[tuple[int, Path]]:
+        self.load()
+        return [(id_, self[id_]) for id_ in self.files]
+
+    def get_size(self, id_: int) -> Optional[int]:
+        return info['size'] if (info := self.get_info(id_)) else None
+
+    def get_created(self, id_: int) -> Optional[datetime]:
+        return info['created'] if (info := self.get_info(id_)) else None
+
+    def get_variants(self, id_: int) -> set[str]:
+        return set(info['variants']) if (info := self.get_info(id_)) else set()
+
+    def add_variants(self, id_: int, variants: list[str]) -> None:
+        db.add_variants(id_, variants)
+        if info := self.get_info(id_):
+            info['variants'] = sorted(set(info['variants']) | set(variants))
+
+    def add(self, id_: int, path: Path) -> None:
+        stat = path.stat()
+        data = {
+            'entity_id': id_,
+            'extension': path.suffix,
+            'size': stat.st_size,
+            'created': datetime.utcfromtimestamp(stat.st_ctime),
+            'modified': datetime.utcfromtimestamp(stat.st_mtime)}
+        db.insert(data)
+        data['variants'] = []
+        self.files[id_] = data
+        self.checked.add(id_)
+
+    def delete(self, id_: int) -> None:
+        db.delete([id_])
+        self.files.pop(id_, None)
+        self.checked.add(id_)
+
+    @staticmethod
+    def reconcile(entity_ids: list[int]) -> tuple[int, int]:
+        # Synchronize registry with the upload directory, e.g. after upgrades
+        # or if files were added or removed outside the application
+        registry = FileRegistry()
+        registry.load()
+        existing = set(entity_ids)
+        found = set()
+        updated = 0
+        for file_ in app.config['UPLOAD_PATH'].iterdir():
+            if not file_.is_file() \
+                    or not file_.stem.isdigit() \
+                    or int(file_.stem) not in existing:
+                continue
+            id_ = int(file_.stem)
+            found.add(id_)
+            stat = file_.stat()
+            info = registry.files.get(id_)
+            if not info \
+                    or info['extension'] != file_.suffix \
+                    or info['size'] != stat.st_size \
+                    or info['modified'] != \
+                    datetime.utcfromtimestamp(stat.st_mtime):
+                registry.add(id_, file_)
+                updated += 1
+        if removed := [id_ for id_ in registry.files if id_ not in found]:
+            db.delete(removed)
+        return updated, len(removed)
@@ -6,11 +6,11 @@ from typing import Any, Optional, TYPE_CHECKING
 from flask import g, json
 
 from openatlas.database import gis as db
+from openatlas.database.connect import Transaction
 from openatlas.display.util2 import sanitize
 
 if TYPE_CHECKING:  # pragma: no cover
     from openatlas.models.entity import Entity
-    from openatlas.models.imports import Project
 
 
 class InvalidGeomException(Exception):
@@ -30,17 +30,52 @@ class Gis:
     def get_wkt_by_id(id_: int) -> list[dict[str, Any]]:
         return db.get_wkt_by_id(id_)
 
+    @staticmethod
+    def get_layers() -> dict[str, dict[str, Any]]:
+        # GeoJSON of all places by shape, cached in the database until
+        # geometries, places or types change
+        layers = db.get_layers()
+        if len(layers) < 3:
+            Transaction.begin()
+            try:
+                layers = db.insert_layers(get_place_type_ids())
+                Transaction.commit()
+            except Exception:
+                Transaction.rollback()
+                raise
+        return layers
+
+    @staticmethod
+    def get_by_bbox(
+            bbox: tuple[float, float, float, float],
+            zoom: Optional[int] = None,
+            shapes: Optional[list[str]] = None) -> tuple[str, int]:
+        # Geometries are simplified to one pixel at the given zoom level and
+        # points are clustered below the zoom level clustering is disabled at
+        pixel = 360 / (256 * 2 ** min(max(zoom, 0), 30)) \
+            if zoom is not None else 0
+        cluster = zoom is not None \
+            and zoom < g.settings['map_cluster_disable_at_zoom']
+        result = db.get_by_bbox(
+            bbox,
+            shapes or ['point', 'linestring', 'polygon'],
+            get_place_type_ids(),
+            pixel,
+            pixel * g.settings['map_cluster_max_radius'] if cluster else 0)
+        return result['geojson'], result['count']
+
+    @staticmethod
+    def get_extent() -> Optional[list[list[float]]]:
+        return db.get_extent()
+
     @staticmethod
     def get_all(
             objects: Optional[list[Entity]] = None,
-            structure: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+            structure: Optional[dict[str, Any]] = None,
+            dynamic: bool = False) -> dict[str, Any]:
 
         if not objects:
             objects = []
-        all_: dict[str, list[Any]] = {
-            'point': [],
-            'linestring': [],
-            'polygon': []}
         extra: dict[str, list[Any]] = {
             'supers': [],
             'subs': [],
@@ -54,7 +89,7 @@ class Gis:
         # Include GIS of subunits which would be otherwise omitted
         subunit_ids = []
         sibling_ids = []
-        extra_ids = [0]
+        extra_ids = []
         if structure:
             subunit_ids = [e.id for e in structure['subunits']]
             sibling_ids = [e.id for e in structure['siblings']]
@@ -66,7 +101,11 @@ class Gis:
                 + subunit_ids \
                 + sibling_ids
         object_ids = [x.id for x in objects] if objects else []
-        for row in db.get_all(extra_ids):
+        # Places shown in other layers are filtered from the cached layers
+        # of all places in map.js
+        for row in db.get_by_object_ids(
+                [e.id for e in objects if e.class_.name == 'place']
+                + extra_ids):
             description = row['description'].replace('"', '\"') \
                 if row['description'] else ''
             object_desc = row['object_desc'].replace('"', '\"') \
@@ -111,8 +150,6 @@ class Gis:
                 extra['subs'].append(item)  # pragma: no cover
             elif row['object_id'] in sibling_ids:
                 extra['siblings'].append(item)  # pragma: no cover
-            else:
-                all_[shape].append(item)
             if row['polygon_point']:
                 polygon_point_item = dict(item)  # Make a copy
                 polygon_point_item['geometry'] = json.loads(
@@ -130,17 +167,22 @@ class Gis:
                 elif row['object_id'] in sibling_ids:
                     extra['siblings'].append(
                         polygon_point_item)  # pragma: no cover
-                else:
-                    all_['point'].append(polygon_point_item)
+        # Dynamic maps load the visible places with the map bounds instead
+        layers = {
+            name: {'geojson': '[]'}
+            for name in ['point', 'linestring', 'polygon']} \
+            if dynamic else Gis.get_layers()
         return {
-            'gisPointAll': json.dumps(all_['point']),
+            'gisDynamic': 'true' if dynamic else 'false',
+            'gisExtent': json.dumps(Gis.get_extent() if dynamic else None),
+            'gisPointAll': layers['point']['geojson'],
             'gisPointSelected': json.dumps(selected['point']),
             'gisPointSupers': json.dumps(extra['supers']),
             'gisPointSubs': json.dumps(extra['subs']),
             'gisPointSibling': json.dumps(extra['siblings']),
-            'gisLineAll': json.dumps(all_['linestring']),
+            'gisLineAll': layers['linestring']['geojson'],
             'gisLineSelected': json.dumps(selected['linestring']),
-            'gisPolygonAll': json.dumps(all_['polygon']),
+            'gisPolygonAll': layers['polygon']['geojson'],
             'gisPolygonSelected': json.dumps(selected['polygon']),
             'gisPolygonPointSelected': json.dumps(selected['polygon_point']),
             'gisAllSelected': json.dumps(
@@ -167,21 +209,12 @@ class Gis:
                         'type': item['properties']['shapeType'],
                         'geojson': json.dumps(item['geometry'])})
 
-    @staticmethod
-    def insert_import(
-            entity: Entity,
-            location: Entity,
-            project: Project,
-            easting: float,
-            northing: float) -> None:
-        db.insert_import({
-            'entity_id': location.id,
-            'description':
-                f"Imported centerpoint of {sanitize(entity.name, 'text')} "
-                f"from the {sanitize(project.name, 'text')} project",
-            'geojson':
-                f'{{"type":"Point", "coordinates": [{easting},{northing}]}}'})
-
     @staticmethod
     def delete_by_entity(entity: Entity) -> None:
         db.delete_by_entity_id(entity.id)
+
+
+def get_place_type_ids() -> list[int]:
+    return [
+        type_.id for type_ in g.types.values()
+        if type_.root and g.types[type_.root[0]].name == 'Place']
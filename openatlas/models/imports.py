@@ -1,12 +1,10 @@
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from flask import g
 from flask_login import current_user
 
 from openatlas.database import imports as db
 from openatlas.display.util2 import sanitize
-from openatlas.models.entity import Entity
-from openatlas.models.gis import Gis
 
 
 class Project:
@@ -59,68 +57,88 @@ class Import:
             sanitize(project.description, 'text'))
 
     @staticmethod
-    def check_type_id(type_id: str, class_: str) -> bool:
-        if not type_id.isdigit() or int(type_id) not in g.types:
-            return False
-        if class_ not in g.types[
-                g.types[int(type_id)].root[-1]].classes:  # pragma: no cover
-            return False
-        return True  # pragma: no cover
+    def get_type_ids(class_: str) -> set[str]:
+        return {
+            str(id_) for id_, type_ in g.types.items()
+            if type_.root and class_ in g.types[type_.root[-1]].classes}
 
     @staticmethod
-    def import_data(project: Project, class_: str, data: list[Any]) -> None:
-        for row in data:
-            entity = Entity.insert(
-                class_,
-                row['name'],
-                row['description'] if 'description' in row else None)
-            db.import_data(
-                project.id,
-                entity.id,
-                current_user.id,
-                origin_id=row['id'] if 'id' in row and row['id'] else None)
-
-            # Dates
-            dates = {
-                'begin_from': None, 'begin_to': None, 'begin_comment': None,
-                'end_from': None, 'end_to': None, 'end_comment': None}
-            if 'begin_from' in row and row['begin_from']:
-                dates['begin_from'] = row['begin_from']
-                if 'begin_to' in row and row['begin_to']:
-                    dates['begin_to'] = row['begin_to']
-                if 'begin_comment' in row and row['begin_comment']:
-                    dates['begin_comment'] = row['begin_comment']
-            if 'end_from' in row and row['end_from']:
-                dates['end_from'] = row['end_from']
-                if 'end_to' in row and row['end_to']:
-                    dates['end_to'] = row['end_to']
-                if 'end_comment' in row and row['end_comment']:
-                    dates['end_comment'] = row['end_comment']
-            entity.update({'attributes': dates})
-
-            # Types
-            if 'type_ids' in row and row['type_ids']:
-                for type_id in str(row['type_ids']).split():
-                    if not Import.check_type_id(type_id, class_):
-                        continue
-                    entity.link('P2', g.types[int(type_id)])  # pragma no cover
-
-            # GIS
-            if class_ == 'place':
-                location = Entity.insert(
-                    'object_location',
-                    f"Location of {row['name']}")
-                entity.link('P53', location)
-                if 'easting' in row \
-                        and is_float(row['easting']) \
-                        and 'northing' in row \
-                        and is_float(row['northing']):
-                    Gis.insert_import(
-                        entity=entity,
-                        location=location,
-                        project=project,
-                        easting=row['easting'],
-                        northing=row['northing'])
+    def import_data(
+            project: Project,
+            class_: str,
+            chunks: Iterable[list[dict[str, Any]]]) -> None:
+        type_ids = Import.get_type_ids(class_)
+        db.create_import_staging()
+        number = 0
+        for chunk in chunks:
+            rows = []
+            for row in chunk:
+                rows.append(Import.prepare_row(
+                    project,
+                    class_,
+                    row,
+                    number,
+                    type_ids))
+                number += 1
+            db.stage_import(rows)
+        db.import_entities(
+            project.id,
+            current_user.id,
+            class_,
+            g.classes[class_].cidoc_class.code)
+        db.import_types()
+        if class_ == 'place':
+            db.import_locations(g.classes['object_location'].cidoc_class.code)
+
+    @staticmethod
+    def prepare_row(
+            project: Project,
+            class_: str,
+            row: dict[str, Any],
+            number: int,
+            type_ids: set[str]) -> dict[str, Any]:
+        name = row['name'].strip()
+        item = {
+            'number': number,
+            'name': name,
+            'description':
+                sanitize(row['description'], 'text') or None
+                if row.get('description') else None,
+            'origin_id': row.get('id') or None,
+            'begin_from': None, 'begin_to': None, 'begin_comment': None,
+            'end_from': None, 'end_to': None, 'end_comment': None,
+            'type_ids': None,
+            'easting': None,
+            'northing': None,
+            'gis_description': None}
+
+        # Dates
+        for prefix in ['begin', 'end']:
+            if row.get(f'{prefix}_from'):
+                item[f'{prefix}_from'] = row[f'{prefix}_from']
+                item[f'{prefix}_to'] = row.get(f'{prefix}_to') or None
+                if row.get(f'{prefix}_comment'):
+                    item[f'{prefix}_comment'] = \
+                        str(row[f'{prefix}_comment']).strip() or None
+
+        # Types
+        if ids := [
+                id_ for id_ in str(row.get('type_ids') or '').split()
+                if id_ in type_ids]:
+            item['type_ids'] = f"{{{','.join(ids)}}}"
+
+        # GIS
+        if class_ == 'place' \
+                and 'easting' in row \
+                and is_float(row['easting']) \
+                and 'northing' in row \
+                and is_float(row['northing']):
+            item['easting'] = float(row['easting'])
+            item['northing'] = float(row['northing'])
+            item['gis_description'] = \
+                f"Imported centerpoint of {sanitize(name, 'text')} " \
+                f"from the {sanitize(project.name, 'text')} project"
+        return item
 
 
 def is_float(value: int | float) -> bool:
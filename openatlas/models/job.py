@@ -0,0 +1,143 @@
+import multiprocessing
+import subprocess
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, wait)
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from flask import g
+from psycopg2 import extras
+
+from openatlas import app
+from openatlas.database import job as db
+from openatlas.database.connect import close_connection, get_connection
+from openatlas.display.image_processing import resize_image
+from openatlas.display.util import (
+    check_iiif_activation, get_file_path, get_iiif_command)
+from openatlas.models.file import FileRegistry
+from openatlas.models.logger import Logger
+from openatlas.models.registry import Registry
+
+
+class Job:
+    @staticmethod
+    def add(name: str, ids: list[int], retry: bool = True) -> None:
+        if ids:
+            db.insert(name, ids, retry)
+
+    @staticmethod
+    def get_counts() -> dict[str, dict[str, int]]:
+        return db.get_counts()
+
+    @staticmethod
+    def get_failed() -> list[dict[str, Any]]:
+        return db.get_failed()
+
+    @staticmethod
+    def retry_failed() -> None:
+        db.retry_failed()
+
+    @staticmethod
+    def delete_done() -> None:
+        db.delete_done()
+
+
+def work(once: bool = False) -> None:
+    # Processes pending jobs until stopped, or until none are left if once is
+    # set. Worker processes are spawned to not inherit database connections.
+    processes = app.config['JOB_PROCESSES']
+    with job_context():
+        db.reset_running(app.config['JOB_MAX_ATTEMPTS'])
+    running: dict[Future[list[str]], dict[str, Any]] = {}
+    done: set[Future[list[str]]] = set()
+    with ProcessPoolExecutor(
+            processes,
+            mp_context=multiprocessing.get_context('spawn')) as executor:
+        while True:
+            with job_context():
+                for future in done:
+                    job = running.pop(future)
+                    if error := future.exception():
+                        finish(job, error)
+                    else:
+                        finish(job, variants=future.result())
+                if len(running) < processes:
+                    for job in db.claim(processes - len(running)):
+                        try:
+                            running[executor.submit(*get_task(job))] = job
+                        except Exception as e:
+                            finish(job, e)
+            if running:
+                done, _ = wait(
+                    running,
+                    app.config['JOB_INTERVAL'],
+                    FIRST_COMPLETED)
+            elif once:
+                return
+            else:
+                done = set()
+                time.sleep(app.config['JOB_INTERVAL'])
+
+
+@contextmanager
+def job_context() -> Iterator[None]:
+    # Database connection, settings, files and logger needed by jobs, without
+    # the setup of requests like users, sessions and languages
+    with app.app_context():
+        g.db = get_connection(app.config)
+        g.db.autocommit = True
+        g.cursor = g.db.cursor(cursor_factory=extras.DictCursor)
+        g.open_cursors = 0
+        try:
+            Registry.load_settings()
+            g.logger = Logger()
+            g.files = FileRegistry()
+            yield
+        finally:
+            close_connection()
+
+
+def get_task(job: dict[str, Any]) -> tuple[Any, ...]:
+    if not (path := get_file_path(job['entity_id'])):
+        raise FileNotFoundError('file not found')
+    match job['name']:
+        case 'iiif':
+            if not check_iiif_activation() \
+                    or not g.settings['iiif_conversion']:
+                raise ValueError('IIIF conversion is not activated')
+            return run_command, get_iiif_command(job['entity_id'], path)
+        case 'resize':
+            return resize_image, path.stem, path.suffix.lower()
+    raise ValueError(f"unknown job {job['name']}")
+
+
+def finish(
+        job: dict[str, Any],
+        error: Optional[BaseException] = None,
+        variants: Optional[list[str]] = None) -> None:
+    status = db.finish(
+        job['name'],
+        job['entity_id'],
+        (str(error) or type(error).__name__) if error else None,
+        app.config['JOB_MAX_ATTEMPTS'])
+    if status == 'done' and variants:
+        g.files.add_variants(job['entity_id'], variants)
+    elif status == 'failed':
+        g.logger.log(
+            'error',
+            'job',
+            f"{job['name']} of file {job['entity_id']} failed",
+            error)
+
+
+def run_command(command: list[Any]) -> list[str]:
+    process = subprocess.run(
+        command,
+        capture_output=True,
+        text=True,
+        check=False)
+    if process.returncode:
+        raise OSError(
+            process.stderr.strip() or f'exit status {process.returncode}')
+    return []
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Iterable, Iterator, Optional, TYPE_CHECKING
 
 from flask import g
 
@@ -21,12 +21,11 @@ class Link:
             row: dict[str, Any],
             domain: Optional[Entity] = None,
             range_: Optional[Entity] = None) -> None:
-        from openatlas.models.entity import Entity
         self.id = row['id']
         self.description = row['description']
         self.property = g.properties[row['property_code']]
-        self.domain = domain or Entity.get_by_id(row['domain_id'])
-        self.range = range_ or Entity.get_by_id(row['range_id'])
+        self.domain = domain or Link.get_entity(row['domain_id'])
+        self.range = range_ or Link.get_entity(row['range_id'])
         self.type = g.types[row['type_id']] if row['type_id'] else None
         self.types: dict[Entity, None] = {}
         if 'type_id' in row and row['type_id']:
@@ -46,6 +45,7 @@ class Link:
                 if self.end_to else self.last
 
     def update(self) -> None:
+        g.neighborhoods.clear()
         db.update({
             'id': self.id,
             'property_code': self.property.code,
@@ -72,6 +72,43 @@ class Link:
     def get_by_id(id_: int) -> Link:
         return Link(db.get_by_id(id_))
 
+    @staticmethod
+    def get_by_ids(ids: list[int]) -> list[Link]:
+        return Link.get_by_rows(db.get_by_ids(ids)) if ids else []
+
+    @staticmethod
+    def get_by_rows(rows: list[dict[str, Any]]) -> list[Link]:
+        entities = Link.get_entities(
+            [row[key] for row in rows for key in ['domain_id', 'range_id']])
+        return [
+            Link(
+                row,
+                domain=entities[row['domain_id']],
+                range_=entities[row['range_id']])
+            for row in rows]
+
+    @staticmethod
+    def get_entities(ids: Iterable[int]) -> dict[int, Entity]:
+        # Request scoped identity map of linked entities, missing ones are
+        # fetched with one query and shared between links
+        from openatlas.models.entity import Entity
+        entities: dict[int, Entity] = g.link_entities
+        if missing := {id_ for id_ in ids if id_ not in entities}:
+            Link.add_entities(Entity.get_by_ids(missing))
+        return entities
+
+    @staticmethod
+    def add_entities(entities: Iterable[Entity]) -> None:
+        g.link_entities.update(
+            {entity.id: entity for entity in entities})
+
+    @staticmethod
+    def get_entity(id_: int) -> Entity:
+        from openatlas.models.entity import Entity
+        if entity := Link.get_entities([id_]).get(id_):
+            return entity
+        return Entity.get_by_id(id_)  # Aborts if entity doesn't exist
+
     @staticmethod
     def get_links_by_type(type_: Type) -> list[dict[str, Any]]:
         return db.get_links_by_type(type_.id)
@@ -92,21 +129,20 @@ class Link:
     @staticmethod
     def delete_(id_: int) -> None:
         db.delete_(id_)
+        g.neighborhoods.clear()
 
     @staticmethod
     def invalid_involvement_dates() -> list[Link]:
-        return [
-            Link.get_by_id(row['id'])
-            for row in date.invalid_involvement_dates()]
+        return Link.get_by_ids(
+            [row['id'] for row in date.invalid_involvement_dates()])
 
     @staticmethod
     def get_invalid_link_dates() -> list[Link]:
-        return [
-            Link.get_by_id(row['id'])
-            for row in date.get_invalid_link_dates()]
+        return Link.get_by_ids(
+            [row['id'] for row in date.get_invalid_link_dates()])
 
     @staticmethod
-    def check_link_duplicates() -> list[dict[str, Any]]:
+    def check_link_duplicates() -> Iterator[dict[str, Any]]:
         return db.check_link_duplicates()
 
     @staticmethod
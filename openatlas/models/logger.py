@@ -1,6 +1,6 @@
 from typing import Any
 
-from flask import g, request
+from flask import g, has_request_context, request
 from flask_login import current_user
 
 from openatlas import app
@@ -35,7 +35,8 @@ class Logger:
                 'message': message,
                 'user_id': current_user.id
                 if hasattr(current_user, 'id') else None,
-                'info': f'{request.method} {request.method}\n{info}'})
+                'info': f'{request.method} {request.method}\n{info}'
+                if has_request_context() else f'{info}'})
 
     @staticmethod
     def get_system_logs(
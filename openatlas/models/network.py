@@ -2,6 +2,7 @@ from typing import Optional
 
 from flask import g
 
+from openatlas import app
 from openatlas.database import network as db
 from openatlas.models.entity import Entity
 
@@ -16,31 +17,43 @@ class Network:
             colors: dict[str, str],
             id_: int,
             depth: int,
-            dimensions: Optional[int]) -> Optional[str]:
+            dimensions: Optional[int]) -> tuple[Optional[str], bool]:
+        # Only links of entities found in the previous level are queried.
+        # Locations are mapped to their places and if the node limit is
+        # reached, further entities are left out and truncated is returned.
         mapping = db.get_object_mapping()
+        locations = {
+            place_id: location_id for location_id, place_id in mapping.items()}
+        max_nodes = app.config['EGO_NETWORK_MAX_NODES']
         entity_ids = {id_}
-        location_id = 0
-        if id_ in mapping.values():
-            location_id = \
-                list(mapping.keys())[list(mapping.values()).index(id_)]
-            entity_ids.add(location_id)
-        edges = []
+        frontier = {id_}
+        edges: dict[int, dict[str, int]] = {}
+        truncated = False
         for _ in range(depth):
-            for row in db.get_ego_network(entity_ids):
-                if row['property_code'] in Network.properties:
-                    domain_id = mapping[row['domain_id']] \
-                        if row['domain_id'] in mapping else row['domain_id']
-                    range_id = mapping[row['range_id']] \
-                        if row['range_id'] in mapping else row['range_id']
-                    entity_ids.add(domain_id)
-                    entity_ids.add(range_id)
-                    edges.append({
+            found = set()
+            for row in db.get_ego_network(
+                    frontier | {
+                        locations[entity_id] for entity_id in frontier
+                        if entity_id in locations},
+                    Network.properties):
+                domain_id = mapping.get(row['domain_id'], row['domain_id'])
+                range_id = mapping.get(row['range_id'], row['range_id'])
+                for node_id in [domain_id, range_id]:
+                    if node_id in entity_ids:
+                        continue
+                    if len(entity_ids) >= max_nodes:
+                        truncated = True
+                        continue
+                    entity_ids.add(node_id)
+                    found.add(node_id)
+                if domain_id in entity_ids and range_id in entity_ids:
+                    edges[row['id']] = {
                         'id': row['id'],
                         'source': domain_id,
-                        'target': range_id})
+                        'target': range_id}
+            if not (frontier := found):
+                break
         nodes = []
-        if location_id in entity_ids:
-            entity_ids.remove(location_id)
         for entity in Entity.get_by_ids(entity_ids):
             nodes.append({
                 'id': entity.id,
@@ -50,7 +63,8 @@ class Network:
                 if entity.class_.name in colors else '#333333'})
         return str({
             'nodes': nodes,
-            'edges' if dimensions else 'links': edges}) if nodes else None
+            'edges' if dimensions else 'links': list(edges.values())}) \
+            if nodes else None, truncated
 
     @staticmethod
     def get_network_json(
@@ -16,7 +16,6 @@ class ReferenceSystem(Entity):
         self.placeholder = row['identifier_example']
         self.precision_default_id = \
             list(self.types)[0].id if self.types else None
-        self.count = row['count']
         self.system = row['system']
         self.classes: list[str] = []
 
@@ -24,6 +23,10 @@ class ReferenceSystem(Entity):
         self.update_system(data)
         return super().update(data, new)
 
+    @staticmethod
+    def get_counts() -> dict[int, int]:
+        return db.get_counts()
+
     @staticmethod
     def get_all() -> dict[int, ReferenceSystem]:
         systems = {}
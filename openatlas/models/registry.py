@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from datetime import datetime
+from threading import Lock
+from typing import Any, Optional
+
+from flask import g
+
+from openatlas.database import registry as db
+from openatlas.models.cidoc_class import CidocClass
+from openatlas.models.cidoc_property import CidocProperty
+from openatlas.models.openatlas_class import OpenatlasClass
+from openatlas.models.reference_system import ReferenceSystem
+from openatlas.models.settings import Settings
+from openatlas.models.type import Type
+
+
+class Registry:
+    # Model data needed in every request, cached per process and language.
+    # Database triggers raise the version if the underlying data changes.
+    lock = Lock()
+    version: Optional[datetime] = None
+    settings: dict[str, Any] = {}
+    languages: dict[str, dict[str, Any]] = {}
+
+    @staticmethod
+    def load_settings() -> None:
+        version = db.get_version()
+        with Registry.lock:
+            if version != Registry.version:
+                Registry.settings = Settings.get_settings()
+                Registry.languages = {}
+                Registry.version = version
+            g.settings = Registry.settings
+
+    @staticmethod
+    def load(language: str) -> None:
+        with Registry.lock:
+            if language not in Registry.languages:
+                Registry.languages[language] = Registry.build(language)
+            registry = Registry.languages[language]
+        for name, value in registry.items():
+            setattr(g, name, value)
+
+    @staticmethod
+    def build(language: str) -> dict[str, Any]:
+        g.cidoc_classes = CidocClass.get_all(language)
+        g.properties = CidocProperty.get_all(language)
+        g.classes = OpenatlasClass.get_all()
+        g.types = Type.get_all()
+        g.reference_systems = ReferenceSystem.get_all()
+        return {
+            'cidoc_classes': g.cidoc_classes,
+            'properties': g.properties,
+            'classes': g.classes,
+            'types': g.types,
+            'reference_systems': g.reference_systems,
+            'geonames': g.get('geonames'),
+            'wikidata': g.get('wikidata'),
+            'radiocarbon_type': Type.get_hierarchy('Radiocarbon'),
+            'sex_type': Type.get_hierarchy('Features for sexing'),
+            'reference_match_type':
+                Type.get_hierarchy('External reference match')}
+
+    @staticmethod
+    def clear() -> None:
+        with Registry.lock:
+            Registry.version = None
+            Registry.languages = {}
@@ -0,0 +1,84 @@
+from collections import Counter, defaultdict
+
+from fuzzywuzzy import fuzz
+
+# Names are compared with fuzz.ratio which is 100 * 2 * M / (la + lb) where
+# M is the length of a common subsequence. To avoid comparing every name with
+# every other, candidate pairs are generated with bounds that no pair
+# reaching the ratio can violate:
+# - the shorter name limits M, so lengths can't differ too much
+# - both names share a minimum count of q-grams, see get_min_shared()
+# With a global order of q-grams (rarest first) two names sharing T q-grams
+# have to share one of their first len(q-grams) - T + 1 q-grams (prefix
+# filter), so only these prefixes are indexed. Names too short to get a
+# positive T are compared with all names of a suitable length.
+
+
+def get_similar_pairs(names: list[str], ratio: int) -> dict[int, list[int]]:
+    # Rounded ratios reach the given ratio from (ratio - 0.5) / 100 on,
+    # k / 400 is used instead to avoid floating point errors.
+    k = 2 * ratio - 1
+    if k >= 400:
+        return {}
+    if k <= 0:
+        return {
+            i: [j for j in range(len(names)) if j != i]
+            for i in range(len(names))}
+    q = 3 if ratio >= 90 else 2  # Trigrams are more selective but need
+    by_length: dict[int, list[int]] = defaultdict(list)  # higher ratios
+    for i, name in enumerate(names):
+        by_length[len(name)].append(i)
+    grams = [get_q_grams(name, q) for name in names]
+    gram_sets = [set(items) for items in grams]
+    frequency = Counter(gram for items in grams for gram in items)
+    min_shared = [
+        min((get_min_shared(len(name) + length, k, q)
+             for length in get_length_range(len(name), k)), default=0)
+        for name in names]
+    index: dict[tuple[str, int], list[int]] = defaultdict(list)
+    similar: dict[int, set[int]] = defaultdict(set)
+    for i, name in enumerate(names):
+        lengths = get_length_range(len(name), k)
+        if min_shared[i] > 0:  # Compare with names indexed before
+            prefix = sorted(
+                grams[i],
+                key=lambda gram: (frequency[gram], gram)
+            )[:len(grams[i]) - min_shared[i] + 1]
+            candidates = {j for gram in prefix for j in index[gram]}
+            for gram in prefix:
+                index[gram].append(i)
+        else:  # Compare with all names of suitable length, but only once
+            candidates = {
+                j for length in lengths for j in by_length.get(length, [])
+                if j < i or (j > i and min_shared[j] > 0)}
+        for j in candidates:
+            if len(names[j]) in lengths \
+                    and len(gram_sets[i] & gram_sets[j]) >= get_min_shared(
+                        len(name) + len(names[j]), k, q) \
+                    and fuzz.ratio(name, names[j]) >= ratio:
+                similar[i].add(j)
+                similar[j].add(i)
+    return {i: sorted(ids) for i, ids in similar.items()}
+
+
+def get_q_grams(name: str, q: int) -> list[tuple[str, int]]:
+    # Repeated q-grams are numbered to count them like a multiset
+    count: Counter[str] = Counter()
+    grams = []
+    for i in range(len(name) - q + 1):
+        gram = name[i:i + q]
+        grams.append((gram, count[gram]))
+        count[gram] += 1
+    return grams
+
+
+def get_length_range(length: int, k: int) -> range:
+    # Lengths for which 2 * min(la, lb) / (la + lb) can reach k / 400
+    return range(-(-k * length // (400 - k)), (400 - k) * length // k + 1)
+
+
+def get_min_shared(length_sum: int, k: int, q: int) -> int:
+    # Every character not in M breaks at most q q-grams of its own name and
+    # at most q - 1 q-grams of the other name
+    m = -(-k * length_sum // 400)
+    return (2 * q - 1) * m - (q - 1) * (length_sum + 1)
@@ -19,8 +19,6 @@ app.config['PROPERTY_TYPES'] = [
 
 
 class Type(Entity):
-    count = 0
-    count_subs = 0
     category = ''
     multiple = False
     required = False
@@ -32,6 +30,17 @@ class Type(Entity):
         self.subs: list[int] = []
         self.classes: list[str] = []
 
+    @property
+    def count(self) -> int:
+        Type.load_counts([self.id])
+        return g.type_counts[self.id]
+
+    @property
+    def count_subs(self) -> int:
+        sub_ids = self.get_sub_ids_recursive()
+        Type.load_counts(sub_ids)
+        return sum(g.type_counts[id_] for id_ in sub_ids)
+
     def get_sub_ids_recursive(
             self,
             subs: Optional[list[int]] = None) -> list[int]:
@@ -117,13 +126,11 @@ class Type(Entity):
                 db.remove_entity_type(self.id, delete_ids)
 
     @staticmethod
-    def get_all(with_count: bool) -> dict[int, Type]:
+    def get_all() -> dict[int, Type]:
         types = {}
-        for row in db.get_types(with_count):
+        for row in db.get_types():
             type_ = Type(row)
             types[type_.id] = type_
-            type_.count = row['count'] or row['count_property']
-            type_.count_subs = 0
             type_.subs = []
             type_.root = [row['super_id']] if row['super_id'] else []
         Type.populate_subs(types)
@@ -151,6 +158,13 @@ class Type(Entity):
                     if class_.hierarchies and type_.id in class_.hierarchies:
                         type_.classes.append(class_.name)
 
+    @staticmethod
+    def load_counts(ids: list[int]) -> None:
+        counts = g.type_counts
+        if missing := [id_ for id_ in ids if id_ not in counts]:
+            counts.update(dict.fromkeys(missing, 0))
+            counts.update(db.get_counts(missing))
+
     @staticmethod
     def get_root_path(
             types: dict[int, Type],
@@ -158,7 +172,6 @@ class Type(Entity):
             super_id: int,
             root: list[int]) -> list[int]:
         super_ = types[super_id]
-        super_.count_subs += type_.count
         if not super_.root:
             return root
         type_.root.insert(0, super_.root[-1])
@@ -229,6 +242,7 @@ class Type(Entity):
 
     @staticmethod
     def get_type_orphans() -> list[Type]:
+        Type.load_counts(list(g.types))
         return [
             node for key, node in g.types.items()
             if node.root
@@ -191,15 +191,8 @@ async function ajaxAddEntity(data) {
   return newEntityId;
 }
 
-async function refillTable(id, filterIds = []) {
-  const tableContent = await $.ajax({
-    type: 'post',
-    url: `/ajax/get_entity_table/${id}`,
-    data: {filterIds: JSON.stringify(filterIds)},
-  });
-  $(`#${id}-modal .modal-body-table`)
-    .empty()
-    .append($(`${tableContent}`));
+function refillTable(id) {
+  return new Promise(resolve => $(`#${id}_table`).DataTable().ajax.reload(resolve));
 }
 
 async function ajaxAddType(data, fieldId, typeId, multiple=false) {
@@ -307,24 +300,36 @@ function selectFromTable(element, table, id,label= undefined) {
   $('#' + table + '-modal').modal('hide');
 }
 
+/* Selected entities of table multi fields by field id, rows are loaded page
+   by page so the selection can't be read from the table */
+const tableMultiSelection = {};
+
+function toggleFromTableMulti(name, checkbox) {
+  if (checkbox.checked) {
+    tableMultiSelection[name].set(parseInt(checkbox.id), checkbox.value);
+  } else {
+    tableMultiSelection[name].delete(parseInt(checkbox.id));
+  }
+  selectFromTableMulti(name);
+}
+
+function checkTableMulti(name) {
+  $(`#${name}_table`).find('input[type="checkbox"]').each(function () {
+    $(this).prop('checked', tableMultiSelection[name].has(parseInt(this.id)));
+  });
+}
+
 function deselectFromTable(tableName, nodeId) {
-  $(`#${tableName}_table`)?.find(`#${nodeId}[type="checkbox"]`)?.prop( "checked", false )
-  selectFromTableMulti(tableName)
+  tableMultiSelection[tableName].delete(nodeId);
+  checkTableMulti(tableName);
+  selectFromTableMulti(tableName);
 }
 
 function selectFromTableMulti(name) {
-  let checkedNames = [];
-  let ids = [];
-  $('#' + name + '_table').DataTable().rows().nodes().to$().find('input[type="checkbox"]').each(
-    function () {
-      if ($(this).is(':checked')) {
-        checkedNames.push({name:$(this).val(),id:$(this).attr('id')});
-        ids.push($(this).attr('id'));
-      }
-    });
+  const selection = [...tableMultiSelection[name]];
   $('#' + name + '-selection')
-      .html(checkedNames.map(x => closableBadge(x.name,`deselectFromTable('${name}',${x.id})`)));
-  $('#' + name).val(ids.length > 0 ? '[' + ids + ']' : '').trigger('change');
+      .html(selection.map(([id, label]) => closableBadge(label,`deselectFromTable('${name}',${id})`)));
+  $('#' + name).val(selection.length > 0 ? '[' + selection.map(([id]) => id) + ']' : '').trigger('change');
 }
 
 function clearSelect(name) {
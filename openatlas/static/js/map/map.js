@@ -131,7 +131,13 @@ const polygonFilter = (feature) => feature?.geometry?.type === "Polygon";
 const lineFilter = (feature) => feature?.geometry?.type === "LineString";
 
 
-const gisAll = [...gisPointAll, ...gisPolygonAll, ...gisLineAll];
+// Layers of all places are cached, so places shown in other layers are removed
+const gisShownIds = new Set([
+  ...gisPointSelected, ...gisLineSelected, ...gisPolygonSelected,
+  ...gisPointSupers, ...gisPointSubs, ...gisPointSibling,
+].map(feature => feature.properties.objectId));
+const gisAll = [...gisPointAll, ...gisPolygonAll, ...gisLineAll]
+  .filter(feature => !gisShownIds.has(feature.properties.objectId));
 
 //take selected from hidden fields if exist
 const hiddenFieldPoints = $("#gis_points")?.val(),
@@ -147,6 +153,8 @@ const pointLayer = new L.GeoJSON(gisAll, {
   filter: pointFilter,
   onEachFeature: setPopup(false),
   pointToLayer: function (feature, latlng) {
+    if (feature.properties.cluster)
+      return L.marker(latlng, {icon: clusterIcon(feature.properties.count)});
     return L.circleMarker(latlng, myCircleStyle);
   },
 });
@@ -222,10 +230,13 @@ const linestringLayerSubs = new L.GeoJSON(gisPointSubs, {
 });
 
 //clustering
+// Points clustered on the server count for the places they contain
 const cluster = L.markerClusterGroup({
   showCoverageOnHover: false,
   maxClusterRadius: maxClusterRadius,
   disableClusteringAtZoom: disableClusteringAtZoom,
+  iconCreateFunction: (group) => clusterIcon(group.getAllChildMarkers()
+    .reduce((sum, marker) => sum + (marker.feature?.properties?.count || 1), 0)),
 });
 cluster.addLayer(pointLayer);
 map.addLayer(cluster);
@@ -248,10 +259,49 @@ if (allSelected?.length > 0)
   map.fitBounds(L.featureGroup(allSelectedLayer).getBounds(), {
     maxZoom: mapDefaultZoom,
   });
+else if (gisDynamic && gisExtent)
+  map.fitBounds(gisExtent, {maxZoom: mapDefaultZoom});
 else if (Object.keys(pointLayer?.getBounds()).length !== 0)
   map.fitBounds(pointLayer.getBounds(), {maxZoom: mapDefaultZoom});
 else map.setView([30, 0], 2);
 
+// Dynamic maps load the places of a padded area around the visible one
+// again if the zoom changes or the map is moved out of it
+let loadedBounds = null;
+let loadedZoom = null;
+let loadRequest = 0;
+function loadLayers() {
+  if (loadedZoom === map.getZoom() && loadedBounds?.contains(map.getBounds()))
+    return;
+  const bounds = map.getBounds().pad(0.5);
+  const zoom = map.getZoom();
+  const request = ++loadRequest;
+  $.getJSON('/api/geometric_entities/', {
+    bbox: [
+      Math.max(bounds.getWest(), -180),
+      Math.max(bounds.getSouth(), -90),
+      Math.min(bounds.getEast(), 180),
+      Math.min(bounds.getNorth(), 90)].join(','),
+    zoom: zoom,
+  }, function (data) {
+    if (request !== loadRequest) return;
+    const features = data.features
+      .filter(feature => !gisShownIds.has(feature.properties.objectId));
+    [pointLayer, polygonLayer, linestringLayer].forEach(layer => {
+      layer.clearLayers();
+      layer.addData(features);
+    });
+    cluster.clearLayers();
+    cluster.addLayer(pointLayer);
+    loadedBounds = bounds;
+    loadedZoom = zoom;
+  });
+}
+if (gisDynamic) {
+  map.on('moveend', loadLayers);
+  loadLayers();
+}
+
 // Overlay maps
 let overlayMapsControl = {};
 overlays.forEach((o) => {
@@ -363,8 +413,22 @@ geoSearchControl.on("select", function (e) {
 });
 map.addControl(geoSearchControl);
 
+function clusterIcon(count) {
+  const size = count < 10 ? 'small' : count < 100 ? 'medium' : 'large';
+  return L.divIcon({
+    html: `<div><span>${count}</span></div>`,
+    className: `marker-cluster marker-cluster-${size}`,
+    iconSize: L.point(40, 40),
+  });
+}
+
 function setPopup(selected) {
   return (feature, layer) => {
+    if (feature.properties.cluster) {
+      layer.on('click', () =>
+        map.setView(layer.getLatLng(), map.getZoom() + 2));
+      return;
+    }
     //set panes depending on geometry type
     const panes = {
       'Polygon': "polygonsPane",
@@ -20,9 +20,8 @@ from wtforms import StringField, TextAreaField
 from wtforms.validators import InputRequired
 
 from openatlas import app
-from openatlas.database.connect import Transaction
-from openatlas.display.image_processing import (
-    create_resized_images, delete_orphaned_resized_images)
+from openatlas.database.connect import Transaction, get_pool_statistics
+from openatlas.display.image_processing import delete_orphaned_resized_images
 from openatlas.display.tab import Tab
 from openatlas.display.table import Table
 from openatlas.display.util import (
@@ -38,7 +37,9 @@ from openatlas.forms.setting import (
 from openatlas.forms.util import get_form_settings, set_form_settings
 from openatlas.models.content import get_content, update_content
 from openatlas.models.entity import Entity
+from openatlas.models.file import FileRegistry
 from openatlas.models.imports import Import
+from openatlas.models.job import Job
 from openatlas.models.link import Link
 from openatlas.models.settings import Settings
 from openatlas.models.type import Type
@@ -62,7 +63,10 @@ def admin_index() -> str:
     if is_authorized('admin'):
         tabs['general'] = Tab(
             'general',
-            display_info(get_form_settings(GeneralForm())),
+            render_template(
+                'admin/general.html',
+                info=get_form_settings(GeneralForm()),
+                pool=get_pool_statistics()),
             buttons=[
                 manual('admin/general'),
                 button(_('edit'), url_for('settings', category='general')),
@@ -507,9 +511,10 @@ def orphans() -> str:
                 entity.description])
 
     # Orphaned file entities with no corresponding file
-    entity_file_ids = []
-    for entity in Entity.get_by_class('file', types=True):
-        entity_file_ids.append(entity.id)
+    entity_file_ids = set()
+    g.files.load()
+    for entity in Entity.iterate_by_class('file', types=True):
+        entity_file_ids.add(entity.id)
         if not get_file_path(entity):
             tabs['missing_files'].table.rows.append([
                 link(entity),
@@ -605,7 +610,7 @@ def admin_file_delete(filename: str) -> Response:
 
     # Delete all files with no corresponding entity
     if is_authorized('admin'):  # pragma: no cover - don't test, ever
-        entity_file_ids = [entity.id for entity in Entity.get_by_class('file')]
+        entity_file_ids = Entity.get_ids_by_class('file')
         for f in app.config['UPLOAD_PATH'].iterdir():
             if f.name != '.gitignore' and int(f.stem) not in entity_file_ids:
                 try:
@@ -630,6 +635,18 @@ def admin_file_iiif_delete(filename: str) -> Response:
     return redirect(f"{url_for('orphans')}#tab-orphaned-iiif-files")
 
 
+@app.route('/admin/file/registry')
+@required_group('admin')
+def admin_file_registry() -> Response:
+    updated, removed = FileRegistry.reconcile(
+        list(Entity.get_ids_by_class('file')))
+    flash(
+        f"{_('file registry synchronized')}: "
+        f"{updated} {_('updated')}, {removed} {_('removed')}",
+        'info')
+    return redirect(url_for('admin_index') + '#tab-data')
+
+
 @app.route('/log', methods=['GET', 'POST'])
 @required_group('admin')
 def log() -> str:
@@ -742,8 +759,10 @@ def newsletter() -> str | Response:
 @app.route('/resize_images')
 @required_group('admin')
 def resize_images() -> Response:
-    create_resized_images()
-    flash(_('images were created'), 'info')
+    Job.add('resize', [
+        id_ for id_, path in g.files.items()
+        if path.suffix.lower() in g.display_file_ext])
+    flash(_('images were added to the jobs'), 'info')
     return redirect(url_for('admin_index') + '#tab-data')
 
 
@@ -782,7 +801,7 @@ def get_disk_space_info() -> Optional[dict[str, Any]]:
 def count_files_to_convert() -> int:
     total_files = 0
     converted_files = 0
-    existing_files = [entity.id for entity in Entity.get_by_class('file')]
+    existing_files = Entity.get_ids_by_class('file')
     for file_id, file_path in g.files.items():
         if (file_id in existing_files and
                 file_path.suffix in g.display_file_ext):
@@ -1,14 +1,15 @@
-import json
 from typing import Optional
 
 from flask import Response, abort, g, jsonify, request
 from flask_babel import lazy_gettext as _
+from flask_login import current_user
 
 from openatlas import app
 from openatlas.database.connect import Transaction
+from openatlas.display.table import get_table_query
 from openatlas.display.util import required_group
 from openatlas.display.util2 import uc_first
-from openatlas.forms.field import get_table_content
+from openatlas.forms.field import get_table_classes, get_table_rows
 from openatlas.models.entity import Entity
 from openatlas.models.type import Type
 from openatlas.models.user import User
@@ -77,9 +78,24 @@ def ajax_create_entity() -> str:
     return str(entity.id)
 
 
-@app.route('/ajax/get_entity_table/<string:content_domain>', methods=['POST'])
+@app.route('/ajax/table/<field_id>', methods=['GET', 'POST'])
 @required_group('readonly')
-def ajax_get_entity_table(content_domain: str) -> str:
-    filter_ids = json.loads(request.form['filterIds']) or []
-    table, _selection = get_table_content(content_domain, None, filter_ids)
-    return table.display(content_domain)
+def ajax_table(field_id: str) -> Response:
+    if not (classes := get_table_classes(field_id)):
+        abort(404)
+    multiple = bool(request.args.get('multiple', type=int))
+    values = request.form if request.method == 'POST' else request.args
+    query = get_table_query(
+        ([''] if multiple else []) + g.table_headers[classes[0]])
+    query.update({
+        'classes': classes[1],
+        'exclude_ids': [
+            int(id_) for id_ in values.get('filter_ids', '').split(',')
+            if id_.isdigit()],
+        'aliases': current_user.settings['table_show_aliases']})
+    total, count, entities = Entity.get_table_page(query)
+    return jsonify({
+        'draw': values.get('draw', 0, type=int),
+        'recordsTotal': total,
+        'recordsFiltered': count,
+        'data': get_table_rows(field_id, entities, multiple)})
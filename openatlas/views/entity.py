@@ -12,17 +12,16 @@ from werkzeug.wrappers import Response
 from openatlas import app
 from openatlas.database.connect import Transaction
 from openatlas.display import display
-from openatlas.display.image_processing import resize_image
 from openatlas.display.util import (
-    button, check_iiif_activation, check_iiif_file_exist,
-    convert_image_to_iiif, get_base_table_data, get_file_path,
-    get_iiif_file_path, link, required_group)
+    button, check_iiif_activation, check_iiif_file_exist, get_base_table_data,
+    get_file_path, get_iiif_file_path, link, required_group)
 from openatlas.display.util2 import is_authorized
 from openatlas.forms.base_manager import BaseManager
 from openatlas.forms.form import get_manager
 from openatlas.forms.util import was_modified
 from openatlas.models.entity import Entity
 from openatlas.models.gis import InvalidGeomException
+from openatlas.models.job import Job
 from openatlas.models.reference_system import ReferenceSystem
 from openatlas.models.type import Type
 
@@ -214,12 +213,14 @@ def insert_files(manager: BaseManager) -> str:
             if f'.{ext}' in g.display_file_ext:
                 call(f'exiftran -ai {path}', shell=True)  # Fix rotation
             filenames.append(name)
-            if g.settings['image_processing']:
-                resize_image(name)
+            g.files.add(manager.entity.id, path)
+            if g.settings['image_processing'] \
+                    and f'.{ext}' in g.display_file_ext:
+                Job.add('resize', [manager.entity.id])
             if (g.settings['iiif_conversion']
                     and check_iiif_activation()
                     and g.settings['iiif_convert_on_upload']):
-                convert_image_to_iiif(manager.entity.id, path)
+                Job.add('iiif', [manager.entity.id])
             if len(manager.form.file.data) > 1:
                 manager.form.name.data = \
                     f'{entity_name}_{str(count + 1).zfill(2)}'
@@ -334,6 +335,7 @@ def get_redirect_url(manager: BaseManager) -> str:
 def delete_files(id_: int) -> None:
     if path := get_file_path(id_):  # Prevent missing file warning
         path.unlink()
+        g.files.delete(id_)
     for resized_path in app.config['RESIZED_IMAGES'].glob(f'**/{id_}.*'):
         resized_path.unlink()
     if g.settings['iiif'] and check_iiif_file_exist(id_):
@@ -1,10 +1,10 @@
-from flask import g, render_template, url_for
+from flask import abort, g, jsonify, render_template, request, url_for
 from flask_babel import lazy_gettext as _
 from werkzeug.wrappers import Response
 
 from openatlas import app
 from openatlas.display.image_processing import check_processed_image
-from openatlas.display.table import Table
+from openatlas.display.table import Table, get_table_query
 from openatlas.display.util import (
     button, check_iiif_file_exist, get_base_table_data, get_file_path, link,
     required_group)
@@ -12,6 +12,7 @@ from openatlas.display.util2 import (
     format_date, is_authorized, manual, show_table_icons)
 from openatlas.models.entity import Entity
 from openatlas.models.gis import Gis
+from openatlas.models.reference_system import ReferenceSystem
 
 
 @app.route('/index/<view>')
@@ -30,20 +31,62 @@ def index(view: str) -> str | Response:
         class_=view,
         table=get_table(view),
         buttons=buttons,
-        gis_data=Gis.get_all() if view == 'place' else None,
+        gis_data=Gis.get_all(dynamic=True) if view == 'place' else None,
         title=_(view.replace('_', ' ')),
         crumbs=[[_('file'), url_for('file_index')], _('files')]
         if view == 'file' else [_(view).replace('_', ' ')])
 
 
 def get_table(view: str) -> Table:
-    table = Table(g.table_headers[view])
+    if view == 'reference_system':
+        table = Table(g.table_headers[view])
+        counts = ReferenceSystem.get_counts()
+        for system in g.reference_systems.values():
+            table.rows.append([
+                link(system),
+                counts.get(system.id) or '',
+                link(system.website_url, system.website_url, external=True),
+                link(system.resolver_url, system.resolver_url, external=True),
+                system.placeholder,
+                link(g.types[system.precision_default_id])
+                if system.precision_default_id else '',
+                system.description])
+        return table
+    # Rows are loaded page by page with index_data()
+    table = Table(
+        get_table_header(view),
+        ajax=url_for('index_data', view=view))
     if view == 'file':
         table.order = [[0, 'desc']]
-        table.header = ['date'] + table.header
         if show_table_icons():
-            table.header.insert(1, _('icon'))
-        for entity in Entity.get_by_class('file', types=True):
+            table.defs = [{'orderable': False, 'targets': 1}]
+    return table
+
+
+def get_table_header(view: str) -> list[str]:
+    header = g.table_headers[view]
+    if view == 'file':
+        header = ['date'] + header
+        if show_table_icons():
+            header.insert(1, _('icon'))
+    return header
+
+
+@app.route('/index/<view>/data')
+@required_group('readonly')
+def index_data(view: str) -> Response:
+    if view not in g.view_class_mapping \
+            or view not in g.table_headers \
+            or view == 'reference_system':
+        abort(404)
+    query = get_table_query(get_table_header(view))
+    query['classes'] = \
+        ['place'] if view == 'place' else g.view_class_mapping[view]
+    total, count, entities = Entity.get_table_page(query)
+    if view == 'file':
+        g.files.load([entity.id for entity in entities])
+        rows = []
+        for entity in entities:
             data = [
                 format_date(entity.created),
                 link(entity),
@@ -53,23 +96,14 @@ def get_table(view: str) -> Table:
                 entity.description]
             if show_table_icons():
                 data.insert(1, file_preview(entity.id))
-            table.rows.append(data)
-    elif view == 'reference_system':
-        for system in g.reference_systems.values():
-            table.rows.append([
-                link(system),
-                system.count or '',
-                link(system.website_url, system.website_url, external=True),
-                link(system.resolver_url, system.resolver_url, external=True),
-                system.placeholder,
-                link(g.types[system.precision_default_id])
-                if system.precision_default_id else '',
-                system.description])
+            rows.append(data)
     else:
-        classes = 'place' if view == 'place' else g.view_class_mapping[view]
-        entities = Entity.get_by_class(classes, types=True, aliases=True)
-        table.rows = [get_base_table_data(entity) for entity in entities]
-    return table
+        rows = [get_base_table_data(entity) for entity in entities]
+    return jsonify({
+        'draw': request.args.get('draw', 0, type=int),
+        'recordsTotal': total,
+        'recordsFiltered': count,
+        'data': rows})
 
 
 def file_preview(entity_id: int) -> str:
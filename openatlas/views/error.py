@@ -10,7 +10,7 @@ from openatlas.api.resources.error import \
      InvalidSystemClassError, InvalidViewClassError, InvalidLimitError,
      InvalidSearchSyntax, ValueNotIntegerError, NoSearchStringError,
      NotAPlaceError, QueryEmptyError, NotATypeError, TypeIDError,
-     LastEntityError, DisplayFileNotFoundError)
+     LastEntityError, DisplayFileNotFoundError, InvalidBoundingBoxError)
 
 
 @app.errorhandler(400)
@@ -94,6 +94,18 @@ def entity_does_not_exist(_e: Exception) -> tuple[Any, int]:
         'status': 404}), 404
 
 
+@app.errorhandler(InvalidBoundingBoxError)
+def invalid_bounding_box(_e: Exception) -> tuple[Any, int]:
+    return jsonify({
+        'title': 'Invalid bounding box',
+        'message':
+            'The bounding box has to be given as west,south,east,north '
+            'in degrees, e.g. 16.2,48.1,16.5,48.3',
+        'url': request.url,
+        'timestamp': datetime.datetime.now(),
+        'status': 400}), 400
+
+
 @app.errorhandler(InvalidCidocClassCodeError)
 def invalid_cidoc_class_code(_e: Exception) -> tuple[Any, int]:
     return jsonify({
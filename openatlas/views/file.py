@@ -1,9 +1,9 @@
-from datetime import datetime
 from typing import Any, Optional
 
 from flask import (
     abort, flash, g, render_template, request, send_from_directory, url_for)
 from flask_babel import lazy_gettext as _
+from werkzeug.exceptions import NotFound
 from werkzeug.utils import redirect
 from werkzeug.wrappers import Response
 
@@ -18,6 +18,7 @@ from openatlas.forms.form import get_table_form
 from openatlas.forms.setting import FileForm, IiifForm
 from openatlas.forms.util import get_form_settings
 from openatlas.models.entity import Entity
+from openatlas.models.job import Job
 from openatlas.models.settings import Settings
 from openatlas.views.admin import count_files_to_convert, get_disk_space_info
 
@@ -49,6 +50,13 @@ def file_index() -> str:
                 button(
                     _('convert all files') + f' ({count_files_to_convert()})',
                     url_for('convert_iiif_files'))])
+        tabs['jobs'] = Tab(
+            'jobs',
+            display_info(get_job_info()),
+            table=get_failed_job_table(),
+            buttons=[
+                button(_('retry failed'), url_for('job_retry_failed')),
+                button(_('delete finished'), url_for('job_delete_done'))])
     return render_template(
         'tabs.html',
         title=_('file'),
@@ -68,10 +76,19 @@ def download(filename: str) -> Any:
 @app.route('/display/<path:filename>')
 @required_group('readonly')
 def display_file(filename: str) -> Any:
-    if request.args.get('size'):
-        return send_from_directory(
-            app.config['RESIZED_IMAGES'] / request.args.get('size'),
-            filename)
+    if size := request.args.get('size'):
+        try:
+            return send_from_directory(
+                app.config['RESIZED_IMAGES'] / size,
+                filename)
+        except NotFound:  # Recorded size is missing, e.g. deleted
+            name = filename.rsplit('.', 1)[0]
+            if not name.isdigit() or not (path := g.files.get(int(name))):
+                raise
+            Job.add('resize', [int(name)], retry=False)
+            if path.suffix.lower() not in app.config['DISPLAY_FILE_EXT']:
+                raise
+            filename = path.name
     return send_from_directory(app.config['UPLOAD_PATH'], filename)
 
 
@@ -151,13 +168,57 @@ def convert() -> None:
     if not g.settings['iiif_conversion']:  # pragma: no cover
         flash(_('please activate IIIF conversion'), 'info')
         return
-    existing_files = [entity.id for entity in Entity.get_by_class('file')]
-    for id_, file_path in g.files.items():
-        if check_iiif_file_exist(id_):
-            continue
-        if id_ in existing_files and file_path.suffix in g.display_file_ext:
-            convert_image_to_iiif(id_)
-    flash(_('all image files are converted'), 'info')
+    existing_files = Entity.get_ids_by_class('file')
+    Job.add('iiif', [
+        id_ for id_, file_path in g.files.items()
+        if id_ in existing_files
+        and file_path.suffix in g.display_file_ext
+        and not check_iiif_file_exist(id_)])
+    flash(_('image files were added to the jobs'), 'info')
+
+
+@app.route('/file/jobs/retry')
+@required_group('admin')
+def job_retry_failed() -> Response:
+    Job.retry_failed()
+    return redirect(url_for('file_index') + '#tab-jobs')
+
+
+@app.route('/file/jobs/delete')
+@required_group('admin')
+def job_delete_done() -> Response:
+    Job.delete_done()
+    return redirect(url_for('file_index') + '#tab-jobs')
+
+
+def get_job_info() -> dict[str, str]:
+    labels = {'iiif': _('IIIF conversion'), 'resize': _('resized images')}
+    statuses = {
+        'pending': _('pending'),
+        'running': _('running'),
+        'done': _('done'),
+        'failed': _('failed')}
+    return {
+        labels.get(name, name): ', '.join(
+            f"{label}: {counts.get(status, 0):,}"
+            for status, label in statuses.items())
+        for name, counts in sorted(Job.get_counts().items())}
+
+
+def get_failed_job_table() -> Table:
+    table = Table(['file', 'job', 'attempts', 'error', 'date'])
+    failed = Job.get_failed()
+    entities = {
+        entity.id: entity for entity in
+        Entity.get_by_ids([row['entity_id'] for row in failed])}
+    for row in failed:
+        table.rows.append([
+            link(entities[row['entity_id']]),
+            row['name'],
+            row['attempts'],
+            row['error'],
+            format_date(row['modified'])])
+    return table
 
 
 def get_manifest_url(id_: int) -> str:
@@ -180,9 +241,8 @@ def logo(id_: Optional[int] = None) -> str | Response:
     table = Table([''] + g.table_headers['file'] + ['date'])
     for entity in Entity.get_display_files():
         date = 'N/A'
-        if entity.id in g.files:
-            date = format_date(
-                datetime.utcfromtimestamp(g.files[entity.id].stat().st_ctime))
+        if created := g.files.get_created(entity.id):
+            date = format_date(created)
         table.rows.append([
             link(_('set'), url_for('logo', id_=entity.id)),
             entity.name,
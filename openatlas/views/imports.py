@@ -1,6 +1,6 @@
 import collections
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import numpy
 import pandas as pd
@@ -24,7 +24,7 @@ from openatlas.display.util2 import (
 from openatlas.forms.display import display_form
 from openatlas.forms.field import SubmitField
 from openatlas.models.entity import Entity
-from openatlas.models.imports import Import, is_float
+from openatlas.models.imports import Import
 
 
 class ProjectForm(FlaskForm):
@@ -194,6 +194,7 @@ def import_data(project_id: int, class_: str) -> str:
     messages: dict[str, list[str]] = {'error': [], 'warn': []}
     file_data = get_backup_file_data()
     class_label = g.classes[class_].label
+    preview_rows = app.config['IMPORT_PREVIEW_ROWS']
     if form.validate_on_submit():
         file_ = request.files['file']
         file_path = \
@@ -211,97 +212,75 @@ def import_data(project_id: int, class_: str) -> str:
             columns['allowed'] += ['easting', 'northing']
         try:
             file_.save(str(file_path))
-            data_frame = pd.read_csv(file_path, keep_default_na=False)
-            headers = list(data_frame.columns.values)
+            headers = list(pd.read_csv(file_path, nrows=0).columns.values)
             if 'name' not in headers:
                 messages['error'].append(_('missing name column'))
                 raise ValueError()
             for item in headers:
                 if item not in columns['allowed']:
                     columns['invalid'].append(item)
-                    del data_frame[item]
             if columns['invalid']:
                 messages['warn'].append(
                     f"{_('invalid columns')}: {','.join(columns['invalid'])}")
-            headers = list(data_frame.columns.values)  # Get clean headers
+            headers = [item for item in headers if item in columns['allowed']]
             table_data = []
-            checked_data = []
-            origin_ids = []
-            names = []
+            row_count = 0
+            origin_ids: collections.Counter[str] = collections.Counter()
+            existing: set[str] = set()
+            duplicates: list[str] = []
             missing_name_count = 0
             invalid_type_ids = False
             invalid_geoms = False
-            for _index, row in data_frame.iterrows():
-                if not row['name']:
-                    missing_name_count += 1
-                    continue
-                table_row = []
-                checked_row = {}
-                for item in headers:
-                    value = row[item]
-                    if item == 'type_ids':
-                        type_ids = []
-                        for type_id in str(value).split():
-                            if Import.check_type_id(type_id, class_):
-                                type_ids.append(type_id)  # pragma: no cover
-                            else:
-                                type_ids.append(
-                                    f'<span class="error">{type_id}</span>')
-                                invalid_type_ids = True
-                        value = ' '.join(type_ids)
-                    if item in ['northing', 'easting'] \
-                            and row[item] \
-                            and not is_float(row[item]):
-                        value = f'<span class="error">{value}</span>'
-                        invalid_geoms = True
-                    if item in [
-                            'begin_from',
-                            'begin_to',
-                            'end_from',
-                            'end_to']:
-                        if not value:
-                            value = ''
-                        else:
-                            try:
-                                value = datetime64_to_timestamp(
-                                    numpy.datetime64(value))
-                                row[item] = value
-                            except ValueError:
-                                row[item] = ''
-                                value = '' if str(value) == 'NaT' else \
-                                    f'<span class="error">{value}</span>'
-                    table_row.append(str(value))
-                    checked_row[item] = row[item]
-                    if item == 'name' and form.duplicate.data:
-                        names.append(row['name'].lower())
-                    if item == 'id' and row[item]:
-                        origin_ids.append(str(row['id']))
-                table_data.append(table_row)
-                checked_data.append(checked_row)
+            type_ids = Import.get_type_ids(class_)
+            for chunk in read_import_file(file_path, headers):
+                data, errors = check_import_chunk(chunk, type_ids)
+                missing_name_count += len(chunk) - len(data)
+                invalid_type_ids = invalid_type_ids or bool(
+                    'type_ids' in errors and errors['type_ids'].any())
+                invalid_geoms = invalid_geoms or bool(errors[[
+                    item for item in ['easting', 'northing']
+                    if item in errors]].any(axis=None))
+                for index in data.index[:max(0, preview_rows - row_count)]:
+                    table_data.append([
+                        get_preview_value(
+                            item,
+                            chunk.at[index, item],
+                            data.at[index, item],
+                            errors.at[index, item],
+                            type_ids)
+                        for item in headers])
+                row_count += len(data)
+                if 'id' in data:
+                    ids = [id_ for id_ in data['id'] if id_]
+                    origin_ids.update(ids)
+                    if ids:
+                        existing.update(Import.get_origin_ids(project, ids))
+                if form.duplicate.data and len(data):
+                    duplicates += Import.check_duplicates(
+                        class_,
+                        list(data['name'].str.lower()))
             if invalid_type_ids:
                 messages['warn'].append(_('invalid type ids'))
             if invalid_geoms:
                 messages['warn'].append(_('invalid coordinates'))
             table = Table(headers, rows=table_data)
+            if row_count > len(table_data):
+                messages['warn'].append(
+                    f"{_('preview')}: {format_number(len(table_data))} / "
+                    f"{format_number(row_count)}")
             if missing_name_count:
                 messages['warn'].append(
                     f"{_('empty names')}: {missing_name_count}")
-            doubles = [
-                item for item, count in collections.Counter(origin_ids).items()
-                if count > 1]
+            doubles = [item for item, count in origin_ids.items() if count > 1]
             if doubles:
                 messages['error'].append(
                     f"{_('double IDs in import')}: {', '.join(doubles)}")
-            existing = Import.get_origin_ids(project, origin_ids) \
-                if origin_ids else None
             if existing:
                 messages['error'].append(
                     f"{_('IDs already in database')}: {', '.join(existing)}")
-            if form.duplicate.data:  # Check for possible duplicates
-                duplicates = Import.check_duplicates(class_, names)
-                if duplicates:
-                    messages['warn'].append(
-                        f"{_('possible duplicates')}: {', '.join(duplicates)}")
+            if duplicates:
+                messages['warn'].append(
+                    f"{_('possible duplicates')}: {', '.join(duplicates)}")
             if messages['error']:
                 raise ValueError()
         except Exception as e:
@@ -319,14 +298,18 @@ def import_data(project_id: int, class_: str) -> str:
                     project,
                     class_label])
 
-        if not form.preview.data and checked_data and (
+        if not form.preview.data and row_count and (
                 not file_data['backup_too_old'] or app.testing):
             Transaction.begin()
             try:
-                Import.import_data(project, class_, checked_data)
+                Import.import_data(
+                    project,
+                    class_,
+                    (check_import_chunk(chunk, type_ids)[0].to_dict('records')
+                     for chunk in read_import_file(file_path, headers)))
                 Transaction.commit()
-                g.logger.log('info', 'import', f'import: {len(checked_data)}')
-                flash(f"{_('import of')}: {len(checked_data)}", 'info')
+                g.logger.log('info', 'import', f'import: {row_count}')
+                flash(f"{_('import of')}: {row_count}", 'info')
                 imported = True
             except Exception as e:  # pragma: no cover
                 Transaction.rollback()
@@ -344,3 +327,62 @@ def import_data(project_id: int, class_: str) -> str:
             [_('import'), url_for('import_index')],
             project,
             class_label])
+
+
+def read_import_file(file_path: Path, headers: list[str]) -> Iterator[Any]:
+    # Read in chunks as strings, to keep memory usage low for large files and
+    # have the same types in every chunk
+    yield from pd.read_csv(
+        file_path,
+        keep_default_na=False,
+        dtype=str,
+        usecols=headers,
+        chunksize=app.config['IMPORT_CHUNK_SIZE'])
+
+
+def check_import_chunk(
+        chunk: pd.DataFrame,
+        type_ids: set[str]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    # Returns rows with names, dates converted to timestamps and a mask of
+    # invalid values
+    data = chunk[chunk['name'] != ''].copy()
+    errors = pd.DataFrame(False, index=data.index, columns=data.columns)
+    if 'type_ids' in data:
+        errors['type_ids'] = data['type_ids'].map(
+            lambda value: any(id_ not in type_ids for id_ in value.split()))
+    for item in ['easting', 'northing']:
+        if item in data:
+            errors[item] = (data[item] != '') \
+                & pd.to_numeric(data[item], errors='coerce').isna()
+    for item in ['begin_from', 'begin_to', 'end_from', 'end_to']:
+        if item in data:
+            timestamps = data[item].map(get_timestamp)
+            errors[item] = (data[item] != '') & (data[item] != 'NaT') \
+                & (timestamps == '')
+            data[item] = timestamps
+    return data, errors
+
+
+def get_timestamp(value: str) -> str:
+    if not value:
+        return ''
+    try:
+        return datetime64_to_timestamp(numpy.datetime64(value)) or ''
+    except ValueError:
+        return ''
+
+
+def get_preview_value(
+        item: str,
+        value: str,
+        checked_value: str,
+        error: bool,
+        type_ids: set[str]) -> str:
+    if item == 'type_ids':
+        return ' '.join(
+            id_ if id_ in type_ids else f'<span class="error">{id_}</span>'
+            for id_ in value.split())
+    if item in ['begin_from', 'begin_to', 'end_from', 'end_to']:
+        return f'<span class="error">{value}</span>' \
+            if error else checked_value
+    return f'<span class="error">{value}</span>' if error else value
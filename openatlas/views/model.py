@@ -1,6 +1,6 @@
 from typing import Optional
 
-from flask import g, render_template, url_for
+from flask import flash, g, render_template, url_for
 from flask_babel import format_number, lazy_gettext as _
 from flask_wtf import FlaskForm
 from wtforms import (
@@ -13,6 +13,8 @@ from openatlas.display.table import Table
 from openatlas.display.util import button, link, required_group
 from openatlas.display.util2 import manual, uc_first
 from openatlas.forms.field import SubmitField, TableField
+from openatlas.models.cidoc_class import CidocClass
+from openatlas.models.cidoc_property import CidocProperty
 from openatlas.models.entity import Entity
 from openatlas.models.network import Network
 from openatlas.models.openatlas_class import OpenatlasClass
@@ -130,13 +132,14 @@ def cidoc_class_index() -> str:
             {'className': 'dt-body-right', 'targets': 2},
             {'orderDataType': 'cidoc-model', 'targets': [0]},
             {'sType': 'numeric', 'targets': [0]}])
+    class_count = CidocClass.get_class_count()
     for class_ in g.cidoc_classes.values():
         count = ''
-        if class_.count:
-            count = format_number(class_.count)
+        if class_count.get(class_.code):
+            count = format_number(class_count[class_.code])
             if class_.code not in ['E53', 'E41', 'E82']:
                 count = link(
-                    format_number(class_.count),
+                    format_number(class_count[class_.code]),
                     url_for('class_entities', code=class_.code))
         table.rows.append([link(class_), class_.name, count])
     return render_template(
@@ -159,6 +162,7 @@ def property_index() -> str:
             {'className': 'dt-body-right', 'targets': 7},
             {'orderDataType': 'cidoc-model', 'targets': [0, 3, 5]},
             {'sType': 'numeric', 'targets': [0, 3, 5]}])
+    property_count = CidocProperty.get_property_count()
     for property_ in properties.values():
         table.rows.append([
             link(property_),
@@ -168,7 +172,8 @@ def property_index() -> str:
             classes[property_.domain_class_code].name,
             link(classes[property_.range_class_code]),
             classes[property_.range_class_code].name,
-            format_number(property_.count) if property_.count else ''])
+            format_number(property_count[property_.code])
+            if property_count.get(property_.code) else ''])
     return render_template(
         'content.html',
         content=table.display(),
@@ -291,11 +296,16 @@ def network(dimensions: Optional[int] = 0, id_: Optional[int] = None) -> str:
         (class_.name, class_.label)
         for class_ in [x for x in classes if x.name != 'object_location']]
     if entity:
-        json_data = Network.get_ego_network_json(
+        json_data, truncated = Network.get_ego_network_json(
             {c.name: getattr(form, c.name).data for c in classes},
             entity.id,
             int(form.depth.data),
             dimensions)
+        if truncated:
+            flash(
+                _('network limited to %(count)s entities',
+                  count=format_number(app.config['EGO_NETWORK_MAX_NODES'])),
+                'info')
         crumbs = [
             [_(entity.class_.view.replace('_', ' ')),
              url_for('index', view=entity.class_.view)],
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 
 from flask import abort, flash, g, render_template, url_for
 from flask_babel import format_number, lazy_gettext as _
@@ -20,6 +20,7 @@ from openatlas.forms.field import SubmitField
 from openatlas.forms.form import get_move_form
 from openatlas.models.entity import Entity
 from openatlas.models.link import Link
+from openatlas.models.type import Type
 
 
 def walk_tree(types: list[int]) -> list[dict[str, Any]]:
@@ -48,20 +49,25 @@ def type_index() -> str:
         'place': {},
         'value': {},
         'system': {}}
+    chart_data: dict[int, Optional[dict[str, Any]]] = {}
+    reference_systems: dict[int, list[Link]] = {}
+    Type.load_counts(list(g.types))
     for type_ in [type_ for type_ in g.types.values() if not type_.root]:
         if type_.category in types:
-            type_.chart_data = get_chart_data(type_)
+            chart_data[type_.id] = get_chart_data(type_)
             types[type_.category][type_] = render_template(
                 'forms/tree_select_item.html',
                 name=sanitize(type_.name),
                 data=walk_tree(type_.subs))
-            for link_ in type_.get_links('P67', inverse=True):
-                if link_.domain.class_.view == 'reference_system':
-                    type_.reference_systems.append(link_)
+            reference_systems[type_.id] = [
+                link_ for link_ in type_.get_links('P67', inverse=True)
+                if link_.domain.class_.view == 'reference_system']
     return render_template(
         'type/index.html',
         buttons=[manual('entity/type')],
         types=types,
+        chart_data=chart_data,
+        reference_systems=reference_systems,
         title=_('types'),
         crumbs=[_('types')])
 
@@ -115,6 +121,7 @@ def type_delete_recursive(id_: int) -> str | Response:
             form=form),
         'subs': Tab('subs', entity=type_),
         'entities': Tab('entities', entity=type_)}
+    Type.load_counts(type_.get_sub_ids_recursive())
     for sub_id in type_.get_sub_ids_recursive():
         sub = g.types[sub_id]
         tabs['subs'].table.rows.append([link(sub), sub.count, sub.description])
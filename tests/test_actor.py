@@ -115,11 +115,21 @@ class ActorTests(TestBaseCase):
                     'description': 'AI'})
             assert rv.data.isdigit()
 
-            rv = self.app.post(
-                url_for('ajax_get_entity_table', content_domain='artifact'),
-                data={'filterIds': str([])})
+            rv = self.app.get(
+                url_for('ajax_table', field_id='artifact'),
+                query_string={'search[value]': 'bish'})
             assert b'Bishop' in rv.data
 
+            rv = self.app.get(
+                url_for('ajax_table', field_id='actor', multiple=1),
+                query_string={'filter_ids': actor_id})
+            assert b'checkbox' in rv.data
+
+            rv = self.app.post(
+                url_for('ajax_table', field_id='actor', multiple=1),
+                data={'filter_ids': actor_id, 'search[value]': 'Weaver'})
+            assert b'Susan' not in rv.data
+
             rv = self.app.get(
                 url_for('link_delete', origin_id=actor_id, id_=666),
                 follow_redirects=True)
@@ -1,9 +1,19 @@
+import json
 from typing import Any, Optional
 
 from flask import url_for
+from flask_restful import fields, marshal
 
 from openatlas import app
 from openatlas.api.resources.model_mapper import get_by_cidoc_classes
+from openatlas.api.resources.parser import entity_
+from openatlas.api.resources.resolve_endpoints import (
+    get_entities_serializer, get_entities_template, get_entity_formatted,
+    get_entity_serializer, get_entity_template, get_json_output)
+from openatlas.api.resources.search import search
+from openatlas.api.resources.serializer import (
+    compile_template, json_response)
+from openatlas.api.resources.util import get_key, parser_str_to_dict
 from tests.base import ApiTestCase
 
 
@@ -138,7 +148,10 @@ class Api(ApiTestCase):
                 url_for('api_04.entity', id_=place.id, download=True))
             assert 'application/json' in rv.headers.get('Content-Type')
             rv = rv.get_json()['features'][0]
-            assert self.get_bool(rv, '@id')
+            assert self.get_bool(
+                rv,
+                '@id',
+                url_for('api.entity', id_=place.id, _external=True))
             assert self.get_bool(rv, 'type', 'Feature')
             assert self.get_bool(rv, 'crmClass', 'crm:E18 Physical Thing')
             assert self.get_bool(rv, 'systemClass', 'place')
@@ -396,6 +409,20 @@ class Api(ApiTestCase):
             rv = self.app.get(url_for('api_04.geometric_entities', count=True))
             assert bool(rv.get_json() == 6)
 
+            rv = self.app.get(url_for(
+                'api_04.geometric_entities',
+                bbox='-180,-90,180,90',
+                zoom=20,
+                count=True))
+            assert bool(rv.get_json() == 6)
+
+            rv = self.app.get(url_for(
+                'api_04.geometric_entities',
+                bbox='-180,-90,180,90',
+                zoom=0,
+                geometry='gisPointAll')).get_json()
+            assert bool(rv['features'][0]['geometry']['coordinates'])
+
             # Test entities with GeoJSON Format
             for rv in [
                 self.app.get(url_for(
@@ -860,6 +887,10 @@ class Api(ApiTestCase):
             rv = self.app.get(url_for('api_04.latest', limit='99999999'))
             assert 'Invalid limit value' in rv.get_json()['title']
 
+            rv = self.app.get(
+                url_for('api_04.geometric_entities', bbox='10,50,5,60'))
+            assert 'Invalid bounding box' in rv.get_json()['title']
+
             rv = self.app.get(url_for(
                 'api_04.view_class',
                 view_class='place',
@@ -931,3 +962,178 @@ class Api(ApiTestCase):
 
             rv = self.app.get(url_for('api_04.view_class', view_class='place'))
             assert 'Access denied' in rv.get_json()['title']
+
+    def test_pagination(self) -> None:
+        # Pages from the database have to match the former sort in Python
+        with app.app_context():
+            for column in [
+                    'id', 'name', 'cidoc_class', 'system_class',
+                    'begin_from', 'begin_to', 'end_from', 'end_to']:
+                for sort in ['asc', 'desc']:
+                    args = {'column': column, 'sort': sort, 'show': 'none'}
+                    with app.test_request_context(query_string=args):
+                        app.preprocess_request()
+                        parser = entity_.parse_args()
+                        entities = get_by_cidoc_classes(['all'])
+                        if column == 'begin_from':
+                            assert any(not e.begin_from for e in entities)
+                        ids = [e.id for e in sorted(
+                            entities,
+                            key=lambda e: (get_key(e, parser), e.id),
+                            reverse=sort == 'desc')]
+                    rv = self.get_page(args | {'limit': 0})
+                    assert self.get_ids(rv) == ids
+                    rv = self.get_page(args | {'limit': 3})
+                    assert [
+                        page['startId'] for page
+                        in rv['pagination']['index']] == ids[::3]
+                    assert self.get_ids(rv) == ids[:3]
+                    rv = self.get_page(args | {'limit': 3, 'first': ids[4]})
+                    assert self.get_ids(rv) == ids[4:7]
+                    rv = self.get_page(args | {'limit': 3, 'last': ids[4]})
+                    assert self.get_ids(rv) == ids[5:8]
+                    rv = self.get_page(args | {'limit': 3, 'page': 2})
+                    assert self.get_ids(rv) == ids[3:6]
+
+    def test_search(self) -> None:
+        # Searches in the database have to match the former search in Python
+        with app.app_context():
+            with app.test_request_context():
+                app.preprocess_request()
+                ids = {e.name: e.id for e in get_by_cidoc_classes(['all'])}
+            boundary_mark = ids['Boundary Mark']
+            height = ids['Height']
+            for parameters in [
+                    [('entityName', 'like', ['Fr'], 'or')],
+                    [('entityName', 'like', ['fr', 'do'], 'and')],
+                    [('entityName', 'equal', ['Frodo', 'Sam'], 'or')],
+                    [('entityName', 'notEqual', ['Frodo'], 'and')],
+                    [('entityDescription', 'like', ['FrOdO', 'sam'], 'or')],
+                    [('entityAliases', 'like', ['S'], 'or')],
+                    [('entityAliases', 'equal', ['Sûza'], 'or')],
+                    [('entityCidocClass', 'equal', ['E21', 'E18'], 'or')],
+                    [('entityCidocClass', 'notEqual', ['E21'], 'or')],
+                    [('entitySystemClass', 'equal', ['person'], 'or')],
+                    [('typeName', 'like', ['Oun', 'HeI'], 'and')],
+                    [('typeName', 'equal', ['Boundary Mark'], 'or')],
+                    [('typeName', 'notEqual', ['Boundary Mark'], 'and')],
+                    [('typeID', 'equal', [boundary_mark, height], 'or')],
+                    [('typeID', 'equal', [boundary_mark, height], 'and')],
+                    [('typeID', 'notEqual', [boundary_mark], 'or')],
+                    [('typeIDWithSubs', 'equal', [boundary_mark], 'and')],
+                    [(
+                        'typeIDWithSubs',
+                        'equal',
+                        [boundary_mark, height],
+                        'or')],
+                    [('typeIDWithSubs', 'notEqual', [boundary_mark], 'and')],
+                    [('entityID', 'equal', [ids['Shire']], 'or')],
+                    [('entityID', 'notEqual', [ids['Shire']], 'and')],
+                    [('relationToID', 'equal', [ids['Shire']], 'or')],
+                    [('valueTypeID', 'equal', [(height, 23.0)], 'or')],
+                    [('valueTypeID', 'greaterThan', [(height, 1.0)], 'or')],
+                    [('beginFrom', 'equal', ['2018'], 'or')],
+                    [('beginFrom', 'notEqual', ['2018'], 'or')],
+                    [('beginFrom', 'lesserThan', ['2000-1-1'], 'or')],
+                    [('beginTo', 'greaterThan', ['2000-1-1'], 'and')],
+                    [('endFrom', 'lesserThanEqual', ['2019-03-01'], 'or')],
+                    [('endTo', 'greaterThanEqual', ['2019-03-01'], 'and')],
+                    [
+                        ('entityName', 'like', ['Fr'], 'or'),
+                        ('typeID', 'equal', [height], 'or')]]:
+                search_ = [
+                    str({category: [{
+                        'operator': operator,
+                        'values': values,
+                        'logicalOperator': logical_operator}]})
+                    for category, operator, values, logical_operator
+                    in parameters]
+                with app.test_request_context():
+                    app.preprocess_request()
+                    result = sorted(e.id for e in search(
+                        get_by_cidoc_classes(['all']),
+                        parser_str_to_dict(search_)))
+                rv = self.get_page({
+                    'search': search_,
+                    'column': 'id',
+                    'limit': 0,
+                    'show': 'none'})
+                assert self.get_ids(rv) == result, search_
+
+            # Types with entities aren't an error if the search finds nothing
+            rv = self.get_page({
+                'type_id': boundary_mark,
+                'search': str({'entityName': [{
+                    'operator': 'equal',
+                    'values': ['Nobody'],
+                    'logicalOperator': 'or'}]})})
+            assert rv['results'] == []
+            assert rv['pagination']['entities'] == 0
+
+    def get_page(self, args: dict[str, Any]) -> dict[str, Any]:
+        return self.app.get(url_for(
+            'api_04.cidoc_class',
+            cidoc_class='all',
+            **args)).get_json()
+
+    @staticmethod
+    def get_ids(data: dict[str, Any]) -> list[int]:
+        return [
+            int(result['features'][0]['@id'].rsplit('/', 1)[1])
+            for result in data['results']]
+
+    def test_serializer(self) -> None:
+        # Compiled templates have to output the same as marshal
+        with app.app_context():
+            for args in [
+                    {},
+                    {'format': 'lpx'},
+                    {'format': 'geojson'},
+                    {'format': 'geojson-v2'},
+                    {'format': 'loud'},
+                    {'show': 'none'},
+                    {'show': ['types', 'when']}]:
+                with app.test_request_context(
+                        query_string=args | {'limit': 0}):
+                    app.preprocess_request()
+                    parser = entity_.parse_args()
+                    entities = get_by_cidoc_classes(['all'])
+                    result = get_json_output(entities, parser)
+                    assert json_response(
+                        result,
+                        get_entities_serializer(parser)).data == (
+                            json.dumps(marshal(
+                                result,
+                                get_entities_template(parser))) + '\n'
+                        ).encode()
+                    for entity in entities:
+                        result = get_entity_formatted(entity, parser)
+                        assert json_response(
+                            result,
+                            get_entity_serializer(parser, result)).data == (
+                                json.dumps(marshal(
+                                    result,
+                                    get_entity_template(parser, result)))
+                                + '\n').encode()
+
+            # Nested dicts without a field get the data of their parent
+            template = {
+                'id': fields.Integer,
+                'names': {
+                    'name': fields.String,
+                    'label': fields.String(default='')},
+                'when': fields.Nested({'begin': {'from': fields.String}}),
+                'items': fields.List(fields.Nested({
+                    'id': fields.Integer,
+                    'more': {'id': fields.Integer}}))}
+            for data in [
+                    {},
+                    {
+                        'id': 1,
+                        'name': 'Frodo',
+                        'names': {'name': 'Not used'},
+                        'when': {'from': '2018-01-31'},
+                        'items': [{'id': 2}, {}]},
+                    [{'id': 3, 'label': 'Baggins'}]]:
+                assert json.dumps(compile_template(template)(data)) \
+                    == json.dumps(marshal(data, template))
@@ -39,7 +39,19 @@ class ArtifactTest(TestBaseCase):
             assert b'Sub artifact' in rv.data
 
             rv = self.app.get(url_for('index', view='artifact'))
+            assert b'serverSide' in rv.data
+
+            rv = self.app.get(
+                url_for('index_data', view='artifact'),
+                query_string={
+                    'draw': 1,
+                    'start': 0,
+                    'length': 10,
+                    'search[value]': 'love',
+                    'order[0][column]': 2,
+                    'order[0][dir]': 'desc'})
             assert b'Love-letter' in rv.data
+            assert rv.get_json()['recordsFiltered'] == 1
 
             rv = self.app.get(url_for('update', id_=artifact_id))
             assert b'Love-letter' in rv.data
@@ -1,3 +1,4 @@
+import io
 import os
 from pathlib import Path
 from typing import Any
@@ -5,8 +6,9 @@ from typing import Any
 from flask import url_for
 
 from openatlas import app
+from openatlas.models.entity import Entity
 from openatlas.models.export import current_date_for_filename
-from tests.base import TestBaseCase
+from tests.base import TestBaseCase, get_hierarchy
 
 
 class ExportImportTest(TestBaseCase):
@@ -144,3 +146,63 @@ class ExportImportTest(TestBaseCase):
                 url_for('delete_export', filename='non_existing'),
                 follow_redirects=True)
             assert b'An error occurred when trying to delete the f' in rv.data
+
+    def test_import_chunks(self) -> None:
+        # Checks and the import have to work across chunk boundaries
+        chunk_size = app.config['IMPORT_CHUNK_SIZE']
+        preview_rows = app.config['IMPORT_PREVIEW_ROWS']
+        app.config['IMPORT_CHUNK_SIZE'] = 2
+        app.config['IMPORT_PREVIEW_ROWS'] = 3
+        try:
+            with app.app_context():
+                with app.test_request_context():
+                    app.preprocess_request()
+                    place_type = get_hierarchy('Place')
+                    type_id = place_type.subs[0]
+                rv: Any = self.app.post(
+                    url_for('import_project_insert'),
+                    data={'name': 'Chunks'})
+                p_id = rv.location.split('/')[-1]
+
+                csv = (
+                    'id,name,type_ids,easting,northing,begin_from\n'
+                    f'chunk_1,Chunk 1,{type_id},16.3,48.2,1500-01-01\n'
+                    'chunk_2,,,,,\n'
+                    f'chunk_3,Chunk 3,{type_id},wrong,48.2,\n'
+                    'chunk_4,Chunk 4,666,,,\n'
+                    'chunk_1,Chunk 5,,,,\n')
+                rv = self.app.post(
+                    url_for('import_data', class_='place', project_id=p_id),
+                    data={
+                        'file': (io.BytesIO(csv.encode()), 'chunks.csv'),
+                        'preview': True},
+                    follow_redirects=True)
+                assert b'invalid type ids' in rv.data
+                assert b'invalid coordinates' in rv.data
+                assert b'empty names: 1' in rv.data
+                assert b'preview: 3 / 4' in rv.data
+                assert b'double IDs in import: chunk_1' in rv.data
+
+                csv = 'id,name,type_ids,easting,northing\n' + ''.join(
+                    f"chunk_{i},Chunk {i},{type_id if i % 2 else ''},"
+                    "16.3,48.2\n"
+                    for i in range(1, 6))
+                rv = self.app.post(
+                    url_for('import_data', class_='place', project_id=p_id),
+                    data={'file': (io.BytesIO(csv.encode()), 'chunks.csv')},
+                    follow_redirects=True)
+                assert b'Import of: 5' in rv.data
+
+                with app.test_request_context():
+                    app.preprocess_request()
+                    entities = {
+                        entity.name: entity for entity
+                        in Entity.get_by_class('place', types=True)}
+                    for i in range(1, 6):
+                        assert bool(
+                            type_id in [type_.id for type_
+                                        in entities[f'Chunk {i}'].types]) \
+                            == bool(i % 2)
+        finally:
+            app.config['IMPORT_CHUNK_SIZE'] = chunk_size
+            app.config['IMPORT_PREVIEW_ROWS'] = preview_rows
@@ -48,7 +48,18 @@ class FileTest(TestBaseCase):
             rv = self.app.get(
                 url_for('convert_iiif_files'),
                 follow_redirects=True)
-            assert b'All image files are converted' in rv.data
+            assert b'Image files were added to the jobs' in rv.data
+            assert b'IIIF conversion' in rv.data
+
+            rv = self.app.get(
+                url_for('job_retry_failed'),
+                follow_redirects=True)
+            assert b'retry failed' in rv.data
+
+            rv = self.app.get(
+                url_for('job_delete_done'),
+                follow_redirects=True)
+            assert b'delete finished' in rv.data
 
             # Remove IIIF file to not break tests
             if check_iiif_file_exist(file_id):
@@ -152,6 +163,7 @@ class FileTest(TestBaseCase):
 
             rv = self.app.get(url_for('api.iiif_canvas', id_=file_id))
             assert bool(str(file_id) in rv.get_json()['@id'])
+            assert bool(rv.get_json()['width'])
 
             with app.test_request_context():
                 app.preprocess_request()
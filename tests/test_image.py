@@ -4,9 +4,10 @@ from shutil import copyfile
 from flask import g, url_for
 
 from openatlas import app
-from openatlas.display.image_processing import safe_resize_image
+from openatlas.display.image_processing import resize_image
 from openatlas.display.util import profile_image
 from openatlas.models.entity import Entity
+from openatlas.models.job import Job, work
 from tests.base import TestBaseCase, get_hierarchy, insert
 
 
@@ -19,7 +20,7 @@ class ImageTest(TestBaseCase):
                 app.preprocess_request()
                 place = insert('place', 'Nostromos')
 
-            # Resizing through UI insert
+            # Resizing jobs through UI insert
             with open(Path(app.root_path) / 'static'
                       / 'images' / 'layout' / 'logo.png', 'rb') as img:
                 rv = self.app.post(
@@ -63,16 +64,21 @@ class ImageTest(TestBaseCase):
                 copyfile(
                     Path(app.root_path) / 'static' / 'manifest.json',
                     Path(app.config['UPLOAD_PATH'] / f'{file_json.id}.json'))
-                safe_resize_image(file2.id, '.png', size="???")
+                assert resize_image(str(file2.id), '.jpeg')
                 profile_image(file_pathless)
 
+            rv = self.app.get(
+                url_for('admin_file_registry'),
+                follow_redirects=True)
+            assert b'File registry synchronized: 3 updated' in rv.data
+
             rv = self.app.get(url_for('view', id_=file_json.id))
             assert b'no preview available' in rv.data
 
             rv = self.app.get(url_for('view', id_=file_pathless.id))
             assert b'Missing file' in rv.data
 
-            rv = self.app.get(url_for('index', view='file'))
+            rv = self.app.get(url_for('index_data', view='file'))
             assert b'Test_File' in rv.data
 
             rv = self.app.get(url_for('display_file', filename=file_name))
@@ -98,7 +104,31 @@ class ImageTest(TestBaseCase):
 
             app.config['IMAGE_SIZE']['tmp'] = '1'
             rv = self.app.get(url_for('resize_images'), follow_redirects=True)
-            assert b'Images were created' in rv.data
+            assert b'Images were added to the jobs' in rv.data
+
+            with app.test_request_context():
+                app.preprocess_request()
+                Job.add('resize', [file_pathless.id])
+            work(once=True)
+            with app.test_request_context():
+                app.preprocess_request()
+                counts = Job.get_counts()['resize']
+                assert counts['done'] and counts['failed'] == 1
+                assert 'pending' not in counts and 'running' not in counts
+                failed = Job.get_failed()[0]
+                assert failed['entity_id'] == file_pathless.id
+                assert failed['attempts'] == app.config['JOB_MAX_ATTEMPTS']
+                assert failed['error'] == 'file not found'
+
+            # Missing resized images are added to the jobs again
+            size = app.config['IMAGE_SIZE']['thumbnail']
+            (app.config['RESIZED_IMAGES'] / size / file_name).unlink()
+            rv = self.app.get(
+                url_for('display_file', filename=file_name, size=size))
+            assert b'\xff' in rv.data
+            with app.test_request_context():
+                app.preprocess_request()
+                assert Job.get_counts()['resize']['pending'] == 1
 
             rv = self.app.get(
                 url_for('admin_delete_orphaned_resized_images'),
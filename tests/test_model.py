@@ -1,6 +1,9 @@
+import ast
+
 from flask import url_for
 
 from openatlas import app
+from openatlas.models.network import Network
 from tests.base import TestBaseCase, insert
 
 
@@ -39,6 +42,18 @@ class ModelTests(TestBaseCase):
             rv = self.app.get(url_for('network', dimensions=0, id_=place.id))
             assert b'Depth' in rv.data
 
+            app.config['EGO_NETWORK_MAX_NODES'] = 2
+            rv = self.app.get(url_for('network', dimensions=0, id_=actor.id))
+            assert b'Network limited to 2 entities' in rv.data
+
+            with app.test_request_context():
+                app.preprocess_request()
+                json_data, truncated = Network.get_ego_network_json(
+                    {}, actor.id, 2, 0)
+                assert truncated
+                assert len(ast.literal_eval(str(json_data))['nodes']) == 2
+            app.config['EGO_NETWORK_MAX_NODES'] = 1000
+
             rv = self.app.get(url_for('network', dimensions=2))
             assert b'Show orphans' in rv.data
 
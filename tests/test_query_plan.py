@@ -0,0 +1,89 @@
+from typing import Any
+
+from tests.base import TestBaseCase
+
+FIXTURE = """
+    INSERT INTO model.entity (name, openatlas_class_name, cidoc_class_code)
+    SELECT 'Person ' || i, 'person', 'E21' FROM generate_series(1, 20000) i;
+
+    INSERT INTO model.entity (name, openatlas_class_name, cidoc_class_code)
+    SELECT 'Group ' || i, 'group', 'E74' FROM generate_series(1, 200) i;
+
+    INSERT INTO model.link (property_code, domain_id, range_id, type_id)
+    SELECT
+        'P107',
+        g.id,
+        p.id,
+        CASE WHEN p.number %% 200 = 0 THEN %(type_id)s END
+    FROM (
+        SELECT id, row_number() OVER (ORDER BY id) AS number
+        FROM model.entity WHERE openatlas_class_name = 'group') g
+    JOIN (
+        SELECT id, row_number() OVER (ORDER BY id) AS number
+        FROM model.entity WHERE openatlas_class_name = 'person') p
+        ON p.number %% 200 = g.number - 1;
+
+    INSERT INTO model.gis (entity_id, name, type, geom_point)
+    SELECT
+        id,
+        '',
+        'centerpoint',
+        public.ST_SetSRID(public.ST_MakePoint(id %% 180, id %% 90), 4326)
+    FROM model.entity WHERE openatlas_class_name = 'person';
+
+    ANALYZE;"""
+
+QUERIES = {
+    'links by domain': """
+        SELECT id FROM model.link
+        WHERE domain_id = %(group_id)s AND property_code = 'P107';""",
+    'links by range': """
+        SELECT id FROM model.link
+        WHERE range_id = %(person_id)s AND property_code = 'P107';""",
+    'links by type': 'SELECT id FROM model.link WHERE type_id = %(type_id)s;',
+    'entities by class': """
+        SELECT id FROM model.entity WHERE openatlas_class_name = 'group';""",
+    'entities by CIDOC class': """
+        SELECT id FROM model.entity WHERE cidoc_class_code = 'E74';""",
+    'duplicate names': """
+        SELECT id FROM model.entity
+        WHERE openatlas_class_name = 'person'
+            AND LOWER(name) IN ('person 1', 'person 2');""",
+    'name search': """
+        SELECT id FROM model.entity
+        WHERE model.unaccent_lower(name)
+            LIKE model.unaccent_lower('%%persön 1234%%');""",
+    'geometries by entity': """
+        SELECT id FROM model.gis WHERE entity_id = %(person_id)s;""",
+    'geometries by area': """
+        SELECT id FROM model.gis
+        WHERE geom_point && public.ST_MakeEnvelope(10, 10, 11, 11, 4326);"""}
+
+
+class QueryPlanTests(TestBaseCase):
+
+    def test_query_plans(self) -> None:
+        self.cursor.execute(
+            "SELECT id FROM model.entity WHERE name = 'Female';")
+        params = {'type_id': self.cursor.fetchone()[0]}
+        self.cursor.execute(FIXTURE, params)
+        self.cursor.execute(
+            """
+            SELECT
+                (SELECT id FROM model.entity WHERE name = 'Group 100'),
+                (SELECT id FROM model.entity WHERE name = 'Person 1000');
+            """)
+        params['group_id'], params['person_id'] = self.cursor.fetchone()
+        for name, sql in QUERIES.items():
+            self.cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = self.cursor.fetchone()[0][0]['Plan']
+            assert not get_sequential_scans(plan), name
+
+
+def get_sequential_scans(plan: dict[str, Any]) -> list[str]:
+    scans = []
+    if plan['Node Type'] == 'Seq Scan':
+        scans.append(plan['Relation Name'])
+    for sub_plan in plan.get('Plans', []):
+        scans += get_sequential_scans(sub_plan)
+    return scans
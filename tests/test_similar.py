@@ -0,0 +1,55 @@
+from typing import Any
+
+from fuzzywuzzy import fuzz
+
+from openatlas import app
+from openatlas.models.entity import Entity
+from tests.base import TestBaseCase, insert
+
+NAMES = [
+    'A', 'a', 'Ab', 'Ba', 'abc', 'abd', 'aaaa', 'aaab', 'Sam', 'Sûza', 'Suza',
+    'Süza', 'Sûzá', 'Müller', 'Muller', 'Mueller', 'Möller', 'Frodo',
+    'Frodo Baggins', 'Frodo Beutlin', 'Bilbo Baggins', 'Baggins', 'Gandalf',
+    'Gandalf the Grey', 'Gandalf the White', 'Shire', 'The Shire', 'Shire',
+    'Mordor', 'Śmigol', 'Smeagol', 'Sméagol']
+
+
+class SimilarTests(TestBaseCase):
+
+    def test_similar(self) -> None:
+        with app.app_context():
+            with app.test_request_context():
+                app.preprocess_request()
+                for name in NAMES:
+                    insert('person', name)
+                entities = sorted(
+                    Entity.get_by_class('person'),
+                    key=lambda e: e.id)
+                for ratio in [0, 1, 50, 75, 86, 90, 95, 100]:
+                    assert get_ids(Entity.get_similar_named(
+                        'person',
+                        ratio)) == get_ids(get_similar_named(entities, ratio))
+
+
+def get_ids(similar: dict[int, Any]) -> dict[int, list[int]]:
+    return {
+        id_: [entity.id for entity in data['entities']]
+        for id_, data in similar.items()}
+
+
+def get_similar_named(entities: list[Entity], ratio: int) -> dict[int, Any]:
+    # Former implementation comparing every name with every other
+    similar: dict[int, Any] = {}
+    already_added: set[int] = set()
+    for sample in entities:
+        if sample.id in already_added:
+            continue
+        similar[sample.id] = {'entity': sample, 'entities': []}
+        for entity in entities:
+            if entity.id != sample.id \
+                    and fuzz.ratio(sample.name, entity.name) >= ratio:
+                already_added.add(sample.id)
+                already_added.add(entity.id)
+                similar[sample.id]['entities'].append(entity)
+    return {
+        item: data for item, data in similar.items() if data['entities']}
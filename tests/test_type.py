@@ -20,6 +20,11 @@ class TypeTest(TestBaseCase):
                 location = place.get_linked_entity_safe('P53')
                 location.link('P89', g.types[historical_type.subs[0]])
 
+            with app.test_request_context():
+                app.preprocess_request()
+                assert g.types[dimension_type.subs[0]].count == 1
+                assert historical_type.count_subs >= 1
+
             rv: Any = self.app.get(
                 url_for('view', id_=historical_type.subs[0]))
             assert b'Historical place' in rv.data
@@ -0,0 +1,8 @@
+# Worker for background jobs like IIIF conversion and image resizing, see
+# install.md. To use it, execute from project root:
+# python3 worker.py
+
+from openatlas.models.job import work
+
+if __name__ == "__main__":
+    work()